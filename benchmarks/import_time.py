@@ -0,0 +1,68 @@
+# coding=utf-8
+# author=UlionTse
+
+"""
+Import-time benchmark of translators, run from the root of the repository:
+
+    python benchmarks/import_time.py --repeat 20
+
+Every sample is measured in a fresh interpreter. Scenario `eager` imports the heavy dependencies together with
+translators, which is what `import translators` did before they became lazy, so `eager - lazy` is the saving.
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+
+HEAVY_MODULES = (
+    'tqdm', 'httpx', 'exejs', 'niquests', 'cloudscraper', 'lxml.etree',
+    'cryptography.hazmat.primitives.ciphers',
+    'cryptography.hazmat.primitives.padding',
+    'cryptography.hazmat.primitives.hashes',
+    'cryptography.hazmat.primitives.serialization',
+    'cryptography.hazmat.primitives.asymmetric.padding',
+)
+
+SCENARIOS = {
+    'lazy': 'import translators',
+    'cli': 'import translators.cli',
+    'eager': '; '.join(['import translators'] + [f'import {module}' for module in HEAVY_MODULES]),
+}
+
+
+def measure(code: str, repeat: int) -> list:
+    timer_code = f'import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)'
+    env = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}
+    return [
+        float(subprocess.run([sys.executable, '-c', timer_code], env=env, check=True, capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    ]
+
+
+def loaded_heavy_modules() -> list:
+    code = f'import sys, translators; print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.strip()
+    return output.split(',') if output else []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Import-time benchmark of translators.')
+    parser.add_argument('--repeat', action='store', default=10, type=int, dest='repeat', help='samples per scenario, default `10`.')
+    args = parser.parse_args()
+
+    _ = measure('import translators', 1)  # warm the file system cache.
+    result = {name: measure(code, args.repeat) for name, code in SCENARIOS.items()}
+
+    print(f'Python {sys.version.split()[0]}, {args.repeat} samples per scenario.')
+    for name, samples in result.items():
+        print(f'{name:>6}: median {statistics.median(samples) * 1e3:8.1f} ms, min {min(samples) * 1e3:8.1f} ms')
+    saving = statistics.median(result['eager']) - statistics.median(result['lazy'])
+    print(f'saving: median {saving * 1e3:8.1f} ms')
+    print(f'heavy modules loaded by `import translators`: {loaded_heavy_modules() or None}')
+
+
+if __name__ == '__main__':
+    main()
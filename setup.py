@@ -67,7 +67,6 @@ setuptools.setup(
         'exejs>=0.0.4',
         'lxml>=5.4.0',
         'tqdm>=4.67.1',
-        'pathos>=0.3.4',
         'cloudscraper>=1.2.71',
         'cryptography>=42.0.4',
     ],
@@ -0,0 +1,100 @@
+# coding=utf-8
+# author=UlionTse
+
+import asyncio
+import threading
+import urllib.parse
+import concurrent.futures
+
+import httpx
+import pytest
+
+import translators.server as server
+
+
+BING_HOST_HTML = '''
+<html><body>
+<select id="tta_srcsl"><option value="auto-detect"></option><option value="en"></option><option value="zh-Hans"></option></select>
+<div id="tta_outGDCont" data-iid="translator.5028"></div>
+<script>_G={IG:"IG0"}; var params_AbusePreventionHelper = [1, "token", 3600000];</script>
+</body></html>
+'''
+
+
+@pytest.fixture
+def bing(monkeypatch, tmp_path):
+    requests, clients = [], []
+
+    def handler(request):
+        requests.append(request.method)
+        if request.method == 'GET':
+            return httpx.Response(200, text=BING_HOST_HTML)
+        text = urllib.parse.parse_qs(request.content.decode())['text'][0]
+        return httpx.Response(200, json=[{'translations': [{'text': f'T:{text}'}]}])
+
+    def get_async_client_session(proxies=None, max_connections=100):
+        clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True))
+        return clients[-1]
+
+    monkeypatch.setenv('translators_cache_dir', str(tmp_path))
+    monkeypatch.setattr(server.Tse, 'get_async_client_session', staticmethod(get_async_client_session))
+    monkeypatch.setattr(server.Bing, 'get_tk_params', lambda self, host_html: [1, 'token', 3600000])
+    tss = server.TranslatorsServer()
+    tss.server_region = 'EN'
+    return tss, requests, clients
+
+
+def test_native_async_twin_bootstraps_once(bing):
+    tss, requests, clients = bing
+
+    async def main():
+        texts = [f'text {i}' for i in range(10)]
+        results = await asyncio.gather(*[tss.translate_text_async(text, translator='bing', from_language='en', to_language='zh') for text in texts])
+        assert results == [f'T:{text}' for text in texts]
+        await tss.close_async_sessions()
+
+    asyncio.run(main())
+    assert requests.count('GET') == 1
+    assert requests.count('POST') == 10
+    assert len(clients) == 1 and clients[0].is_closed
+    assert tss._bing_async.session is None
+
+
+def test_aclose_closes_renewed_sessions(bing):
+    tss, requests, clients = bing
+
+    async def main():
+        translator = tss._bing_async
+        assert await translator.bing_api_async('hello', 'en', 'zh') == 'T:hello'
+        translator.begin_time = 0  # the next call renews the session, the old one is closed after a delay.
+        assert await translator.bing_api_async('hello', 'en', 'zh', update_session_after_seconds=1) == 'T:hello'
+        assert len(clients) == 2 and not clients[0].is_closed
+        assert translator.async_close_tasks
+
+        await translator.aclose()
+        assert all(client.is_closed for client in clients)
+        assert not translator.async_close_tasks
+        assert translator.session is None
+
+    asyncio.run(main())
+
+
+def test_executor_fallback_for_blocking_translators(monkeypatch):
+    calls = []
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        calls.append((threading.current_thread().name, kwargs))
+        return f'T:{query_text}'
+
+    monkeypatch.setattr(server.AlibabaV2, 'alibaba_api', fake_api)
+    tss = server.TranslatorsServer()
+
+    async def main():
+        assert await tss.translate_text_async('hello', translator='alibaba') == 'T:hello'
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='custom') as executor:
+            assert await tss.alibaba_async('hello', async_executor=executor) == 'T:hello'
+
+    asyncio.run(main())
+    assert calls[0][0] != threading.main_thread().name
+    assert calls[1][0].startswith('custom')
+    assert all('async_executor' not in kwargs for _, kwargs in calls)
@@ -0,0 +1,53 @@
+# coding=utf-8
+# author=UlionTse
+
+import pytest
+import requests
+
+import translators.server as server
+
+
+class FailingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        raise requests.ConnectionError('connection refused')
+
+    post = get
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    session = FailingSession()
+    monkeypatch.setattr(server.Tse, 'get_client_session', staticmethod(lambda http_client='requests', proxies=None: session))
+    monkeypatch.setenv('translators_cache_dir', str(tmp_path))
+    return session
+
+
+def test_wrapped_network_error_opens_circuit(session):
+    tss = server.TranslatorsServer()
+    tss.set_circuit_breaker(failure_threshold=2, cooldown_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(server.TranslatorError) as e:
+            tss.translate_text('hello', translator='baidu')
+        assert isinstance(e.value.__cause__, requests.ConnectionError)
+
+    calls = session.calls
+    with pytest.raises(server.CircuitOpenError):
+        tss.translate_text('hello', translator='baidu')
+    assert session.calls == calls
+    assert tss.get_circuit_breaker_stat()['baidu']['state'] == 'open'
+
+
+def test_input_error_does_not_open_circuit(session):
+    tss = server.TranslatorsServer()
+    tss.set_circuit_breaker(failure_threshold=1, cooldown_seconds=60)
+
+    for _ in range(3):
+        with pytest.raises(server.TranslatorInputError):
+            tss.translate_text('x' * 30000, translator='baidu')
+    assert tss.get_circuit_breaker_stat()['baidu']['state'] == 'closed'
+    assert session.calls == 0
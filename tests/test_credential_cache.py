@@ -0,0 +1,124 @@
+# coding=utf-8
+# author=UlionTse
+
+import os
+import time
+import itertools
+
+import pytest
+import requests
+
+import translators.server as server
+
+
+class FakeTranslator(server.Tse):
+    tokens = itertools.count()
+
+    def __init__(self, error=None):
+        super().__init__()
+        self.session = None
+        self.query_count = 0
+        self.token = None
+        self.credential_attributes = ('token',)
+        self.error = error
+
+    @server.Tse.cache_credential
+    def fake_api(self, query_text, **kwargs):
+        if self.session is None:
+            self.begin_time = time.time()
+            self.session = requests.Session()
+            self.token = f'token{next(self.tokens)}'
+        if self.error is not None:
+            raise self.error
+        return query_text
+
+
+def get_http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f'{status_code} Client Error', response=response)
+
+
+@pytest.fixture
+def cache_path(monkeypatch, tmp_path):
+    monkeypatch.setenv('translators_cache_dir', str(tmp_path))
+    FakeTranslator().fake_api('x')
+    cache_path = FakeTranslator().get_credential_cache_path()
+    assert os.path.exists(cache_path)
+    return cache_path
+
+
+def test_restored_credential_is_reused(cache_path):
+    translator = FakeTranslator()
+    token = server.Tse.load_json_cache(cache_path)['attributes']['token']
+    assert translator.fake_api('x') == 'x'
+    assert translator.token == token
+    assert translator.session is translator.credential_session
+
+
+@pytest.mark.parametrize('error', [
+    server.TranslatorInputError('The length of `query_text` exceeds the limit.'),
+    server.TranslatorInputError('Unsupported to_language[xx] in [].'),
+    get_http_error(500),
+])
+def test_caller_error_keeps_credential(cache_path, error):
+    translator = FakeTranslator(error)
+    with pytest.raises(type(error)):
+        translator.fake_api('x')
+    assert os.path.exists(cache_path)
+    assert translator.session is not None
+
+
+@pytest.mark.parametrize('error', [
+    requests.ConnectionError('connection reset'),
+    get_http_error(401),
+    get_http_error(403),
+])
+def test_credential_error_drops_credential(cache_path, error):
+    translator = FakeTranslator(error)
+    with pytest.raises(type(error)):
+        translator.fake_api('x')
+    assert not os.path.exists(cache_path)
+    assert translator.session is None
+
+
+def test_caller_error_after_dump_keeps_credential(cache_path):
+    os.remove(cache_path)
+    translator = FakeTranslator()
+    translator.fake_api('x')
+    assert os.path.exists(cache_path)
+
+    session = translator.session
+    translator.error = server.TranslatorInputError('The length of `query_text` exceeds the limit.')
+    with pytest.raises(server.TranslatorInputError):
+        translator.fake_api('x' * 1001)
+    assert os.path.exists(cache_path)
+    assert translator.session is session
+
+
+class FakeServer:
+    def __init__(self, translator):
+        self.translator = translator
+        self.api_kwargs_dict = {'fake': {}}
+
+    def get_renewable_sessions(self):
+        def _swap(new_translator):
+            self.translator = new_translator
+        return [('fake', self.translator, _swap)]
+
+    def _test_translate(self, _ts, translator, **kwargs):
+        return translator.fake_api('x')
+
+
+def test_renewed_session_dumps_credential(cache_path):
+    translator = FakeTranslator()
+    translator.fake_api('x')
+    translator.begin_time = 0
+    fake_server = FakeServer(translator)
+    server.SessionRenewer(fake_server).renew_all(fake_server)
+
+    renewed_translator = fake_server.translator
+    assert renewed_translator is not translator
+    assert renewed_translator.if_use_credential_cache
+    assert renewed_translator.token != translator.token
+    assert server.Tse.load_json_cache(cache_path)['attributes']['token'] == renewed_translator.token
@@ -0,0 +1,67 @@
+# coding=utf-8
+# author=UlionTse
+
+import pytest
+
+import translators.server as server
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self):
+        self.methods = []
+
+    def post(self, url, params=None, json=None, headers=None, timeout=None):
+        self.methods.append(params['method'])
+        if params['method'] == 'LMT_split_text':
+            texts = json['params']['texts']
+            languages = {'DE' if text.startswith('der') else 'EN' for text in texts}
+            lang_data = {'detected': json['params']['lang'].get('lang_computed') or sorted(languages)[-1], 'isConfident': len(languages) == 1}
+            split_texts = [{'chunks': [{'sentences': [{'text': x}]} for x in text.split('. ') if x]} for text in texts]
+            return FakeResponse({'result': {'lang': lang_data, 'texts': split_texts}})
+
+        source_language = json['params']['lang']['source_lang_computed']
+        translations = [{'beams': [{'sentences': [{'text': f"{source_language}:{job['sentences'][0]['text']}"}]}]} for job in json['params']['jobs']]
+        return FakeResponse({'result': {'translations': translations}})
+
+
+@pytest.fixture
+def deepl():
+    deepl = server.Deepl()
+    deepl.update_session = lambda from_language, to_language, **kwargs: None
+    deepl.language_map = {'en': ['zh', 'de'], 'de': ['en', 'zh'], 'zh': ['en'], 'auto': ['en', 'zh', 'de']}
+    deepl.session = FakeSession()
+    return deepl
+
+
+def test_auto_batch_of_one_language_is_split_once(deepl):
+    result_list = deepl.deepl_batch_api(['hello. world', 'good morning', ''], 'auto', 'zh')
+
+    assert result_list == ['EN:hello EN:world', 'EN:good morning', '']
+    assert deepl.session.methods == ['LMT_split_text', 'LMT_handle_jobs']
+
+
+def test_auto_batch_of_mixed_languages_is_split_per_text(deepl):
+    result_list = deepl.deepl_batch_api(['hello. world', 'der hund', 'good morning'], 'auto', 'zh')
+
+    assert result_list == ['EN:hello EN:world', 'DE:der hund', 'EN:good morning']
+    assert deepl.session.methods.count('LMT_split_text') == 4
+    assert deepl.session.methods.count('LMT_handle_jobs') == 2
+
+
+def test_auto_batch_detects_language_per_text_on_demand(deepl):
+    result_list = deepl.deepl_batch_api(['hello', 'good morning'], 'auto', 'zh', if_detect_language_per_text=True)
+
+    assert result_list == ['EN:hello', 'EN:good morning']
+    assert deepl.session.methods.count('LMT_split_text') == 3
+    assert deepl.session.methods.count('LMT_handle_jobs') == 1
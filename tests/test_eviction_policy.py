@@ -0,0 +1,39 @@
+# coding=utf-8
+# author=UlionTse
+
+import pytest
+
+from translators.server import MemoryTranslationCache, TranslationCache
+
+
+def get_key(text: str) -> str:
+    return TranslationCache.get_cache_key('bing', 'en', 'zh', text)
+
+
+@pytest.mark.parametrize('eviction_policy', ['lfu', 'w_tinylfu'])
+def test_scan_of_large_one_off_entries_keeps_hot_keys(eviction_policy):
+    cache = MemoryTranslationCache(max_entries=10000, max_bytes=2 ** 20, eviction_policy=eviction_policy)
+    hot_keys = [get_key(f'hot text {i}') for i in range(2000)]
+    for key in hot_keys:
+        cache.set(key, 'x' * 300)
+    for _ in range(3):
+        for key in hot_keys:
+            assert cache.get(key) is not None
+
+    for i in range(3):
+        cache.set(get_key(f'one-off document {i}'), 'y' * 400 * 1024)
+
+    assert sum(cache.peek(key) is not None for key in hot_keys) == len(hot_keys)
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_w_tinylfu_admits_frequent_large_entry():
+    cache = MemoryTranslationCache(max_entries=10000, max_bytes=2 ** 20, eviction_policy='w_tinylfu')
+    for i in range(2000):
+        cache.set(get_key(f'cold text {i}'), 'x' * 100)
+
+    large_key = get_key('frequent document')
+    for _ in range(3):
+        cache.set(large_key, 'y' * 400 * 1024)
+    assert cache.peek(large_key) is not None
+    assert cache.total_bytes <= cache.max_bytes
@@ -0,0 +1,72 @@
+# coding=utf-8
+# author=UlionTse
+
+import json
+import urllib.parse
+
+import translators.server as server
+
+
+def get_frame(text, rpc_request_id='generic'):
+    data = json.dumps([None, [[[None, None, None, None, None, [[text]]]]]]) if text is not None else None
+    return ['wrb.fr', 'MkEWBc', data, None, None, None, rpc_request_id]
+
+
+def get_chunked_body(entries):
+    chunks = [json.dumps([entry], ensure_ascii=False) for entry in entries]
+    return ")]}'\n\n" + ''.join(f'{len(chunk)}\n{chunk}\n' for chunk in chunks)
+
+
+def test_get_rpc_frames_of_plain_envelope():
+    body = ")]}'\n\n" + json.dumps([get_frame('one', '1'), get_frame('two', '2'), ['di', 12], ['af.httprm', 11, 'x', 1]])
+    frames = server.GoogleV2.get_rpc_frames(body)
+
+    assert set(frames) == {'1', '2'}
+    assert server.GoogleV2.get_result(frames['1']) == 'one'
+    assert server.GoogleV2.get_result(frames['2']) == 'two'
+
+
+def test_get_rpc_frames_of_chunked_envelope():
+    body = get_chunked_body([get_frame('第一 [x]', '2'), get_frame(None, '1'), get_frame('generic text', None), ['di', 12]])
+    frames = server.GoogleV2.get_rpc_frames(body)
+
+    assert frames == {'2': frames['2'], '1': None, 'generic': frames['generic']}
+    assert server.GoogleV2.get_result(frames['2']) == '第一 [x]'
+    assert server.GoogleV2.get_result(frames['generic']) == 'generic text'
+
+
+def test_get_rpc_frames_without_prefix_or_frames():
+    assert server.GoogleV2.get_rpc_frames('') == {}
+    assert server.GoogleV2.get_rpc_frames(json.dumps([['di', 12]])) == {}
+    assert server.GoogleV2.get_result(server.GoogleV2.get_rpc_frames(json.dumps([get_frame('ok')]))['generic']) == 'ok'
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.rpc_counts = []
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        rpc_list = json.loads(urllib.parse.parse_qs(data)['f.req'][0])[0]
+        self.rpc_counts.append(len(rpc_list))
+        entries = [get_frame(json.loads(rpc[1])[0][0].upper(), rpc[3]) for rpc in rpc_list][::-1]
+        return FakeResponse(get_chunked_body(entries))
+
+
+def test_batch_results_follow_rpc_ids():
+    google = server.GoogleV2()
+    google.update_session = lambda from_language, to_language, **kwargs: None
+    google.language_map = {'en': ['zh-CN'], 'zh-CN': ['en'], 'auto': ['en', 'zh-CN']}
+    google.api_url, google.api_headers = 'https://translate.google.com/batchexecute', {}
+    google.session = FakeSession()
+
+    result_list = google.google_batch_api(['one', '', 'two', 'three'], 'en', 'zh-CN', batch_max_segments=2)
+    assert result_list == ['ONE', '', 'TWO', 'THREE']
+    assert google.session.rpc_counts == [2, 1]
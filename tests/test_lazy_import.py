@@ -0,0 +1,33 @@
+# coding=utf-8
+# author=UlionTse
+
+import sys
+import subprocess
+
+import translators.server as server
+
+
+def test_star_import_keeps_translators_lazy():
+    code = '\n'.join([
+        'from translators.server import *',
+        'import translators.server as server',
+        'assert server.tss._translators_dict.loaded_items() == []',
+        'assert server.tss._server_region is None',
+        'assert all(name in globals() for name in server.__all__)',
+        'assert _bing is server._bing',
+    ])
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_translator_follows_current_instance():
+    tss = server.TranslatorsServer()
+    lazy_translator = server.LazyTranslator(tss._translators_dict, 'alibaba')
+    assert tss._translators_dict.loaded_items() == []
+
+    assert lazy_translator.input_limit == tss._alibaba.input_limit
+    lazy_translator.input_limit = 7
+    assert tss._alibaba.input_limit == 7
+
+    tss._translators_dict['alibaba'] = tss._alibaba.clone()
+    tss._alibaba.input_limit = 8
+    assert lazy_translator.input_limit == 8
@@ -0,0 +1,114 @@
+# coding=utf-8
+# author=UlionTse
+
+import os
+import time
+import multiprocessing
+
+import pytest
+
+import translators.server as server
+
+pytest.importorskip('fcntl')
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'cache.mmap')
+
+
+def test_set_get_delete(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=100, arena_bytes=10000) as cache:
+        cache.set('key', 'value')
+        cache.set('detail', {'data': [1, 2]})
+        assert cache.get('key') == 'value'
+        assert cache.get('detail') == {'data': [1, 2]}
+        assert cache.get('missing') is None
+
+        cache.set('key', 'new value')
+        assert cache.get('key') == 'new value'
+        cache.delete('key')
+        assert cache.get('key') is None
+        assert len(cache) == 1
+
+    with pytest.raises(server.TranslatorError):
+        cache.get('detail')
+
+
+def test_expired_entry_is_a_miss(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=100, arena_bytes=10000, ttl_seconds=10) as cache:
+        cache.set('old', 'value', created_time=time.time() - 100)
+        cache.set('new', 'value')
+        assert cache.get('old') is None
+        assert cache.get('new') == 'value'
+
+
+def test_arena_eviction_drops_oldest_entries(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=10000, arena_bytes=100000) as cache:
+        for i in range(3000):
+            cache.set(f'key {i}', 'v' * 50)
+            assert cache.peek(f'key {i}') == 'v' * 50
+
+        alive = [i for i in range(3000) if cache.peek(f'key {i}') is not None]
+        assert alive == list(range(alive[0], 3000))
+        assert 0 < alive[0] and len(alive) > 1000
+        assert cache.stat()['eviction'] == alive[0]
+
+
+def test_table_eviction_drops_oldest_entries(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=100, arena_bytes=10 ** 6) as cache:
+        for i in range(1000):
+            cache.set(f'key {i}', 'x')
+
+        alive = [i for i in range(1000) if cache.peek(f'key {i}') is not None]
+        assert alive == list(range(alive[0], 1000))
+        assert 50 < len(alive) <= 100
+        assert cache.stat()['entries'] == len(list(cache.items())) == len(alive)
+
+
+def test_reopen_keeps_entries_and_rejects_foreign_file(cache_path, tmp_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=100, arena_bytes=10000) as cache:
+        cache.set('key', 'value')
+    with server.SharedMemoryTranslationCache(cache_path=cache_path) as cache:
+        assert cache.get('key') == 'value'
+
+    with open(cache_path, 'r+b') as f:
+        f.truncate(1000)
+    with server.SharedMemoryTranslationCache(cache_path=cache_path) as cache:
+        assert len(cache) == 0
+        assert os.path.getsize(cache_path) == cache.file_size
+
+    foreign_path = tmp_path / 'foreign'
+    foreign_path.write_bytes(b'hello world' * 100)
+    with pytest.raises(server.TranslatorError):
+        server.SharedMemoryTranslationCache(cache_path=str(foreign_path))
+    assert foreign_path.read_bytes() == b'hello world' * 100
+
+
+def set_in_child(cache, n):
+    for i in range(500):
+        cache.set(f'child {n} {i}', f'value {n} {i}')
+        assert cache.get(f'child {n} {i}') == f'value {n} {i}'
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_entries_are_shared_with_forked_processes(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=10000, arena_bytes=2 ** 20) as cache:
+        cache.set('parent', 'value')
+        processes = [multiprocessing.get_context('fork').Process(target=set_in_child, args=(cache, n)) for n in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert [process.exitcode for process in processes] == [0] * 4
+        assert all(cache.get(f'child {n} {i}') == f'value {n} {i}' for n in range(4) for i in range(500))
+        assert len(cache) == 1 + 4 * 500
+
+
+def test_oversized_value_replaces_former_value(cache_path):
+    with server.SharedMemoryTranslationCache(cache_path=cache_path, max_entries=100, arena_bytes=1000) as cache:
+        cache.set('key', 'old value')
+        cache.set('key', 'x' * 2000)
+        assert cache.get('key') is None
+        assert len(cache) == 0
@@ -0,0 +1,131 @@
+# coding=utf-8
+# author=UlionTse
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+import translators.server as server
+
+
+def wait_until(condition, timeout=5.0):
+    end_time = time.time() + timeout
+    while not condition():
+        assert time.time() < end_time
+        time.sleep(0.001)
+
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_identical_calls_run_once():
+    single_flight = server.SingleFlight()
+    release, calls, results = threading.Event(), [], []
+
+    def func():
+        calls.append(1)
+        release.wait()
+        return {'data': 'result'}
+
+    threads = run_threads([lambda: results.append(single_flight.do('key', func))] * 5)
+    wait_until(lambda: single_flight.stat()['shared'] == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'data': 'result'}] * 5
+    assert len({id(result) for result in results}) == 5  # a dict result is copied for each follower.
+    assert single_flight.stat() == {'in_flight': 0, 'call': 1, 'shared': 4, 'handover': 0}
+
+
+def test_exception_is_shared():
+    single_flight = server.SingleFlight()
+    release, errors = threading.Event(), []
+
+    def func():
+        release.wait()
+        raise server.TranslatorError('failed')
+
+    def call():
+        try:
+            single_flight.do('key', func)
+        except server.TranslatorError as e:
+            errors.append(str(e))
+
+    threads = run_threads([call] * 3)
+    wait_until(lambda: single_flight.stat()['shared'] == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == ['failed'] * 3
+    assert single_flight.stat()['call'] == 1
+
+
+def test_follower_takes_over_an_interrupted_leader():
+    single_flight = server.SingleFlight()
+    release, results = threading.Event(), []
+
+    def interrupted_func():
+        release.wait()
+        raise KeyboardInterrupt
+
+    def leader():
+        with pytest.raises(KeyboardInterrupt):
+            single_flight.do('key', interrupted_func)
+
+    threads = run_threads([leader])
+    wait_until(lambda: single_flight.stat()['in_flight'] == 1)
+    threads += run_threads([lambda: results.append(single_flight.do('key', lambda: 'result'))])
+    wait_until(lambda: single_flight.stat()['shared'] == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['result']
+    assert single_flight.stat() == {'in_flight': 0, 'call': 2, 'shared': 0, 'handover': 1}
+
+
+def test_async_identical_calls_run_once():
+    single_flight = server.SingleFlight()
+    calls = []
+
+    async def coro_func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def main():
+        return await asyncio.gather(*[single_flight.do_async('key', coro_func) for _ in range(5)])
+
+    assert asyncio.run(main()) == ['result'] * 5
+    assert len(calls) == 1
+    assert single_flight.stat() == {'in_flight': 0, 'call': 1, 'shared': 4, 'handover': 0}
+
+
+def test_async_follower_takes_over_a_cancelled_leader():
+    single_flight = server.SingleFlight()
+
+    async def coro_func():
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def main():
+        leader = asyncio.ensure_future(single_flight.do_async('key', coro_func))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do_async('key', coro_func))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == 'result'
+    assert single_flight.stat() == {'in_flight': 0, 'call': 2, 'shared': 0, 'handover': 1}
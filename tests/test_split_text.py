@@ -0,0 +1,55 @@
+# coding=utf-8
+# author=UlionTse
+
+import random
+
+import pytest
+
+import translators.server as server
+
+
+def get_random_text(seed, n_pieces=300):
+    pieces = [
+        'Hello world.', 'It costs 3.14 dollars!', 'Really?', '"Quoted."', 'a,b,c,', 'no punctuation here at all',
+        '你好。', '欢迎你！', '真的吗？', '（括号。）', '逗号，顿号、冒号：', '一二三四五六七八九十' * 5,
+        'x' * 120, '\n', '\n\n', ' ', '\t', '  ',
+    ]
+    rng = random.Random(seed)
+    return ''.join(rng.choice(pieces) + rng.choice(['', ' ', '  ', '\n']) for _ in range(n_pieces))
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('chunk_size', [10, 50, 200])
+def test_split_text_round_trip(seed, chunk_size):
+    text = get_random_text(seed)
+    chunks = server.TranslatorsServer.split_text(text, chunk_size)
+
+    assert ''.join(f'{chunk}{sep}' for chunk, sep in chunks) == text.strip()
+    assert all(0 < len(chunk) <= chunk_size and chunk == chunk.strip() for chunk, _ in chunks)
+    assert all(not sep.strip() for _, sep in chunks)
+
+
+def test_split_text_keeps_sentences_together():
+    text = 'First sentence. Second sentence.\n\n第三句。第四句！'
+    assert server.TranslatorsServer.split_text(text, 20) == [
+        ('First sentence.', ' '), ('Second sentence.', '\n\n'), ('第三句。第四句！', ''),
+    ]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_long_text_is_translated_by_chunks(monkeypatch, seed):
+    calls = []
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        calls.append(query_text)
+        return query_text
+
+    monkeypatch.setattr(server.AlibabaV2, 'alibaba_api', fake_api)
+    tss = server.TranslatorsServer()
+    texts = [get_random_text(seed), get_random_text(seed + 100)]
+    kwargs = {'if_split_long_text': True, 'split_max_concurrency': 2, 'limit_of_length': 211}
+
+    assert tss.translate_text(texts[0], translator='alibaba', **kwargs) == texts[0].strip()
+    data = tss.translate_batch(texts, translator='alibaba', max_concurrency=2, **kwargs)['data']
+    assert [item['result'] for item in data] == [text.strip() for text in texts]
+    assert all(len(query_text) <= 200 for query_text in calls)
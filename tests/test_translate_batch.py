@@ -0,0 +1,137 @@
+# coding=utf-8
+# author=UlionTse
+
+import pytest
+
+import translators.server as server
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        calls.append(query_text)
+        return '\n'.join(f'T:{line}' for line in query_text.split('\n'))
+
+    monkeypatch.setattr(server.AlibabaV2, 'alibaba_api', fake_api)
+    return calls
+
+
+class CountingCache(server.MemoryTranslationCache):
+    def __init__(self):
+        super().__init__()
+        self.get_keys = []
+
+    def get(self, key):
+        self.get_keys.append(key)
+        return super().get(key)
+
+
+def test_packed_batch_serves_translation_memory(calls):
+    tss = server.TranslatorsServer()
+    memory = server.TranslationMemory()
+    memory.add('alibaba', 'auto', 'en', 'remembered text', 'from memory')
+    tss.set_translation_memory(memory)
+
+    texts = ['remembered text', 'new text 1', 'new text 2']
+    data = tss.translate_batch(texts, translator='alibaba', if_pack_segments=True)['data']
+
+    assert data[0]['result'] == 'from memory'
+    assert data[0]['memory_match']['match_type'] == 'exact'
+    assert [item['result'] for item in data[1:]] == ['T:new text 1', 'T:new text 2']
+    assert all(item['memory_match'] is None for item in data[1:])
+    assert calls == ['new text 1\nnew text 2']
+    assert memory.lookup('alibaba', 'auto', 'en', 'new text 1')['result'] == 'T:new text 1'
+
+
+def test_packed_batch_looks_up_cache_once_per_text(calls):
+    tss = server.TranslatorsServer()
+    cache = CountingCache()
+    tss.set_translation_cache(cache)
+
+    texts = ['short 1', 'short 2', 'multi\nline']
+    data = tss.translate_batch(texts, translator='alibaba', if_pack_segments=True)['data']
+
+    assert [item['result'] for item in data] == ['T:short 1', 'T:short 2', 'T:multi\nT:line']
+    assert len(cache.get_keys) == len(set(cache.get_keys)) == len(texts)
+    assert sorted(calls) == ['multi\nline', 'short 1\nshort 2']
+
+    calls.clear()
+    data = tss.translate_batch(texts, translator='alibaba', if_pack_segments=True)['data']
+    assert [item['result'] for item in data] == ['T:short 1', 'T:short 2', 'T:multi\nT:line']
+    assert calls == []
+
+
+def test_pack_segments_respects_limits():
+    texts = [f'text {i}' for i in range(1000)]
+    packs = server.TranslatorsServer.pack_segments(texts, chunk_size=100, separator='\n', max_segments=5)
+
+    assert sorted(text for pack in packs for text in pack) == sorted(texts)
+    assert all(len(pack) <= 5 and len('\n'.join(pack)) <= 100 for pack in packs)
+
+
+@pytest.mark.parametrize('transform', [
+    lambda lines: [' '.join(lines)],
+    lambda lines: lines[1:] + lines[:1],
+])
+def test_misaligned_pack_falls_back_text_by_text(monkeypatch, transform):
+    calls = []
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        calls.append(query_text)
+        return '\n'.join(transform([f'T:{line}' for line in query_text.split('\n')]))
+
+    monkeypatch.setattr(server.AlibabaV2, 'alibaba_api', fake_api)
+    tss = server.TranslatorsServer()
+    texts = ['ok', 'chapter 12 has a considerably longer sentence', 'item 345']
+    result = tss.translate_batch(texts, translator='alibaba', if_pack_segments=True)
+
+    assert [item['result'] for item in result['data']] == [f'T:{text}' for text in texts]
+    assert result['stat']['pack_fallbacks'] == 1
+    assert sorted(calls[1:]) == sorted(texts)
+
+
+def test_check_pack_alignment():
+    pack = ['ok', 'chapter 12 has a considerably longer sentence', 'item 345']
+    assert server.TranslatorsServer.check_pack_alignment(pack, ['好', '第12章有一个长得多的句子', '项目345'])
+    assert server.TranslatorsServer.check_pack_alignment(pack, ['好', '第十二章有一个长得多的句子', '项目三百四十五'])
+    assert not server.TranslatorsServer.check_pack_alignment(pack, ['好', '第12章有一个长得多的句子'])
+    assert not server.TranslatorsServer.check_pack_alignment(pack, ['好', '', '项目345'])
+    assert not server.TranslatorsServer.check_pack_alignment(pack, ['好', '项目345', '第12章有一个长得多的句子'])
+
+
+def test_translator_losing_line_breaks_is_not_packed(monkeypatch):
+    calls = []
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        calls.append(query_text)
+        return ' '.join(f'T:{line}' for line in query_text.split('\n'))
+
+    monkeypatch.setattr(server.Deepl, 'deepl_api', fake_api)
+    tss = server.TranslatorsServer()
+    texts = ['short 1', 'short 2']
+    with pytest.warns(UserWarning, match='does not keep line breaks'):
+        result = tss.translate_batch(texts, translator='deepl', if_pack_segments=True)
+
+    assert [item['result'] for item in result['data']] == ['T:short 1', 'T:short 2']
+    assert sorted(calls) == texts
+    assert 'packs' not in result['stat']
+
+
+def test_thread_mode_reuses_sessions_across_batches(monkeypatch):
+    translators = {}
+
+    def fake_api(self, query_text, from_language='auto', to_language='en', **kwargs):
+        translators[id(self)] = self
+        return f'T:{query_text}'
+
+    monkeypatch.setattr(server.AlibabaV2, 'alibaba_api', fake_api)
+    tss = server.TranslatorsServer()
+    tss.set_concurrency_mode('thread')
+    for i in range(5):
+        texts = [f'text {i} {j}' for j in range(20)]
+        data = tss.translate_batch(texts, translator='alibaba', max_concurrency=4)['data']
+        assert [item['result'] for item in data] == [f'T:{text}' for text in texts]
+
+    assert len(translators) <= 4
@@ -0,0 +1,39 @@
+# coding=utf-8
+# author=UlionTse
+
+import pytest
+
+import translators.server as server
+
+
+@pytest.mark.parametrize('eviction_policy', ['lru', 'lfu', 'w_tinylfu'])
+def test_oversized_value_replaces_former_value(eviction_policy):
+    cache = server.MemoryTranslationCache(max_bytes=1000, eviction_policy=eviction_policy)
+    cache.set('key', 'old value')
+    cache.set('key', 'x' * 2000)
+
+    assert cache.get('key') is None
+    assert len(cache) == 0
+    assert cache.stat()['bytes'] == 0
+
+
+@pytest.mark.parametrize('corrupt_value', [b'not zlib', server.zlib.compress(b'\xff\xfe'), server.zlib.compress(b'{"broken json')])
+def test_corrupt_sqlite_row_is_a_miss_and_deleted(tmp_path, corrupt_value):
+    cache = server.SqliteTranslationCache(cache_path=str(tmp_path / 'cache.sqlite3'))
+    cache.set('key', 'value')
+    cache.set('other', 'value')
+    with cache.get_connection() as conn:
+        conn.execute('UPDATE translation_cache SET value = ? WHERE key = ?', (corrupt_value, 'key'))
+
+    with pytest.warns(UserWarning, match='decode skipped'):
+        assert cache.get('key') is None
+    assert cache.stat()['miss'] == 1 and cache.stat()['hit'] == 0
+    assert len(cache) == 1
+    assert cache.get('other') == 'value'
+
+    with cache.get_connection() as conn:
+        conn.execute('INSERT INTO translation_cache (key, value, size, created_time, accessed_time) VALUES (?, ?, 1, 0, 0)', ('key', corrupt_value))
+    with pytest.warns(UserWarning, match='decode skipped'):
+        assert [key for key, _, _ in cache.items()] == ['other']
+        assert cache.peek('key') is None
+    assert len(cache) == 1
@@ -0,0 +1,71 @@
+# coding=utf-8
+# author=UlionTse
+
+import translators.server as server
+
+
+SCOPE = ('alibaba', 'en', 'zh')
+
+
+def test_exact_match_ignores_whitespace():
+    memory = server.TranslationMemory()
+    memory.add(*SCOPE, 'Hello   world', '你好世界')
+
+    match = memory.lookup(*SCOPE, ' Hello world\n')
+    assert match == {'query_text': 'Hello   world', 'result': '你好世界', 'similarity': 1.0, 'match_type': 'exact', 'if_served': True}
+    assert memory.lookup('alibaba', 'en', 'ja', 'Hello world') is None
+    assert memory.lookup(*SCOPE, 'Hello world', professional_field='law') is None
+
+
+def test_placeable_match_replaces_numbers_and_punctuation():
+    memory = server.TranslationMemory()
+    memory.add(*SCOPE, 'Chapter 3 has 25 pages.', '第3章有25页。')
+    memory.add('alibaba', 'en', 'fr', 'Chapter 3 has 25 pages.', 'Le chapitre 3 a 25 pages.')
+
+    match = memory.lookup(*SCOPE, 'Chapter 12 has 140 pages!')
+    assert match['match_type'] == 'placeable' and match['if_served']
+    assert match['result'] == '第12章有140页。'
+    assert memory.lookup('alibaba', 'en', 'fr', 'Chapter 12 has 140 pages!')['result'] == 'Le chapitre 12 a 140 pages!'
+    assert memory.lookup(*SCOPE, 'Chapter 12 has 140 pages and more.') is None
+
+
+def test_placeable_match_is_not_served_if_numbers_are_not_found():
+    memory = server.TranslationMemory()
+    memory.add(*SCOPE, 'Chapter 3 has 25 pages.', '第三章有二十五页。')
+
+    match = memory.lookup(*SCOPE, 'Chapter 12 has 140 pages.')
+    assert match is None or match['match_type'] == 'fuzzy'
+
+
+def test_fuzzy_match_is_a_candidate_unless_served():
+    text = 'The quick brown fox jumps over the lazy dog near the river bank.'
+    near_text = 'The quick brown fox jumped over the lazy dog near the river bank.'
+    for if_serve_fuzzy_match in (False, True):
+        memory = server.TranslationMemory(if_serve_fuzzy_match=if_serve_fuzzy_match)
+        memory.add(*SCOPE, text, '敏捷的棕色狐狸跳过了河岸边的懒狗。')
+
+        match = memory.lookup(*SCOPE, near_text)
+        assert match['match_type'] == 'fuzzy' and match['if_served'] is if_serve_fuzzy_match
+        assert match['query_text'] == text and 0.85 <= match['similarity'] < 1
+        assert memory.lookup(*SCOPE, 'Something completely different from every stored segment.') is None
+
+
+def test_case_only_difference_is_a_fuzzy_match():
+    memory = server.TranslationMemory()
+    memory.add(*SCOPE, 'Apple', '苹果公司')
+
+    match = memory.lookup(*SCOPE, 'apple')
+    assert match['match_type'] == 'fuzzy' and not match['if_served'] and match['similarity'] == 1.0
+
+
+def test_least_recently_used_entries_are_evicted():
+    memory = server.TranslationMemory(max_entries=2)
+    memory.add(*SCOPE, 'one', '一')
+    memory.add(*SCOPE, 'two', '二')
+    assert memory.lookup(*SCOPE, 'one')['result'] == '一'
+    memory.add(*SCOPE, 'three', '三')
+
+    assert len(memory) == 2
+    assert memory.lookup(*SCOPE, 'two') is None
+    assert memory.lookup(*SCOPE, 'one')['result'] == '一'
+    assert memory.stat()['exact'] == 2
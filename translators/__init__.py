@@ -4,7 +4,9 @@ __author__ = "UlionTse"
 
 from translators.server import (
     translate_text,
+    translate_text_async,
     translate_html,
+    translate_batch,
     translators_pool,
     get_languages,
     get_region_of_server,
@@ -16,7 +18,9 @@ __all__ = (
     "__version__",
     "__author__",
     "translate_text",
+    "translate_text_async",
     "translate_html",
+    "translate_batch",
     "translators_pool",
     "get_languages",
     "get_region_of_server",
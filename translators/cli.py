@@ -31,6 +31,7 @@ import platform
 import argparse
 
 from . import __version__, translate_text, translate_html
+from .server import set_translation_cache, SqliteTranslationCache
 
 
 def translate_cli() -> None:
@@ -74,6 +75,14 @@ def translate_cli() -> None:
         dest='is_html',
         help='is_html, default `0`.',
     )
+    parser.add_argument(
+        '--use_cache',
+        action='store',
+        default=0,
+        type=int,
+        dest='use_cache',
+        help='use_cache, default `0`. Cache results on disk, shared by all runs on the host.',
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -93,6 +102,9 @@ def translate_cli() -> None:
         query_text = args.input
 
     try:
+        if bool(args.use_cache):
+            set_translation_cache(SqliteTranslationCache())
+
         translate_fn = translate_html if bool(args.is_html) else translate_text
         result = translate_fn(
             query_text=query_text,
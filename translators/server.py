@@ -28,42 +28,75 @@ under certain conditions; type `show c' for details.
 import os
 import re
 import sys
+import copy
 import time
+import csv
 import json
+import mmap
 import uuid
+import weakref
+import asyncio
+import threading
+import contextlib
 import hmac
 import base64
 import random
+import zlib
+import struct
+import sqlite3
+import heapq
 import hashlib
 import datetime
+import difflib
 import warnings
 import functools
+import importlib
+import unicodedata
 import urllib.parse
-from typing import Optional, Union, Tuple, List
+import collections.abc
+import concurrent.futures
+from typing import Optional, Union, Tuple, List, Dict
 
-import tqdm
-import httpx
-import exejs
 import requests
-import niquests
-import cloudscraper
-import lxml.etree as lxml_etree
-import pathos.multiprocessing as pathos_multiprocessing
-import cryptography.hazmat.primitives.ciphers as cry_ciphers
-import cryptography.hazmat.primitives.padding as cry_padding
-import cryptography.hazmat.primitives.hashes as cry_hashes
-import cryptography.hazmat.primitives.serialization as cry_serialization
-import cryptography.hazmat.primitives.asymmetric.padding as cry_asym_padding
+
+
+class LazyModule:
+    def __init__(self, module_name: str):
+        """
+        Module imported on first attribute access, eg: cryptography is only imported by iciba() and niutrans(V1),
+        and cloudscraper only by `http_client='cloudscraper'`. `benchmarks/import_time.py` measures the saving.
+        """
+        self.module_name = module_name
+        self.module = None
+
+    def __getattr__(self, name: str):
+        if self.module is None:
+            self.module = importlib.import_module(self.module_name)
+        return getattr(self.module, name)
+
+
+tqdm = LazyModule('tqdm')
+httpx = LazyModule('httpx')
+exejs = LazyModule('exejs')
+niquests = LazyModule('niquests')
+cloudscraper = LazyModule('cloudscraper')
+lxml_etree = LazyModule('lxml.etree')
+cry_ciphers = LazyModule('cryptography.hazmat.primitives.ciphers')
+cry_padding = LazyModule('cryptography.hazmat.primitives.padding')
+cry_hashes = LazyModule('cryptography.hazmat.primitives.hashes')
+cry_serialization = LazyModule('cryptography.hazmat.primitives.serialization')
+cry_asym_padding = LazyModule('cryptography.hazmat.primitives.asymmetric.padding')
 
 
 LangMapKwargsType = Union[str, bool]
 ApiKwargsType = Union[str, int, float, bool, dict]
-SessionType = Union[requests.sessions.Session, niquests.sessions.Session, httpx.Client]
-ResponseType = Union[requests.models.Response, niquests.models.Response, httpx.Response]
+SessionType = Union[requests.sessions.Session, 'niquests.sessions.Session', 'httpx.Client']
+AsyncSessionType = 'httpx.AsyncClient'
+ResponseType = Union[requests.models.Response, 'niquests.models.Response', 'httpx.Response']
 
 
 __all__ = [
-    'translate_text', 'translate_html', 'translators_pool',
+    'translate_text', 'translate_html', 'translate_batch', 'translators_pool',
 
     'alibaba', 'apertium', 'argos', 'baidu', 'bing',
     'caiyun', 'cloudTranslation', 'deepl', 'elia', 'google',
@@ -82,6 +115,16 @@ __all__ = [
     '_qqTranSmart', '_reverso', '_sogou', '_sysTran', '_tilde',
     '_translateCom', '_translateMe', '_utibet', '_volcEngine', '_yandex',
     '_yeekit', '_youdao',
+
+    'translate_text_async',
+    'alibaba_async', 'apertium_async', 'argos_async', 'baidu_async', 'bing_async',
+    'caiyun_async', 'cloudTranslation_async', 'deepl_async', 'elia_async', 'google_async',
+    'hujiang_async', 'iciba_async', 'iflytek_async', 'iflyrec_async', 'itranslate_async',
+    'judic_async', 'languageWire_async', 'lingvanex_async', 'mglip_async', 'mirai_async',
+    'modernMt_async', 'myMemory_async', 'niutrans_async', 'papago_async', 'qqFanyi_async',
+    'qqTranSmart_async', 'reverso_async', 'sogou_async', 'sysTran_async', 'tilde_async',
+    'translateCom_async', 'translateMe_async', 'utibet_async', 'volcEngine_async', 'yandex_async',
+    'yeekit_async', 'youdao_async',
 ]  # 37
 
 
@@ -89,6 +132,15 @@ class TranslatorError(Exception):
     pass
 
 
+class TranslatorInputError(TranslatorError):
+    # errors of the caller (eg: unsupported language, empty or too long query_text), not of the translator service.
+    pass
+
+
+class CircuitOpenError(TranslatorError):
+    pass
+
+
 class Tse:
     def __init__(self):
         self.author = 'UlionTse'
@@ -98,9 +150,74 @@ class Tse:
         self.transform_en_translator_pool = ('itranslate', 'lingvanex', 'myMemory', 'apertium', 'cloudTranslation', 'translateMe')
         self.auto_pool = ('auto', 'detect', 'auto-detect', 'all')
         self.zh_pool = ('zh', 'zh-CN', 'zh-cn', 'zh-CHS', 'zh-Hans', 'zh-Hans_CN', 'cn', 'chi', 'Chinese')
+        self.async_loop = None
+        self.async_lock = None
+        self.async_close_tasks = set()
+        self.async_session_close_delay_seconds = 60.0  # requests still in flight on a renewed httpx.AsyncClient can finish.
+        self.bootstrap_lock = threading.RLock()  # one caller (re)bootstraps the session, the others wait and reuse it.
+        self.bootstrap_query_count = None  # `query_count` when the session was bootstrapped, it is not renewed again at once.
+        self.count_lock = threading.Lock()
+        self.language_map_cache_ttl_seconds = float(os.environ.get('translators_language_map_cache_ttl', None) or 7 * 86400)
+        self.credential_cache_ttl_seconds = float(os.environ.get('translators_credential_cache_ttl', None) or self.default_session_seconds)
+        self.credential_attributes = ()
+        self.credential_session = None  # session restored from disk by load_cached_credential().
+        self.if_use_credential_cache = True
+
+    def get_session_expire_time(self) -> Optional[float]:
+        """
+        Timestamp when the tokens of the current session expire, None if the translator does not expose it.
+        """
+        return None
+
+    def count_query(self) -> None:
+        # only successful queries are counted.
+        with self.count_lock:
+            self.query_count += 1
+
+    def clone(self) -> 'Tse':
+        """
+        Copy of the translator with its own mutable session state (session, tokens, headers, counters),
+        while read-only data like `language_map` is shared with the original one.
+        """
+        _clone = copy.copy(self)
+        for k, v in self.__dict__.items():
+            if k not in ('language_map',) and isinstance(v, (dict, list, set)):
+                setattr(_clone, k, copy.deepcopy(v))
+
+        _clone.session = None
+        _clone.query_count = 0
+        _clone.begin_time = time.time()
+        _clone.async_loop = None
+        _clone.async_lock = None
+        _clone.async_close_tasks = set()
+        _clone.bootstrap_lock = threading.RLock()
+        _clone.bootstrap_query_count = None
+        _clone.count_lock = threading.Lock()
+        _clone.credential_session = None
+        _clone.if_use_credential_cache = False  # a clone is meant to start a session of its own.
+        return _clone
 
     @staticmethod
     def time_stat(func):
+        def write_time_stat(t1: float, t2: float, sleep_seconds: float, show_time_stat_precision: int) -> None:
+            cost_time = round((t2 - t1 - sleep_seconds), show_time_stat_precision)
+            sys.stderr.write(f'TimeSpent(function: {func.__name__.replace("_async", "")[:-4]}): {cost_time}s\n')
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs):
+                if_show_time_stat = kwargs.get('if_show_time_stat', False)
+                show_time_stat_precision = kwargs.get('show_time_stat_precision', 2)
+                sleep_seconds = kwargs.get('sleep_seconds', 0)
+
+                if if_show_time_stat and sleep_seconds >= 0:
+                    t1 = time.time()
+                    result = await func(*args, **kwargs)
+                    write_time_stat(t1, time.time(), sleep_seconds, show_time_stat_precision)
+                    return result
+                return await func(*args, **kwargs)
+            return _async_wrapper
+
         @functools.wraps(func)
         def _wrapper(*args, **kwargs):
             if_show_time_stat = kwargs.get('if_show_time_stat', False)
@@ -110,9 +227,7 @@ class Tse:
             if if_show_time_stat and sleep_seconds >= 0:
                 t1 = time.time()
                 result = func(*args, **kwargs)
-                t2 = time.time()
-                cost_time = round((t2 - t1 - sleep_seconds), show_time_stat_precision)
-                sys.stderr.write(f'TimeSpent(function: {func.__name__[:-4]}): {cost_time}s\n')
+                write_time_stat(t1, time.time(), sleep_seconds, show_time_stat_precision)
                 return result
             return func(*args, **kwargs)
         return _wrapper
@@ -190,13 +305,13 @@ class Tse:
         to_language = output_zh if to_language in self.zh_pool else to_language
 
         if from_language != output_auto and from_language not in language_map:
-            raise TranslatorError('Unsupported from_language[{}] in {}.'.format(from_language, sorted(language_map.keys())))
+            raise TranslatorInputError('Unsupported from_language[{}] in {}.'.format(from_language, sorted(language_map.keys())))
         elif to_language not in language_map and if_check_lang_reverse:
-            raise TranslatorError('Unsupported to_language[{}] in {}.'.format(to_language, sorted(language_map.keys())))
+            raise TranslatorInputError('Unsupported to_language[{}] in {}.'.format(to_language, sorted(language_map.keys())))
         elif from_language != output_auto and to_language not in language_map[from_language]:
-            raise TranslatorError('Unsupported translation: from [{0}] to [{1}]!'.format(from_language, to_language))
+            raise TranslatorInputError('Unsupported translation: from [{0}] to [{1}]!'.format(from_language, to_language))
         elif from_language == to_language:
-            raise TranslatorError(f'from_language[{from_language}] and to_language[{to_language}] should not be same.')
+            raise TranslatorInputError(f'from_language[{from_language}] and to_language[{to_language}] should not be same.')
         return from_language, to_language
 
     @staticmethod
@@ -232,10 +347,17 @@ class Tse:
 
         @functools.wraps(func)
         def _wrapper(*args, **kwargs):
+            translator = args[0] if args and isinstance(args[0], Tse) else None
+            language_map = translator.load_cached_language_map() if translator else None
+            if language_map:
+                return language_map
+
             try:
                 language_map = func(*args, **kwargs)
                 if not language_map:
                     raise TranslatorError
+                if translator:
+                    translator.dump_cached_language_map(language_map)
                 return language_map
             except Exception as e:
                 if kwargs.get('if_print_warning', True):
@@ -243,33 +365,249 @@ class Tse:
                 return make_temp_language_map(kwargs.get('from_language'), kwargs.get('to_language'), kwargs.get('default_from_language'))
         return _wrapper
     
+    def get_cache_name(self, api_kwargs: Optional[dict] = None) -> str:
+        """
+        Name of the files cached on disk. Translators whose host depends on the region (eg: cn, en) keep one per host,
+        which is the host of a call with `api_kwargs` (`reset_host_url`, `if_use_cn_host`), or else the current one.
+        """
+        if not hasattr(self, 'server_region'):
+            return self.__class__.__name__
+
+        host_url = self.host_url if api_kwargs is None else api_kwargs.get('reset_host_url', None)
+        if not host_url:
+            api_kwargs = api_kwargs or {}
+            use_cn_condition = api_kwargs.get('if_use_cn_host', None) or self.server_region == 'CN'
+            host_url = self.cn_host_url if use_cn_condition else self.en_host_url
+        return f'{self.__class__.__name__}_{urllib.parse.urlparse(host_url).hostname}'
+
+    def get_language_map_cache_path(self) -> str:
+        return os.path.join(self.get_cache_dir(), 'language_map', f'{self.get_cache_name()}.json')
+
+    def load_cached_language_map(self, if_ignore_ttl: bool = False) -> Optional[dict]:
+        """
+        Language map saved on disk by a former bootstrap (of any process), so that it is not fetched or parsed again.
+        Valid for `self.language_map_cache_ttl_seconds`, 0 disables it.
+        """
+        if not self.language_map_cache_ttl_seconds and not if_ignore_ttl:
+            return None
+
+        data = self.load_json_cache(self.get_language_map_cache_path())
+        if not isinstance(data, dict) or not data.get('language_map'):
+            return None
+        if not if_ignore_ttl and time.time() - data.get('time', 0) >= self.language_map_cache_ttl_seconds:
+            return None
+        return data['language_map']
+
+    def dump_cached_language_map(self, language_map: dict) -> None:
+        if self.language_map_cache_ttl_seconds:
+            self.dump_json_cache(self.get_language_map_cache_path(), {'language_map': language_map, 'time': time.time()})
+
+    @staticmethod
+    def cache_credential(func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            translator = args[0]
+            cache_name = translator.get_cache_name(kwargs)
+            if translator.session is None and translator.if_use_credential_cache:
+                with translator.bootstrap_lock:
+                    if translator.session is None:
+                        translator.load_cached_credential(kwargs.get('http_client', None), kwargs.get('proxies', None), cache_name)
+
+            session = translator.session
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if session is not None and session is translator.credential_session and translator.is_credential_error(e, session):
+                    translator.drop_cached_credential(cache_name)
+                raise
+
+            if translator.session is not session and translator.if_use_credential_cache:
+                translator.dump_cached_credential(cache_name)
+            return result
+        return _wrapper
+
+    @staticmethod
+    def is_credential_error(error: BaseException, session: SessionType) -> bool:
+        """
+        Whether a restored session failed because of its connection or its credential (network error, http 401 or 403),
+        not because of the query of the caller (eg: unsupported language, too long query_text).
+        """
+        http_client = type(session).__module__.split('.')[0]
+        if http_client == 'httpx':
+            network_errors = (httpx.TransportError,)
+        elif http_client == 'niquests':
+            network_errors = (niquests.ConnectionError, niquests.Timeout)
+        else:
+            network_errors = (requests.ConnectionError, requests.Timeout)
+
+        while error is not None and not isinstance(error, TranslatorInputError):
+            if isinstance(error, network_errors) or getattr(getattr(error, 'response', None), 'status_code', None) in (401, 403):
+                return True
+            error = error.__cause__ or error.__context__
+        return False
+
+    def get_credential_cache_path(self, cache_name: Optional[str] = None) -> str:
+        return os.path.join(self.get_cache_dir(), 'credential', f'{cache_name or self.get_cache_name()}.json')
+
+    def get_credential_expire_time(self) -> float:
+        expire_time = self.begin_time + self.credential_cache_ttl_seconds
+        session_expire_time = self.get_session_expire_time()
+        return min(expire_time, session_expire_time) if session_expire_time else expire_time
+
+    @staticmethod
+    def get_session_cookies(session: SessionType) -> List[dict]:
+        cookie_jar = getattr(session.cookies, 'jar', session.cookies)  # httpx.Cookies wraps a CookieJar.
+        return [{
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path,
+            'expires': cookie.expires,
+        } for cookie in cookie_jar]
+
+    @staticmethod
+    def set_session_cookies(session: SessionType, cookies: List[dict]) -> None:
+        now = time.time()
+        for cookie in cookies:
+            if cookie['expires'] and cookie['expires'] <= now:
+                continue
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+
+    def dump_cached_credential(self, cache_name: Optional[str] = None) -> None:
+        """
+        Save the tokens and cookies of a freshly bootstrapped session, so that other processes (and later runs)
+        reuse them instead of bootstrapping again. Valid until the tokens expire or `self.credential_cache_ttl_seconds`.
+        """
+        if not (self.credential_attributes and self.credential_cache_ttl_seconds and self.session):
+            return
+
+        http_client = type(self.session).__module__.split('.')[0]
+        if http_client not in ('requests', 'niquests', 'httpx', 'cloudscraper'):
+            return
+
+        data = {
+            'http_client': http_client,
+            'begin_time': self.begin_time,
+            'expire_time': self.get_credential_expire_time(),
+            'attributes': {k: getattr(self, k) for k in self.credential_attributes},
+            'headers': dict(self.session.headers),
+            'cookies': self.get_session_cookies(self.session),
+        }
+        self.dump_json_cache(self.get_credential_cache_path(cache_name), data, file_mode=0o600)
+
+    def load_cached_credential(self, http_client: Optional[str] = None, proxies: Optional[dict] = None, cache_name: Optional[str] = None) -> bool:
+        """
+        Restore a session saved by `dump_cached_credential()` if it has not expired yet.
+        :return: bool, whether the bootstrap of the session can be skipped.
+        """
+        if not (self.credential_attributes and self.credential_cache_ttl_seconds):
+            return False
+
+        data = self.load_json_cache(self.get_credential_cache_path(cache_name))
+        if not isinstance(data, dict) or time.time() >= data.get('expire_time', 0):
+            return False
+        if http_client and http_client != data.get('http_client'):
+            return False
+
+        try:
+            session = self.get_client_session(data['http_client'], proxies)
+            session.headers.update(data['headers'])
+            self.set_session_cookies(session, data['cookies'])
+        except (KeyError, TypeError, TranslatorError):
+            return False
+
+        for k, v in data.get('attributes', {}).items():
+            if k in self.credential_attributes:
+                setattr(self, k, v)
+        self.begin_time = data['begin_time']
+        self.bootstrap_query_count = self.query_count  # so that it isn't bootstrapped again.
+        self.session = self.credential_session = session
+        return True
+
+    def drop_cached_credential(self, cache_name: Optional[str] = None) -> None:
+        """
+        Forget a restored session which failed, the next call bootstraps a new one.
+        """
+        try:
+            os.remove(self.get_credential_cache_path(cache_name))
+        except OSError:
+            pass
+        self.session = self.credential_session = None
+
     @staticmethod
     def check_input_limit(query_text: str, input_limit: int) -> None:
         if len(query_text) > input_limit:
-            raise TranslatorError
+            raise TranslatorInputError
+
+    @staticmethod
+    def get_query_batches(query_text_list: List[str], input_limit: int, max_segments: Optional[int] = None, separator_length: int = 1) -> List[List[int]]:
+        batches, batch, batch_length = [], [], 0
+        for i, query_text in enumerate(query_text_list):
+            Tse.check_input_limit(query_text, input_limit)
+            text_length = len(query_text) + (separator_length if batch else 0)
+            if batch and (batch_length + text_length > input_limit or (max_segments and len(batch) >= max_segments)):
+                batches.append(batch)
+                batch, batch_length, text_length = [], 0, len(query_text)
+            batch.append(i)
+            batch_length += text_length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def translate_query_batches(self, query_text_list: List[str], translate_batch: callable, **kwargs: ApiKwargsType) -> list:
+        """
+        Send texts in requests (batches) up to `self.input_limit` and `batch_max_segments` texts, by `translate_batch(texts)`
+        returning one result per text. A failed request does not discard the results of the others.
+        :return: list, one item per query text in order: the result, the exception that failed it, or '' ({'data': ''}
+                if is_detail_result) for an empty text. Raise the exception of the first request if no request succeeded.
+        """
+        is_detail_result = kwargs.get('is_detail_result', False)
+        batch_max_segments = kwargs.get('batch_max_segments', None)
+
+        result_list = [{'data': ''} if is_detail_result else ''] * len(query_text_list)
+        index_list = []
+        for i, query_text in enumerate(query_text_list):
+            if len(query_text) > self.input_limit:
+                result_list[i] = TranslatorInputError('The length of `query_text` exceeds the limit.')
+            elif query_text.strip():
+                index_list.append(i)
+
+        exceptions = []
+        batches = self.get_query_batches([query_text_list[i] for i in index_list], self.input_limit, batch_max_segments)
+        for batch in batches:
+            try:
+                batch_result_list = translate_batch([query_text_list[index_list[j]] for j in batch])
+            except Exception as e:
+                exceptions.append(e)
+                batch_result_list = [e] * len(batch)
+            for j, result in zip(batch, batch_result_list):
+                result_list[index_list[j]] = result
+
+        if exceptions and len(exceptions) == len(batches):
+            raise exceptions[0]
+        return result_list
 
     @staticmethod
     def check_query(func):
         def check_query_text(query_text: str, if_ignore_empty_query: bool, if_ignore_limit_of_length: bool, limit_of_length: int, bias_of_length: int = 10) -> str:
             if not isinstance(query_text, str):
-                raise TranslatorError
+                raise TranslatorInputError
 
             query_text = query_text.strip()
             qt_length = len(query_text)
             limit_of_length -= bias_of_length  # #154
 
             if qt_length == 0 and not if_ignore_empty_query:
-                raise TranslatorError("The `query_text` can't be empty!")
+                raise TranslatorInputError("The `query_text` can't be empty!")
             if qt_length >= limit_of_length and not if_ignore_limit_of_length:
-                raise TranslatorError('The length of `query_text` exceeds the limit.')
+                raise TranslatorInputError('The length of `query_text` exceeds the limit.')
             else:
                 if qt_length >= limit_of_length:
                     warnings.warn(f'The length of `query_text` is {qt_length}, above {limit_of_length}.')
                     return query_text[:limit_of_length]
             return query_text
 
-        @functools.wraps(func)
-        def _wrapper(*args, **kwargs):
+        def check_args(args: tuple, kwargs: dict) -> Tuple[bool, Union[str, dict], tuple, dict]:
             if_ignore_empty_query = kwargs.get('if_ignore_empty_query', True)
             if_ignore_limit_of_length = kwargs.get('if_ignore_limit_of_length', False)
             limit_of_length = kwargs.get('limit_of_length', 20000)
@@ -278,13 +616,29 @@ class Tse:
             query_text = list(args)[1] if len(args) >= 2 else kwargs.get('query_text')
             query_text = check_query_text(query_text, if_ignore_empty_query, if_ignore_limit_of_length, limit_of_length)
             if not query_text and if_ignore_empty_query:
-                return {'data': query_text} if is_detail_result else query_text
+                return True, ({'data': query_text} if is_detail_result else query_text), args, kwargs
 
             if len(args) >= 2:
                 new_args = list(args)
                 new_args[1] = query_text
-                return func(*tuple(new_args), **kwargs)
-            return func(*args, **{**kwargs, **{'query_text': query_text}})
+                return False, query_text, tuple(new_args), kwargs
+            return False, query_text, args, {**kwargs, **{'query_text': query_text}}
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs):
+                if_empty, empty_result, args, kwargs = check_args(args, kwargs)
+                if if_empty:
+                    return empty_result
+                return await func(*args, **kwargs)
+            return _async_wrapper
+
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if_empty, empty_result, args, kwargs = check_args(args, kwargs)
+            if if_empty:
+                return empty_result
+            return func(*args, **kwargs)
         return _wrapper
 
     @staticmethod
@@ -293,11 +647,13 @@ class Tse:
         def _wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except:
+            except TranslatorInputError:
+                raise
+            except Exception as e:
                 raise_tips1 = f'The function {func.__name__[:-4]}() has been not certified yet.'
                 raise_tips2_url = 'https://github.com/UlionTse/translators#supported-translation-services'
                 raise_tips2 = f'Please read for details: Status of Translator on this webpage({raise_tips2_url}).'
-                raise TranslatorError(f'{raise_tips1} {raise_tips2}')
+                raise TranslatorError(f'{raise_tips1} {raise_tips2}') from e
         return _wrapper
 
     # @staticmethod
@@ -310,6 +666,40 @@ class Tse:
     #             raise TranslatorError(e)
     #     return _wrapper
 
+    @staticmethod
+    def get_cache_dir() -> str:
+        cache_dir = os.environ.get('translators_cache_dir', None)
+        if not cache_dir:
+            cache_home = os.environ.get('XDG_CACHE_HOME', None) or os.path.join(os.path.expanduser('~'), '.cache')
+            cache_dir = os.path.join(cache_home, 'translators')
+        return cache_dir
+
+    @staticmethod
+    def load_json_cache(file_path: str) -> Optional[Union[dict, list]]:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def dump_json_cache(file_path: str, data: Union[dict, list], file_mode: Optional[int] = None) -> None:
+        """
+        Write atomically (temp file + rename), so that concurrent processes never read a half-written file.
+        Failures are ignored as a cache is optional.
+        """
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            temp_file_path = f'{file_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)  # left by a crash, `file_mode` only applies to a file created here.
+            fd = os.open(temp_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if file_mode is None else file_mode)
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(temp_file_path, file_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     @staticmethod
     def get_client_session(http_client: str = 'requests', proxies: Optional[dict] = None) -> SessionType:
         if http_client not in ('requests', 'niquests', 'httpx', 'cloudscraper'):
@@ -332,6 +722,73 @@ class Tse:
             session.proxies = proxies
         return session
 
+    @staticmethod
+    def get_async_client_session(proxies: Optional[dict] = None, max_connections: Optional[int] = 100) -> AsyncSessionType:
+        if proxies is None:
+            proxies = {}
+
+        proxy_url = proxies.get('http') or proxies.get('https')
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        return httpx.AsyncClient(follow_redirects=True, proxy=proxy_url, limits=limits)
+
+    def get_async_lock(self) -> asyncio.Lock:
+        """
+        Lock guarding the (re)bootstrap of an async session. Both the lock and `httpx.AsyncClient` are bound to
+        the running event loop, so a new loop (eg: another `asyncio.run()`) drops the session and starts over.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_loop is not loop:
+            if self.session is not None:
+                self.close_async_session_later(self.session, self.async_loop)
+            self.async_loop = loop
+            self.async_lock = asyncio.Lock()
+            self.session = None
+        return self.async_lock
+
+    @staticmethod
+    async def close_async_session(session: AsyncSessionType, delay_seconds: float = 0) -> None:
+        try:
+            await asyncio.sleep(delay_seconds)
+        finally:
+            try:
+                await session.aclose()
+            except Exception:  # eg: its connections are bound to an event loop which is closed.
+                pass
+
+    def close_async_session_later(self, session: AsyncSessionType, loop: Optional[asyncio.AbstractEventLoop] = None, delay_seconds: float = 0) -> None:
+        """
+        Close a replaced httpx.AsyncClient on the event loop it belongs to, or on the running one if that loop is closed.
+        A pending close still runs when the event loop shuts down (eg: the end of `asyncio.run()`) because it is cancelled.
+        """
+        if not hasattr(session, 'aclose'):
+            return
+        running_loop = asyncio.get_running_loop()
+        if loop is not None and loop is not running_loop and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.close_async_session(session, delay_seconds), loop)
+            return
+
+        task = running_loop.create_task(self.close_async_session(session, delay_seconds))
+        self.async_close_tasks.add(task)
+        task.add_done_callback(self.async_close_tasks.discard)
+
+    def renew_async_session(self, proxies: Optional[dict] = None, max_connections: Optional[int] = 100) -> AsyncSessionType:
+        old_session, self.session = self.session, Tse.get_async_client_session(proxies, max_connections)
+        if old_session is not None:
+            self.close_async_session_later(old_session, delay_seconds=self.async_session_close_delay_seconds)
+        return self.session
+
+    async def aclose(self) -> None:
+        """
+        Close the httpx.AsyncClient of the translator at once, together with the renewed ones still waiting to be closed.
+        """
+        for task in list(self.async_close_tasks):
+            task.cancel()
+        if self.session is not None and hasattr(self.session, 'aclose'):
+            session, self.session = self.session, None
+            await self.close_async_session(session)
+        if self.async_close_tasks:
+            await asyncio.gather(*self.async_close_tasks, return_exceptions=True)
+
 
 class Region(Tse):
     def __init__(self, default_region=None):
@@ -341,35 +798,86 @@ class Region(Tse):
         self.ip_api_addr_url = 'http://ip-api.com/json'  # must http.
         self.ip_tb_add_url = 'https://ip.taobao.com/outGetIpInfo'
         self.default_region = os.environ.get('translators_default_region', None) or default_region
-
-    def get_region_of_server(self, if_judge_cn: bool = True, if_print_region: bool = True) -> str:
+        self.cache_file_path = os.path.join(self.get_cache_dir(), 'region.json')
+        self.cache_ttl_seconds = float(os.environ.get('translators_region_cache_ttl', None) or 86400)
+
+    def get_cached_region(self, if_judge_cn: bool = True, if_ignore_ttl: bool = False) -> Optional[str]:
+        data = self.load_json_cache(self.cache_file_path) or {}
+        item = data.get('country' if if_judge_cn else 'state') if isinstance(data, dict) else None
+        if item and (if_ignore_ttl or time.time() - item['time'] < self.cache_ttl_seconds):
+            return item['region']
+        return None
+
+    def set_cached_region(self, region: str, if_judge_cn: bool = True) -> None:
+        data = self.load_json_cache(self.cache_file_path)
+        data = data if isinstance(data, dict) else {}
+        data['country' if if_judge_cn else 'state'] = {'region': region, 'time': time.time()}
+        self.dump_json_cache(self.cache_file_path, data)
+
+    def get_region_of_server(self,
+                             if_judge_cn: bool = True,
+                             if_print_region: bool = True,
+                             if_use_cache: bool = True,
+                             deadline_seconds: float = 5.0,
+                             request_timeout: float = 3.0,
+                             ) -> str:
+        """
+        :param if_judge_cn: bool, default True. Return country code rather than state name.
+        :param if_print_region: bool, default True.
+        :param if_use_cache: bool, default True. Read and write the result on disk, valid for `self.cache_ttl_seconds`.
+        :param deadline_seconds: float, default 5.0. Deadline of all requests of the lookup, fallbacks included.
+        :param request_timeout: float, default 3.0. Timeout of each request, cut to the time left before the deadline.
+        :return: str
+        """
         if self.default_region:
             if if_print_region:
                 sys.stderr.write(f'Using customized region {self.default_region} server backend.\n\n')
             return ('CN' if self.default_region in ('China', 'CN') else 'EN') if if_judge_cn else self.default_region
 
+        if if_use_cache:
+            region = self.get_cached_region(if_judge_cn)
+            if region:
+                if if_print_region:
+                    sys.stderr.write(f'Using cached region {region} server backend.\n\n')
+                return region
+
         find_info = 'Unable to find server backend.'
         connect_info = 'Unable to connect the Internet.'
         try_info = 'Try `os.environ["translators_default_region"] = "EN" or "CN"` before `import translators`'
 
+        deadline = time.time() + deadline_seconds
         _headers_fn = lambda url: self.get_headers(url, if_api=False, if_referer_for_host=True)
+
+        def _timeout_fn() -> float:
+            remaining_seconds = deadline - time.time()
+            if remaining_seconds <= 0:
+                raise requests.exceptions.Timeout(f'Deadline({deadline_seconds}s) of the region lookup is exceeded.')
+            return min(remaining_seconds, request_timeout)
+
         try:
             try:
-                data = json.loads(requests.get(self.get_addr_url, headers=_headers_fn(self.get_addr_url)).text[9:-2])
+                data = json.loads(requests.get(self.get_addr_url, headers=_headers_fn(self.get_addr_url), timeout=_timeout_fn()).text[9:-2])
                 if if_print_region:
                     sys.stderr.write(f'Using region {data.get("stateName")} server backend.\n\n')
-                return data.get('country') if if_judge_cn else data.get("stateName")
+                region = data.get('country') if if_judge_cn else data.get("stateName")
             except:
-                ip_address = requests.get(self.get_ip_url, headers=_headers_fn(self.get_ip_url)).json()['origin']
+                ip_address = requests.get(self.get_ip_url, headers=_headers_fn(self.get_ip_url), timeout=_timeout_fn()).json()['origin']
                 payload = {'ip': ip_address, 'accessKey': 'alibaba-inc'}
-                data = requests.post(url=self.ip_tb_add_url, data=payload, headers=_headers_fn(self.ip_tb_add_url)).json().get('data')
-                return data.get('country_id')  # region_id
+                data = requests.post(url=self.ip_tb_add_url, data=payload, headers=_headers_fn(self.ip_tb_add_url), timeout=_timeout_fn()).json().get('data')
+                region = data.get('country_id')  # region_id
 
-        except requests.exceptions.ConnectionError as e:
-            raise TranslatorError('\n'.join([connect_info, try_info, str(e)]))
         except Exception as e:
+            stale_region = self.get_cached_region(if_judge_cn, if_ignore_ttl=True) if if_use_cache else None
+            if stale_region:
+                return stale_region
+            if isinstance(e, requests.exceptions.ConnectionError):
+                raise TranslatorError('\n'.join([connect_info, try_info, str(e)]))
             raise TranslatorError('\n'.join([find_info, try_info, str(e)]))
 
+        if if_use_cache and region:
+            self.set_cached_region(region, if_judge_cn)
+        return region
+
 
 class GoogleV1(Tse):
     def __init__(self, server_region='EN'):
@@ -514,30 +1022,32 @@ class GoogleV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.api_url):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.api_url):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
 
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, self.session, timeout, **debug_lang_kwargs)
-            from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, self.session, timeout, **debug_lang_kwargs)
+                from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
-            tkk = self.get_tkk(host_html)
-            tk = self.acquire(query_text, tkk)
+                tkk = self.get_tkk(host_html)
+                tk = self.acquire(query_text, tkk)
 
-            api_url_part_1 = '/translate_a/single?client={0}&sl={1}&tl={2}&hl=zh-CN&dt=at&dt=bd&dt=ex'.format('webapp', from_language, to_language)
-            api_url_part_2 = '&dt=ld&dt=md&dt=qca&dt=rw&dt=rm&dt=ss&dt=t&ie=UTF-8&oe=UTF-8&source=bh&ssel=0&tsel=0&kc=1'
-            api_url_part_3 = '&tk={0}&q={1}'.format(tk, urllib.parse.quote(query_text))
-            self.api_url = ''.join([self.host_url, api_url_part_1, api_url_part_2, api_url_part_3])  # [t,webapp]
+                api_url_part_1 = '/translate_a/single?client={0}&sl={1}&tl={2}&hl=zh-CN&dt=at&dt=bd&dt=ex'.format('webapp', from_language, to_language)
+                api_url_part_2 = '&dt=ld&dt=md&dt=qca&dt=rw&dt=rm&dt=ss&dt=t&ie=UTF-8&oe=UTF-8&source=bh&ssel=0&tsel=0&kc=1'
+                api_url_part_3 = '&tk={0}&q={1}'.format(tk, urllib.parse.quote(query_text))
+                self.api_url = ''.join([self.host_url, api_url_part_1, api_url_part_2, api_url_part_3])  # [t,webapp]
 
         r = self.session.get(self.api_url, headers=self.host_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else ''.join([item[0] for item in data[0] if isinstance(item[0], str)])
 
 
@@ -561,6 +1071,7 @@ class GoogleV2(Tse):
         self.output_zh = 'zh-CN'
         self.input_limit = int(5e3)
         self.default_from_language = self.output_zh
+        self.credential_attributes = ('language_map',)
 
     @Tse.debug_language_map
     def get_language_map(self, host_html: str, **kwargs: LangMapKwargsType) -> dict:
@@ -573,6 +1084,40 @@ class GoogleV2(Tse):
         rpc = json.dumps([[[self.rpcid, param, None, "generic"]]])
         return {'f.req': rpc}
 
+    def get_batch_rpc(self, query_text_list: List[str], from_language: str, to_language: str) -> dict:
+        rpc_list = [
+            [self.rpcid, json.dumps([[query_text, from_language, to_language, True], [1]]), None, str(i + 1)]
+            for i, query_text in enumerate(query_text_list)
+        ]
+        return {'f.req': json.dumps([rpc_list])}
+
+    @staticmethod
+    def get_rpc_frames(response_text: str) -> dict:
+        """
+        Demultiplex a batchexecute response into {rpc_request_id: data}. Both the plain envelope and the
+        length-prefixed chunks (`rt=c`) are accepted; data is None when the rpc failed.
+        """
+        if response_text.startswith(")]}'"):
+            response_text = response_text[4:]
+
+        frames = {}
+        decoder = json.JSONDecoder()
+        i, n = 0, len(response_text)
+        while i < n:
+            if response_text[i] != '[':  # whitespace or the length prefix of a chunk.
+                i += 1
+                continue
+            envelope, i = decoder.raw_decode(response_text, i)
+            for entry in envelope:
+                if isinstance(entry, list) and entry and entry[0] == 'wrb.fr':
+                    rpc_request_id = entry[6] if len(entry) > 6 and entry[6] else 'generic'
+                    frames[rpc_request_id] = json.loads(entry[2]) if entry[2] else None
+        return frames
+
+    @staticmethod
+    def get_result(data: list) -> str:
+        return ' '.join([x[0] for x in (data[1][0][0][5] or data[1][0]) if x[0]])
+
     def get_info(self, host_html: str) -> dict:
         data_str = re.compile(r'window.WIZ_global_data = (.*?);</script>').findall(host_html)[0]
         data = exejs.evaluate(data_str)
@@ -587,8 +1132,49 @@ class GoogleV2(Tse):
         data = {e.attrib.get('name'): e.attrib.get('value') for e in input_elements}
         return data
 
+    def update_session(self, from_language: str, to_language: str, **kwargs: ApiKwargsType) -> None:
+        reset_host_url = kwargs.get('reset_host_url', None)
+        if reset_host_url and reset_host_url != self.host_url:
+            if kwargs.get('if_check_reset_host_url', True) and not reset_host_url[:25] == 'https://translate.google.':
+                raise TranslatorError
+            self.host_url = reset_host_url.strip('/')
+        else:
+            use_cn_condition = kwargs.get('if_use_cn_host', None) or self.server_region == 'CN'
+            self.host_url = self.cn_host_url if use_cn_condition else self.en_host_url
+
+        if self.host_url[-2:] == 'cn':
+            raise TranslatorError('Google service was offline in inland of China on Oct 2022.')
+
+        self.api_url = f'{self.host_url}{self.api_url_path}'
+        self.host_headers = self.host_headers or self.get_headers(self.host_url, if_api=False)  # reuse cookie header
+        self.api_headers = self.get_headers(self.host_url, if_api=True, if_referer_for_host=True, if_ajax_for_api=True)
+
+        timeout = kwargs.get('timeout', None)
+        proxies = kwargs.get('proxies', None)
+        http_client = kwargs.get('http_client', 'requests')
+        if_print_warning = kwargs.get('if_print_warning', True)
+        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
+        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
+
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                r = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                if urllib.parse.urlparse(self.consent_url).hostname == urllib.parse.urlparse(str(r.url)).hostname:
+                    form_data = self.get_consent_data(r.text)
+                    host_html = self.session.post(self.consent_url, data=form_data, headers=self.host_headers, timeout=timeout).text
+                else:
+                    host_html = r.text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def google_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://translate.google.com, https://translate.google.cn.
@@ -614,6 +1200,104 @@ class GoogleV2(Tse):
         :return: str or dict
         """
 
+        timeout = kwargs.get('timeout', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        is_detail_result = kwargs.get('is_detail_result', False)
+        self.check_input_limit(query_text, self.input_limit)
+
+        self.update_session(from_language, to_language, **kwargs)
+
+        from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
+
+        rpc_data = self.get_rpc(query_text, from_language, to_language)
+        rpc_data = urllib.parse.urlencode(rpc_data)
+        r = self.session.post(self.api_url, headers=self.api_headers, data=rpc_data, timeout=timeout)
+        r.raise_for_status()
+        data = self.get_rpc_frames(r.text)['generic']
+        self.count_query()
+        time.sleep(sleep_seconds)
+        return {'data': data} if is_detail_result else self.get_result(data)
+
+    @Tse.time_stat
+    @Tse.cache_credential
+    def google_batch_api(self, query_text_list: List[str], from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[List[str], List[dict]]:
+        """
+        https://translate.google.com, translate many texts with several `MkEWBc` rpcs in one batchexecute request.
+        :param query_text_list: List[str], must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0. Sleep after each request.
+                :param is_detail_result: bool, default False.
+                :param http_client: str, default 'requests'. Union['requests', 'niquests', 'httpx', 'cloudscraper']
+                :param batch_max_segments: Optional[int], default None. Max number of rpcs in one request.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+                :param reset_host_url: str, default None.
+                :param if_check_reset_host_url: bool, default True.
+        :return: list, one item per text in the order of query_text_list, see Tse.translate_query_batches(). A detail
+                result is {'data': data} of the rpc of the text, as google_api() gives. A failed rpc fails its text only.
+        """
+
+        timeout = kwargs.get('timeout', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        is_detail_result = kwargs.get('is_detail_result', False)
+
+        def _translate_batch(texts: List[str]) -> List[Union[str, dict, Exception]]:
+            self.update_session(from_language, to_language, **kwargs)
+            _from_language, _to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
+
+            rpc_data = self.get_batch_rpc(texts, _from_language, _to_language)
+            rpc_data = urllib.parse.urlencode(rpc_data)
+            r = self.session.post(self.api_url, headers=self.api_headers, data=rpc_data, timeout=timeout)
+            r.raise_for_status()
+            frames = self.get_rpc_frames(r.text)
+            self.count_query()
+            time.sleep(sleep_seconds)
+
+            result_list = []
+            for k in range(len(texts)):
+                data = frames.get(str(k + 1))
+                if data is None:
+                    result_list.append(TranslatorError('The rpc of the text failed in batchexecute.'))
+                else:
+                    result_list.append({'data': data} if is_detail_result else self.get_result(data))
+            return result_list
+
+        return self.translate_query_batches(query_text_list, _translate_batch, **kwargs)
+
+    @Tse.time_stat
+    @Tse.check_query
+    async def google_api_async(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
+        """
+        https://translate.google.com, https://translate.google.cn. Asynchronous twin of google_api(), based on httpx.AsyncClient.
+        :param query_text: str, must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0.
+                :param is_detail_result: bool, default False.
+                :param async_max_connections: Optional[int], default 100. None means unlimited.
+                :param if_ignore_limit_of_length: bool, default False.
+                :param limit_of_length: int, default 20000.
+                :param if_ignore_empty_query: bool, default False.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+                :param reset_host_url: str, default None.
+                :param if_check_reset_host_url: bool, default True.
+        :return: str or dict
+        """
+
         reset_host_url = kwargs.get('reset_host_url', None)
         if reset_host_url and reset_host_url != self.host_url:
             if kwargs.get('if_check_reset_host_url', True) and not reset_host_url[:25] == 'https://translate.google.':
@@ -627,44 +1311,45 @@ class GoogleV2(Tse):
             raise TranslatorError('Google service was offline in inland of China on Oct 2022.')
 
         self.api_url = f'{self.host_url}{self.api_url_path}'
-        self.host_headers = self.host_headers or self.get_headers(self.host_url, if_api=False)  # reuse cookie header
+        self.host_headers = self.host_headers or self.get_headers(self.host_url, if_api=False)
         self.api_headers = self.get_headers(self.host_url, if_api=True, if_referer_for_host=True, if_ajax_for_api=True)
 
         timeout = kwargs.get('timeout', None)
         proxies = kwargs.get('proxies', None)
         sleep_seconds = kwargs.get('sleep_seconds', 0)
-        http_client = kwargs.get('http_client', 'requests')
+        async_max_connections = kwargs.get('async_max_connections', 100)
         if_print_warning = kwargs.get('if_print_warning', True)
         is_detail_result = kwargs.get('is_detail_result', False)
         update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            r = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            if urllib.parse.urlparse(self.consent_url).hostname == urllib.parse.urlparse(str(r.url)).hostname:
-                form_data = self.get_consent_data(r.text)
-                host_html = self.session.post(self.consent_url, data=form_data, headers=self.host_headers, timeout=timeout).text
-            else:
-                host_html = r.text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        async with self.get_async_lock():
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.renew_async_session(proxies, async_max_connections)
+                r = await self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                if urllib.parse.urlparse(self.consent_url).hostname == urllib.parse.urlparse(str(r.url)).hostname:
+                    form_data = self.get_consent_data(r.text)
+                    host_html = (await self.session.post(self.consent_url, data=form_data, headers=self.host_headers, timeout=timeout)).text
+                else:
+                    host_html = r.text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
         rpc_data = self.get_rpc(query_text, from_language, to_language)
         rpc_data = urllib.parse.urlencode(rpc_data)
-        r = self.session.post(self.api_url, headers=self.api_headers, data=rpc_data, timeout=timeout)
+        r = await self.session.post(self.api_url, headers=self.api_headers, content=rpc_data, timeout=timeout)
         r.raise_for_status()
-        json_data = json.loads(r.text[6:])
-        data = json.loads(json_data[0][2])
-        time.sleep(sleep_seconds)
-        self.query_count += 1
-        return {'data': data} if is_detail_result else ' '.join([x[0] for x in (data[1][0][0][5] or data[1][0]) if x[0]])
+        data = self.get_rpc_frames(r.text)['generic']
+        self.count_query()
+        await asyncio.sleep(sleep_seconds)
+        return {'data': data} if is_detail_result else self.get_result(data)
 
 
 class BaiduV1(Tse):
@@ -733,22 +1418,24 @@ class BaiduV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)  # must twice, send cookies.
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)  # must twice, send cookies.
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
 
-            if not self.get_lang_url:
-                self.get_lang_url = re.compile(self.get_lang_url_pattern).search(host_html).group()
+                if not self.get_lang_url:
+                    self.get_lang_url = re.compile(self.get_lang_url_pattern).search(host_html).group()
 
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
-            # self.session.cookies.update({'ab_sr': f'1.0.1_{self.absr_v}=='})
-            # self.session.cookies.update({k: '1' for k in ['REALTIME_TRANS_SWITCH', 'FANYI_WORD_SWITCH', 'HISTORY_SWITCH', 'SOUND_SPD_SWITCH', 'SOUND_PREFER_SWITCH']})
+                # self.session.cookies.update({'ab_sr': f'1.0.1_{self.absr_v}=='})
+                # self.session.cookies.update({k: '1' for k in ['REALTIME_TRANS_SWITCH', 'FANYI_WORD_SWITCH', 'HISTORY_SWITCH', 'SOUND_SPD_SWITCH', 'SOUND_PREFER_SWITCH']})
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -761,8 +1448,8 @@ class BaiduV1(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([item['dst'] for item in data['data']])
 
 
@@ -863,24 +1550,26 @@ class BaiduV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.token and self.sign):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)  # must twice, reload token.
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.token = self.get_tk(host_html)
-            self.sign = self.get_sign(query_text, host_html, self.session, self.host_headers, timeout)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.token and self.sign):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)  # must twice, reload token.
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.token = self.get_tk(host_html)
+                self.sign = self.get_sign(query_text, host_html, self.session, self.host_headers, timeout)
 
-            if not self.get_lang_url:
-                self.get_lang_url = re.compile(self.get_lang_url_pattern).search(host_html).group()
+                if not self.get_lang_url:
+                    self.get_lang_url = re.compile(self.get_lang_url_pattern).search(host_html).group()
 
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
-            # self.session.cookies.update({'ab_sr': f'1.0.1_{self.absr_v}=='})
-            # self.session.cookies.update({k: '1' for k in ['REALTIME_TRANS_SWITCH', 'FANYI_WORD_SWITCH', 'HISTORY_SWITCH', 'SOUND_SPD_SWITCH', 'SOUND_PREFER_SWITCH']})
+                # self.session.cookies.update({'ab_sr': f'1.0.1_{self.absr_v}=='})
+                # self.session.cookies.update({k: '1' for k in ['REALTIME_TRANS_SWITCH', 'FANYI_WORD_SWITCH', 'HISTORY_SWITCH', 'SOUND_SPD_SWITCH', 'SOUND_PREFER_SWITCH']})
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -906,8 +1595,8 @@ class BaiduV2(Tse):
         r = self.session.post(self.api_url, params=params, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([x['dst'] for x in data['trans_result']['data']])
 
 
@@ -1018,15 +1707,17 @@ class YoudaoV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.sign_key):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.sign_key = self.get_sign_key(host_html, self.session, timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.sign_key):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.sign_key = self.get_sign_key(host_html, self.session, timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -1034,8 +1725,8 @@ class YoudaoV1(Tse):
         r = self.session.post(self.api_url, data=form, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([' '.join([it['tgt'] for it in item]) for item in data['translateResult']])
 
 
@@ -1068,6 +1759,7 @@ class YoudaoV2(Tse):
         self.query_count = 0
         self.output_zh = 'zh-CHS'
         self.input_limit = int(5e3)
+        self.credential_attributes = ('language_map', 'professional_field_map', 'get_js_url', 'default_key', 'secret_key', 'decode_key', 'decode_iv')
         self.default_from_language = self.output_zh
 
     @Tse.debug_language_map
@@ -1107,6 +1799,7 @@ class YoudaoV2(Tse):
     @Tse.uncertified
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def youdao_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://fanyi.youdao.com
@@ -1145,27 +1838,29 @@ class YoudaoV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.secret_key):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
-            self.professional_field_map = self.session.get(self.domain_url, headers=self.host_headers, timeout=timeout).json()['data']
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
-
-            self.get_js_url = ''.join([self.host_url, '/', re.compile(self.get_js_pattern).search(host_html).group()])
-            js_html = self.session.get(self.get_js_url, headers=self.host_headers, timeout=timeout).text
-
-            self.decode_key = re.compile('decodeKey:"(.*?)",').search(js_html).group(1)
-            self.decode_iv = re.compile('decodeIv:"(.*?)",').search(js_html).group(1)
-            self.default_key = self.get_default_key(js_html)
-
-            params = self.get_payload(keyid='webfanyi-key-getter', key=self.default_key, timestamp=self.get_timestamp())
-            key_r = self.session.get(self.get_key_url, params=params, headers=self.api_headers, timeout=timeout)
-            self.secret_key = key_r.json()['data']['secretKey']
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.secret_key):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
+                self.professional_field_map = self.session.get(self.domain_url, headers=self.host_headers, timeout=timeout).json()['data']
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+
+                self.get_js_url = ''.join([self.host_url, '/', re.compile(self.get_js_pattern).search(host_html).group()])
+                js_html = self.session.get(self.get_js_url, headers=self.host_headers, timeout=timeout).text
+
+                self.decode_key = re.compile('decodeKey:"(.*?)",').search(js_html).group(1)
+                self.decode_iv = re.compile('decodeIv:"(.*?)",').search(js_html).group(1)
+                self.default_key = self.get_default_key(js_html)
+
+                params = self.get_payload(keyid='webfanyi-key-getter', key=self.default_key, timestamp=self.get_timestamp())
+                key_r = self.session.get(self.get_key_url, params=params, headers=self.api_headers, timeout=timeout)
+                self.secret_key = key_r.json()['data']['secretKey']
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -1181,8 +1876,8 @@ class YoudaoV2(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()  # raise TranslatorError('YoudaoV2 has not been completed.')  # TODO
         data = self.decrypt(r.text, decrypt_dictionary={})
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else str(data)  # TODO
 
 
@@ -1243,14 +1938,16 @@ class YoudaoV3(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -1261,8 +1958,8 @@ class YoudaoV3(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translation'][0]
 
 
@@ -1331,15 +2028,17 @@ class QQFanyi(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.qtv_qtk):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.qtv_qtk = self.get_qt(self.session, timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.session, self.get_language_url, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.qtv_qtk):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.qtv_qtk = self.get_qt(self.session, timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.session, self.get_language_url, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -1356,8 +2055,8 @@ class QQFanyi(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else ''.join(item['targetText'] for item in data['translate']['records'])  # auto whitespace
 
 
@@ -1430,17 +2129,19 @@ class QQTranSmart(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
 
-            if not self.get_lang_url:
-                self.get_lang_url = f'{self.host_url}{re.compile(self.get_lang_url_pattern).search(host_html).group()}'
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_lang_url, self.session, timeout, **debug_lang_kwargs)
+                if not self.get_lang_url:
+                    self.get_lang_url = f'{self.host_url}{re.compile(self.get_lang_url_pattern).search(host_html).group()}'
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_lang_url, self.session, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('qqTranSmart', self.default_from_language, if_print_warning)
@@ -1477,8 +2178,8 @@ class QQTranSmart(Tse):
         r = self.session.post(self.api_url, json=api_payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else ''.join(data['auto_translation'])
 
 
@@ -1566,15 +2267,17 @@ class AlibabaV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.dmtrack_pageid):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_response = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.dmtrack_pageid = self.get_dmtrack_pageid(host_response)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.session, self.get_language_url, use_domain, self.dmtrack_pageid, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.dmtrack_pageid):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_response = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.dmtrack_pageid = self.get_dmtrack_pageid(host_response)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.session, self.get_language_url, use_domain, self.dmtrack_pageid, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         payload = {
@@ -1589,8 +2292,8 @@ class AlibabaV1(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, params=params, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['listTargetText'][0]
 
 
@@ -1614,6 +2317,7 @@ class AlibabaV2(Tse):
         self.output_zh = 'zh'
         self.input_limit = int(5e3)
         self.default_from_language = self.output_zh
+        self.credential_attributes = ('language_map', 'detail_language_map', 'get_language_url', 'csrf_token', 'api_headers')
 
     @Tse.debug_language_map
     def get_language_map(self, lang_html: str, **kwargs: LangMapKwargsType) -> dict:
@@ -1634,6 +2338,7 @@ class AlibabaV2(Tse):
 
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def alibaba_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://translate.alibaba.com
@@ -1672,21 +2377,23 @@ class AlibabaV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.csrf_token):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.get_language_url = f'https:{re.compile(self.get_language_pattern).search(host_html).group()}'
-            lang_html = self.session.get(self.get_language_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
-            self.detail_language_map = self.get_d_lang_map(lang_html)
-
-            _ = self.session.get(self.csrf_url, headers=self.host_headers, timeout=timeout)
-            self.csrf_token = self.session.get(self.csrf_url, headers=self.host_headers, timeout=timeout).json()
-            self.api_headers.update({self.csrf_token['headerName']: self.csrf_token['token']})
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.csrf_token):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.get_language_url = f'https:{re.compile(self.get_language_pattern).search(host_html).group()}'
+                lang_html = self.session.get(self.get_language_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
+                self.detail_language_map = self.get_d_lang_map(lang_html)
+
+                _ = self.session.get(self.csrf_url, headers=self.host_headers, timeout=timeout)
+                self.csrf_token = self.session.get(self.csrf_url, headers=self.host_headers, timeout=timeout).json()
+                self.api_headers.update({self.csrf_token['headerName']: self.csrf_token['token']})
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, self.output_zh)
         files_data = {
@@ -1699,8 +2406,8 @@ class AlibabaV2(Tse):
         r = self.session.post(self.api_url, files=files_data, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['data']['translateText']
 
 
@@ -1718,12 +2425,14 @@ class Bing(Tse):
         self.language_map = None
         self.session = None
         self.tk = None
+        self.tk_expire_time = None
         self.ig_iid = None
         self.query_count = 0
         self.output_auto = 'auto-detect'
         self.output_zh = 'zh-Hans'
         self.input_limit = int(1e3)
         self.default_from_language = self.output_zh
+        self.credential_attributes = ('language_map', 'tk', 'tk_expire_time', 'ig_iid')
 
     @Tse.debug_language_map
     def get_language_map(self, host_html: str, **kwargs: LangMapKwargsType) -> dict:
@@ -1738,13 +2447,23 @@ class Bing(Tse):
         ig = re.compile('IG:"(.*?)"').findall(host_html)[0]
         return {'iid': iid, 'ig': ig}
 
-    def get_tk(self, host_html: str) -> dict:
+    def get_tk_params(self, host_html: str) -> list:
         result_str = re.compile('var params_AbusePreventionHelper = (.*?);').findall(host_html)[0]
-        result = exejs.evaluate(result_str)
+        return exejs.evaluate(result_str)  # [key, token, expiry_interval(ms)]
+
+    def get_tk(self, host_html: str) -> dict:
+        result = self.get_tk_params(host_html)
         return {'key': result[0], 'token': result[1]}
 
+    def get_tk_expire_time(self, tk_params: list) -> Optional[float]:
+        return self.begin_time + tk_params[2] / 1e3 if len(tk_params) > 2 and tk_params[2] else None
+
+    def get_session_expire_time(self) -> Optional[float]:
+        return self.tk_expire_time
+
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def bing_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://bing.com/Translator, https://cn.bing.com/Translator.
@@ -1785,16 +2504,21 @@ class Bing(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.tk and self.ig_iid):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.tk = self.get_tk(host_html)
-            self.ig_iid = self.get_ig_iid(host_html)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            not_update_cond_expire = 1 if not self.tk_expire_time or time.time() < self.tk_expire_time else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and not_update_cond_expire and self.tk and self.ig_iid):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                tk_params = self.get_tk_params(host_html)
+                self.tk = {'key': tk_params[0], 'token': tk_params[1]}
+                self.tk_expire_time = self.get_tk_expire_time(tk_params)
+                self.ig_iid = self.get_ig_iid(host_html)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map,
                                                          output_zh=self.output_zh, output_auto=self.output_auto)
@@ -1810,8 +2534,8 @@ class Bing(Tse):
         api_url = ''.join([self.api_url, api_url_param])
         r = self.session.post(api_url, headers=self.host_headers, data=payload, timeout=timeout)
         r.raise_for_status()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
 
         try:
             data = r.json()
@@ -1822,24 +2546,109 @@ class Bing(Tse):
             ss = et.xpath('//*/textarea/text()')
             return {'data': ss} if is_detail_result else ss[-1]
 
-class Sogou(Tse):
-    def __init__(self):
-        super().__init__()
-        self.begin_time = time.time()
-        self.host_url = 'https://fanyi.sogou.com/text'
-        self.api_url = 'https://fanyi.sogou.com/api/transpc/text/result'
-        self.get_language_old_url = 'https://search.sogoucdn.com/translate/pc/static/js/app.7016e0df.js'
-        self.get_language_pattern = '//search.sogoucdn.com/translate/pc/static/js/vendors.(.*?).js'
-        self.get_language_url = None
-        self.host_headers = self.get_headers(self.host_url, if_api=False)
-        self.api_headers = self.get_headers(self.host_url, if_api=True)
-        self.language_map = None
-        self.uuid = None
-        self.session = None
-        self.query_count = 0
-        self.output_zh = 'zh-CHS'
-        self.input_limit = int(5e3)
-        self.default_from_language = self.output_zh
+    @Tse.time_stat
+    @Tse.check_query
+    async def bing_api_async(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
+        """
+        https://bing.com/Translator, https://cn.bing.com/Translator. Asynchronous twin of bing_api(), based on httpx.AsyncClient.
+        :param query_text: str, must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0.
+                :param is_detail_result: bool, default False.
+                :param async_max_connections: Optional[int], default 100. None means unlimited.
+                :param if_ignore_limit_of_length: bool, default False.
+                :param limit_of_length: int, default 20000.
+                :param if_ignore_empty_query: bool, default False.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+                :param if_use_cn_host: bool, default None.
+        :return: str or dict
+        """
+
+        use_cn_condition = kwargs.get('if_use_cn_host', None) or self.server_region == 'CN'
+        self.host_url = self.cn_host_url if use_cn_condition else self.en_host_url
+        self.api_url = self.host_url.replace('Translator', 'ttranslatev3')
+        self.host_headers = self.get_headers(self.host_url, if_api=False)
+        self.api_headers = self.get_headers(self.host_url, if_api=True)
+
+        timeout = kwargs.get('timeout', None)
+        proxies = kwargs.get('proxies', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        async_max_connections = kwargs.get('async_max_connections', 100)
+        if_print_warning = kwargs.get('if_print_warning', True)
+        is_detail_result = kwargs.get('is_detail_result', False)
+        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
+        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
+        self.check_input_limit(query_text, self.input_limit)
+
+        async with self.get_async_lock():
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            not_update_cond_expire = 1 if not self.tk_expire_time or time.time() < self.tk_expire_time else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and not_update_cond_expire and self.tk and self.ig_iid):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.renew_async_session(proxies, async_max_connections)
+                host_html = (await self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)).text
+                tk_params = self.get_tk_params(host_html)
+                self.tk = {'key': tk_params[0], 'token': tk_params[1]}
+                self.tk_expire_time = self.get_tk_expire_time(tk_params)
+                self.ig_iid = self.get_ig_iid(host_html)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+
+        from_language, to_language = self.check_language(from_language, to_language, self.language_map,
+                                                         output_zh=self.output_zh, output_auto=self.output_auto)
+
+        payload = {
+            'text': query_text,
+            'fromLang': from_language,
+            'to': to_language,
+            'tryFetchingGenderDebiasedTranslations': 'true'
+        }
+        payload = {**payload, **self.tk}
+        api_url_param = f'?isVertical=1&&IG={self.ig_iid["ig"]}&IID={self.ig_iid["iid"]}'
+        api_url = ''.join([self.api_url, api_url_param])
+        r = await self.session.post(api_url, headers=self.host_headers, data=payload, timeout=timeout)
+        r.raise_for_status()
+        self.count_query()
+        await asyncio.sleep(sleep_seconds)
+
+        try:
+            data = r.json()
+            return data[0] if is_detail_result else data[0]['translations'][0]['text']
+        except json.JSONDecodeError:
+            data_html = r.text
+            et = lxml_etree.HTML(data_html)
+            ss = et.xpath('//*/textarea/text()')
+            return {'data': ss} if is_detail_result else ss[-1]
+
+
+class Sogou(Tse):
+    def __init__(self):
+        super().__init__()
+        self.begin_time = time.time()
+        self.host_url = 'https://fanyi.sogou.com/text'
+        self.api_url = 'https://fanyi.sogou.com/api/transpc/text/result'
+        self.get_language_old_url = 'https://search.sogoucdn.com/translate/pc/static/js/app.7016e0df.js'
+        self.get_language_pattern = '//search.sogoucdn.com/translate/pc/static/js/vendors.(.*?).js'
+        self.get_language_url = None
+        self.host_headers = self.get_headers(self.host_url, if_api=False)
+        self.api_headers = self.get_headers(self.host_url, if_api=True)
+        self.language_map = None
+        self.uuid = None
+        self.session = None
+        self.query_count = 0
+        self.output_zh = 'zh-CHS'
+        self.input_limit = int(5e3)
+        self.default_from_language = self.output_zh
 
     @Tse.debug_language_map
     def get_language_map(self, host_html: str, lang_old_url: str, ss: SessionType, timeout: Optional[float], **kwargs: LangMapKwargsType) -> dict:
@@ -1906,15 +2715,17 @@ class Sogou(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.uuid):
-            self.uuid = str(uuid.uuid4())
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, self.get_language_old_url, self.session, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.uuid):
+                self.uuid = str(uuid.uuid4())
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, self.get_language_old_url, self.session, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -1922,8 +2733,8 @@ class Sogou(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['data']['translate']['dit']
 
 
@@ -1947,10 +2758,12 @@ class Caiyun(Tse):
         self.decrypt_dictionary = self.crypt(if_de=True)
         self.tk = 'token:qgemv4jr1y38jyq6vhvi'  # 'token gh0nd9ybc4a7mvb2unqi'
         self.jwt = None
+        self.jwt_expire_time = None
         self.query_count = 0
         self.output_zh = 'zh'
         self.input_limit = int(5e3)
         self.default_from_language = self.output_zh
+        self.credential_attributes = ('language_map', 'get_js_url', 'browser_id', 'api_headers', 'jwt', 'jwt_expire_time')
 
     # @Tse.debug_language_map
     # def get_language_map(self, js_html: str, **kwargs: LangMapKwargsType) -> dict:
@@ -1973,6 +2786,17 @@ class Caiyun(Tse):
         tk = tk.replace(' ', ':')
         return tk
 
+    def get_jwt_expire_time(self, jwt: str) -> Optional[float]:
+        try:
+            payload = jwt.split('.')[1]
+            payload = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)).decode())
+            return float(payload['exp'])
+        except Exception:
+            return None
+
+    def get_session_expire_time(self) -> Optional[float]:
+        return self.jwt_expire_time
+
     def crypt(self, if_de: bool = True) -> dict:
         if if_de:
             return {k: v for k, v in zip(self.cipher_key, self.normal_key)}
@@ -1987,8 +2811,67 @@ class Caiyun(Tse):
         _ciphertext = ''.join(list(map(lambda k: self.decrypt_dictionary[k], cipher_text)))
         return base64.b64decode(_ciphertext).decode()
 
+    def update_session(self, from_language: str, to_language: str, **kwargs: ApiKwargsType) -> None:
+        timeout = kwargs.get('timeout', None)
+        proxies = kwargs.get('proxies', None)
+        http_client = kwargs.get('http_client', 'requests')
+        if_print_warning = kwargs.get('if_print_warning', True)
+        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
+        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
+
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            not_update_cond_expire = 1 if not self.jwt_expire_time or time.time() < self.jwt_expire_time else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and not_update_cond_expire and self.tk and self.jwt):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                js_url_path = re.compile(self.get_js_pattern).search(host_html).group()
+                self.get_js_url = ''.join([self.host_url, js_url_path])
+                js_html = self.session.get(self.get_js_url, headers=self.host_headers, timeout=timeout).text
+                # self.tk = self.get_tk(js_html)
+
+                self.api_headers.update({
+                    "app-name": "xiaoyi",
+                    "device-id": self.browser_id,
+                    "os-type": "web",
+                    "os-version": "",
+                    "version": "4.6.0",
+                    "Authorization": "bearer",
+                    "X-Authorization": self.tk,
+                })
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
+
+                jwt_payload = {'browser_id': self.browser_id}
+                jwt_r = self.session.post(self.get_jwt_url, json=jwt_payload, headers=self.api_headers, timeout=timeout)
+                self.jwt = jwt_r.json()['jwt']
+                self.jwt_expire_time = self.get_jwt_expire_time(self.jwt)
+                self.api_headers.update({"T-Authorization": self.jwt})
+
+    def get_payload(self, source: List[str], from_language: str, to_language: str) -> dict:
+        payload = {
+            "browser_id": self.browser_id,
+            "source": source,
+            "trans_type": f"{from_language}2{to_language}",
+            "dict": "true",
+            "cached": "true",
+            "replaced": "true",
+            "media": "text",
+            "os_type": "web",
+            "request_id": "web_fanyi",
+            "model": "",
+            "style": "formal",
+        }
+        if from_language == 'auto':
+            payload.update({'detect': 'true'})
+        return payload
+
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def caiyun_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://fanyi.caiyunapp.com
@@ -2014,69 +2897,74 @@ class Caiyun(Tse):
         """
 
         timeout = kwargs.get('timeout', None)
-        proxies = kwargs.get('proxies', None)
         sleep_seconds = kwargs.get('sleep_seconds', 0)
-        http_client = kwargs.get('http_client', 'requests')
-        if_print_warning = kwargs.get('if_print_warning', True)
         is_detail_result = kwargs.get('is_detail_result', False)
-        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
-        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.tk and self.jwt):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            js_url_path = re.compile(self.get_js_pattern).search(host_html).group()
-            self.get_js_url = ''.join([self.host_url, js_url_path])
-            js_html = self.session.get(self.get_js_url, headers=self.host_headers, timeout=timeout).text
-            # self.tk = self.get_tk(js_html)
-
-            self.api_headers.update({
-                "app-name": "xiaoyi",
-                "device-id": self.browser_id,
-                "os-type": "web",
-                "os-version": "",
-                "version": "4.6.0",
-                "Authorization": "bearer",
-                "X-Authorization": self.tk,
-            })
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
-
-            jwt_payload = {'browser_id': self.browser_id}
-            jwt_r = self.session.post(self.get_jwt_url, json=jwt_payload, headers=self.api_headers, timeout=timeout)
-            self.jwt = jwt_r.json()['jwt']
-            self.api_headers.update({"T-Authorization": self.jwt})
-
+        self.update_session(from_language, to_language, **kwargs)
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
-        payload = {
-            "browser_id": self.browser_id,
-            "source": query_text.split('\n'),
-            "trans_type": f"{from_language}2{to_language}",
-            "dict": "true",
-            "cached": "true",
-            "replaced": "true",
-            "media": "text",
-            "os_type": "web",
-            "request_id": "web_fanyi",
-            "model": "",
-            "style": "formal",
-        }
-        if from_language == 'auto':
-            payload.update({'detect': 'true'})
-
+        payload = self.get_payload(query_text.split('\n'), from_language, to_language)
         # _ = self.session.options(self.api_url, headers=self.host_headers, timeout=timeout)
         r = self.session.post(self.api_url, headers=self.api_headers, json=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([self.decrypt(item) for item in data['target']])
 
+    @Tse.time_stat
+    @Tse.cache_credential
+    def caiyun_batch_api(self, query_text_list: List[str], from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[List[str], List[dict]]:
+        """
+        https://fanyi.caiyunapp.com, translate many texts by sending their lines as one `source` list per request.
+        :param query_text_list: List[str], must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0. Sleep after each request.
+                :param is_detail_result: bool, default False.
+                :param http_client: str, default 'requests'. Union['requests', 'niquests', 'httpx', 'cloudscraper']
+                :param batch_max_segments: Optional[int], default None. Max number of texts in one request.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+        :return: list, one item per text in the order of query_text_list, see Tse.translate_query_batches(). A detail
+                result is the response data of its request with the `target` lines of the text only.
+        """
+
+        timeout = kwargs.get('timeout', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        is_detail_result = kwargs.get('is_detail_result', False)
+
+        def _translate_batch(texts: List[str]) -> Union[List[str], List[dict]]:
+            self.update_session(from_language, to_language, **kwargs)
+            _from_language, _to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
+
+            line_count_list = [len(text.split('\n')) for text in texts]
+            source = [line for text in texts for line in text.split('\n')]
+            payload = self.get_payload(source, _from_language, _to_language)
+            r = self.session.post(self.api_url, headers=self.api_headers, json=payload, timeout=timeout)
+            r.raise_for_status()
+            data = r.json()
+            if len(data['target']) != len(source):
+                raise TranslatorError('The number of translated lines does not match the number of source lines.')
+            self.count_query()
+            time.sleep(sleep_seconds)
+
+            result_list, start = [], 0
+            for line_count in line_count_list:
+                target = data['target'][start:start + line_count]
+                result_list.append({**data, 'target': target} if is_detail_result else '\n'.join([self.decrypt(item) for item in target]))
+                start += line_count
+            return result_list
+
+        return self.translate_query_batches(query_text_list, _translate_batch, **kwargs)
+
 
 class Deepl(Tse):
     def __init__(self):
@@ -2101,12 +2989,18 @@ class Deepl(Tse):
         lang_list = sorted(list(set(re.compile("\\['selectLang_source_(\\w+)']").findall(host_html))))
         return {}.fromkeys(lang_list, lang_list)
 
-    def split_sentences_param(self, query_text: str, from_language: str) -> dict:
+    def get_request_id(self) -> int:
+        # ids of the split and the handle calls of a query, reserved at once as queries may run in parallel.
+        with self.bootstrap_lock:
+            request_id, self.request_id = self.request_id, self.request_id + 3
+        return request_id
+
+    def split_sentences_param(self, query_text: str, from_language: str, texts: Optional[List[str]] = None, request_id: Optional[int] = None) -> dict:
         data = {
-            'id': self.request_id,
+            'id': self.request_id if request_id is None else request_id,
             'jsonrpc': '2.0',
             'params': {
-                'texts': query_text.split('\n'),
+                'texts': texts if texts is not None else query_text.split('\n'),
                 'commonJobParams': {'mode': 'translate'},
                 'lang': {
                     'lang_user_selected': from_language,
@@ -2121,10 +3015,29 @@ class Deepl(Tse):
             data['params']['lang'].update({'lang_computed': from_language})
         return {**self.params['split'], **data}
 
-    def context_sentences_param(self, sentences: List[str], from_language: str, to_language: str) -> dict:
+    def context_jobs_param(self, sentences: List[str], id_offset: int = 0) -> List[dict]:
         sentences = [''] + sentences + ['']
+        return [
+            {
+                'kind': 'default',
+                # 'quality': 'fast', # -1
+                'sentences': [{'id': id_offset + i-1, 'prefix': '', 'text': sentences[i]}],
+                'raw_en_context_before': sentences[1:i] if sentences[i-1] else [],
+                'raw_en_context_after': [sentences[i+1]] if sentences[i+1] else [],
+                'preferred_num_beams': 1 if len(sentences) >= 4 else 4,  # 1 if two sentences else 4, len>=2+2
+            }
+            for i in range(1, len(sentences) - 1)
+        ]
+
+    def context_sentences_param(self,
+                                sentences: List[str],
+                                from_language: str,
+                                to_language: str,
+                                jobs: Optional[List[dict]] = None,
+                                request_id: Optional[int] = None,
+                                ) -> dict:
         data = {
-            'id': self.request_id + 1,
+            'id': (self.request_id if request_id is None else request_id) + 1,
             'jsonrpc': ' 2.0',
             'params': {
                 'priority': 1,  # -1 if 'quality': 'fast'
@@ -2135,17 +3048,7 @@ class Deepl(Tse):
                     'mode': 'translate',
                     'textType': 'plaintext',
                 },
-                'jobs': [
-                    {
-                        'kind': 'default',
-                        # 'quality': 'fast', # -1
-                        'sentences': [{'id': i-1, 'prefix': '', 'text': sentences[i]}],
-                        'raw_en_context_before': sentences[1:i] if sentences[i-1] else [],
-                        'raw_en_context_after': [sentences[i+1]] if sentences[i+1] else [],
-                        'preferred_num_beams': 1 if len(sentences) >= 4 else 4,  # 1 if two sentences else 4, len>=2+2
-                    }
-                    for i in range(1, len(sentences) - 1)
-                ],
+                'jobs': jobs if jobs is not None else self.context_jobs_param(sentences),
                 'lang': {
                     'preference': {
                         'weight': {},
@@ -2158,6 +3061,26 @@ class Deepl(Tse):
         }
         return {**self.params['handle'], **data}
 
+    def update_session(self, from_language: str, to_language: str, **kwargs: ApiKwargsType) -> None:
+        timeout = kwargs.get('timeout', None)
+        proxies = kwargs.get('proxies', None)
+        http_client = kwargs.get('http_client', 'requests')
+        if_print_warning = kwargs.get('if_print_warning', True)
+        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
+        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
+
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+                _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
+
     @Tse.time_stat
     @Tse.check_query
     def deepl_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
@@ -2184,45 +3107,213 @@ class Deepl(Tse):
         """
 
         timeout = kwargs.get('timeout', None)
-        proxies = kwargs.get('proxies', None)
         sleep_seconds = kwargs.get('sleep_seconds', 0)
-        http_client = kwargs.get('http_client', 'requests')
-        if_print_warning = kwargs.get('if_print_warning', True)
         is_detail_result = kwargs.get('is_detail_result', False)
-        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
-        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
-            _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
+        self.update_session(from_language, to_language, **kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, language_map=self.language_map, output_zh=self.output_zh, output_auto='auto')
         from_language = from_language.upper() if from_language != 'auto' else from_language
         to_language = to_language.upper() if to_language != 'auto' else to_language
 
-        ssp_data = self.split_sentences_param(query_text, from_language)
+        request_id = self.get_request_id()
+        ssp_data = self.split_sentences_param(query_text, from_language, request_id=request_id)
         r_s = self.session.post(self.api_url, params=self.params['split'], json=ssp_data, headers=self.api_headers, timeout=timeout)
         r_s.raise_for_status()
         s_data = r_s.json()
         from_language = s_data['result']['lang']['detected']
         s_sentences = [it['sentences'][0]['text'] for item in s_data['result']['texts'] for it in item['chunks']]
 
-        h_data = self.context_sentences_param(s_sentences, from_language, to_language)
+        h_data = self.context_sentences_param(s_sentences, from_language, to_language, request_id=request_id)
         r_cs = self.session.post(self.api_url, params=self.params['handle'], json=h_data, headers=self.api_headers, timeout=timeout)
         r_cs.raise_for_status()
         data = r_cs.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.request_id += 3
-        self.query_count += 1
         return data if is_detail_result else ' '.join(item['beams'][0]['sentences'][0]["text"] for item in data['result']['translations'])  # either ' ' or '\n'.
 
+    @Tse.time_stat
+    def deepl_batch_api(self, query_text_list: List[str], from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[List[str], List[dict]]:
+        """
+        https://www.deepl.com, translate many texts with one `LMT_split_text` and one `LMT_handle_jobs` call per request.
+        Sentence context never crosses the boundary of a text. As the language is detected per `LMT_split_text` call,
+        with `from_language='auto'` the texts of a request are translated from the language detected for all of them,
+        unless the detection is not confident (or `if_detect_language_per_text`), then each text is split again on its
+        own and texts are translated in requests of one detected language.
+        :param query_text_list: List[str], must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0. Sleep after each request.
+                :param is_detail_result: bool, default False.
+                :param http_client: str, default 'requests'. Union['requests', 'niquests', 'httpx', 'cloudscraper']
+                :param batch_max_segments: Optional[int], default None. Max number of texts in one request.
+                :param if_detect_language_per_text: bool, default False. Detect the language of each text with `from_language='auto'`,
+                        for batches mixing languages, at the cost of one more split call per text.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+        :return: list, one item per text in the order of query_text_list, see Tse.translate_query_batches(). A detail
+                result is the handle response data with the translations of the text only.
+        """
+
+        timeout = kwargs.get('timeout', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        is_detail_result = kwargs.get('is_detail_result', False)
+        if_detect_language_per_text = kwargs.get('if_detect_language_per_text', False)
+
+        def _check_language() -> Tuple[str, str]:
+            self.update_session(from_language, to_language, **kwargs)
+            _from_language, _to_language = self.check_language(from_language, to_language, language_map=self.language_map, output_zh=self.output_zh, output_auto='auto')
+            return (_from_language.upper() if _from_language != 'auto' else _from_language), (_to_language.upper() if _to_language != 'auto' else _to_language)
+
+        def _split_texts(texts: List[str], _from_language: str, request_id: int) -> Tuple[dict, List[List[str]]]:
+            line_count_list = [len(text.split('\n')) for text in texts]
+            lines = [line for text in texts for line in text.split('\n')]
+            ssp_data = self.split_sentences_param('', _from_language, texts=lines, request_id=request_id)
+            r_s = self.session.post(self.api_url, params=self.params['split'], json=ssp_data, headers=self.api_headers, timeout=timeout)
+            r_s.raise_for_status()
+            s_data = r_s.json()
+            s_texts = s_data['result']['texts']
+            if len(s_texts) != len(lines):
+                raise TranslatorError('The number of split texts does not match the number of query texts.')
+
+            line_iter = iter(s_texts)
+            sentences_list = [[it['sentences'][0]['text'] for item in [next(line_iter) for _ in range(line_count)] for it in item['chunks']] for line_count in line_count_list]
+            return s_data['result']['lang'], sentences_list
+
+        def _handle_jobs(sentences_list: List[List[str]], _from_language: str, _to_language: str, request_id: int) -> Union[List[str], List[dict]]:
+            jobs = []
+            for sentences in sentences_list:
+                jobs.extend(self.context_jobs_param(sentences, id_offset=len(jobs)))
+            h_data = self.context_sentences_param([], _from_language, _to_language, jobs=jobs, request_id=request_id)
+            r_cs = self.session.post(self.api_url, params=self.params['handle'], json=h_data, headers=self.api_headers, timeout=timeout)
+            r_cs.raise_for_status()
+            data = r_cs.json()
+            translations = data['result']['translations']
+            if len(translations) != len(jobs):
+                raise TranslatorError('The number of translations does not match the number of jobs.')
+            self.count_query()
+            time.sleep(sleep_seconds)
+
+            result_list, start = [], 0
+            for sentences in sentences_list:
+                text_translations = translations[start:start + len(sentences)]
+                if is_detail_result:
+                    result_list.append({**data, 'result': {**data['result'], 'translations': text_translations}})
+                else:
+                    result_list.append(' '.join([item['beams'][0]['sentences'][0]['text'] for item in text_translations]))
+                start += len(sentences)
+            return result_list
+
+        def _translate_batch(texts: List[str]) -> Union[List[str], List[dict]]:
+            _from_language, _to_language = _check_language()
+            request_id = self.get_request_id()
+            lang_data, sentences_list = _split_texts(texts, _from_language, request_id)
+            return _handle_jobs(sentences_list, lang_data['detected'], _to_language, request_id)
+
+        def _translate_auto_batch(texts: List[str]) -> Union[List[str], List[dict]]:
+            _from_language, _to_language = _check_language()
+            request_id = self.get_request_id()
+            lang_data, sentences_list = _split_texts(texts, _from_language, request_id)
+            if len(texts) == 1 or (lang_data.get('isConfident', True) and not if_detect_language_per_text):
+                return _handle_jobs(sentences_list, lang_data['detected'], _to_language, request_id)
+
+            result_list, group_dict = [None] * len(texts), {}
+            for i, text in enumerate(texts):
+                try:
+                    text_lang_data, text_sentences_list = _split_texts([text], _from_language, self.get_request_id())
+                    group_dict.setdefault(text_lang_data['detected'], []).append((i, text_sentences_list[0]))
+                except Exception as e:
+                    result_list[i] = e
+
+            for detected_language, items in group_dict.items():
+                try:
+                    group_result_list = _handle_jobs([sentences for _, sentences in items], detected_language, _to_language, self.get_request_id())
+                except Exception as e:
+                    group_result_list = [e] * len(items)
+                for (i, _), result in zip(items, group_result_list):
+                    result_list[i] = result
+
+            if all(isinstance(result, Exception) for result in result_list):
+                raise result_list[0]
+            return result_list
+
+        return self.translate_query_batches(query_text_list, _translate_batch if from_language != 'auto' else _translate_auto_batch, **kwargs)
+
+    @Tse.time_stat
+    @Tse.check_query
+    async def deepl_api_async(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
+        """
+        https://www.deepl.com. Asynchronous twin of deepl_api(), based on httpx.AsyncClient.
+        :param query_text: str, must.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param **kwargs:
+                :param timeout: Optional[float], default None.
+                :param proxies: Optional[dict], default None.
+                :param sleep_seconds: float, default 0.
+                :param is_detail_result: bool, default False.
+                :param async_max_connections: Optional[int], default 100. None means unlimited.
+                :param if_ignore_limit_of_length: bool, default False.
+                :param limit_of_length: int, default 20000.
+                :param if_ignore_empty_query: bool, default False.
+                :param update_session_after_freq: int, default 1000.
+                :param update_session_after_seconds: float, default 1500.
+                :param if_show_time_stat: bool, default False.
+                :param show_time_stat_precision: int, default 2.
+                :param if_print_warning: bool, default True.
+        :return: str or dict
+        """
+
+        timeout = kwargs.get('timeout', None)
+        proxies = kwargs.get('proxies', None)
+        sleep_seconds = kwargs.get('sleep_seconds', 0)
+        async_max_connections = kwargs.get('async_max_connections', 100)
+        if_print_warning = kwargs.get('if_print_warning', True)
+        is_detail_result = kwargs.get('is_detail_result', False)
+        update_session_after_freq = kwargs.get('update_session_after_freq', self.default_session_freq)
+        update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
+        self.check_input_limit(query_text, self.input_limit)
+
+        async with self.get_async_lock():
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.renew_async_session(proxies, async_max_connections)
+                host_html = (await self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+                _ = await self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
+
+        from_language, to_language = self.check_language(from_language, to_language, language_map=self.language_map, output_zh=self.output_zh, output_auto='auto')
+        from_language = from_language.upper() if from_language != 'auto' else from_language
+        to_language = to_language.upper() if to_language != 'auto' else to_language
+
+        request_id = self.get_request_id()
+        ssp_data = self.split_sentences_param(query_text, from_language, request_id=request_id)
+        r_s = await self.session.post(self.api_url, params=self.params['split'], json=ssp_data, headers=self.api_headers, timeout=timeout)
+        r_s.raise_for_status()
+        s_data = r_s.json()
+        from_language = s_data['result']['lang']['detected']
+        s_sentences = [it['sentences'][0]['text'] for item in s_data['result']['texts'] for it in item['chunks']]
+
+        h_data = self.context_sentences_param(s_sentences, from_language, to_language, request_id=request_id)
+        h_data['id'] = ssp_data['id'] + 1
+        r_cs = await self.session.post(self.api_url, params=self.params['handle'], json=h_data, headers=self.api_headers, timeout=timeout)
+        r_cs.raise_for_status()
+        data = r_cs.json()
+        self.count_query()
+        await asyncio.sleep(sleep_seconds)
+        return data if is_detail_result else ' '.join(item['beams'][0]['sentences'][0]["text"] for item in data['result']['translations'])
+
 
 class YandexV1(Tse):
     def __init__(self):
@@ -2330,22 +3421,24 @@ class YandexV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.sid and self.yu):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.home_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
-
-            self.sid = self.get_sid(host_html)
-            self.yum = self.get_yum()
-            self.yu = dict(self.session.cookies).get('yuidss') or f'{random.randint(int(1e8), int(9e8))}{int(time.time())}'
-            self.sprvk = dict(self.session.cookies).get('spravka')
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.sid and self.yu):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.home_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+
+                self.sid = self.get_sid(host_html)
+                self.yum = self.get_yum()
+                self.yu = dict(self.session.cookies).get('yuidss') or f'{random.randint(int(1e8), int(9e8))}{int(time.time())}'
+                self.sprvk = dict(self.session.cookies).get('spravka')
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -2368,8 +3461,8 @@ class YandexV1(Tse):
         r = self.session.post(self.api_url, params=params, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join(data['text'])
 
 
@@ -2443,15 +3536,17 @@ class YandexV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(ss=self.session, timeout=timeout, **debug_lang_kwargs)
-            if not self.language_map.get('zh'):
-                self.language_map.update(self.add_zh_lang_map)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(ss=self.session, timeout=timeout, **debug_lang_kwargs)
+                if not self.language_map.get('zh'):
+                    self.language_map.update(self.add_zh_lang_map)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -2461,8 +3556,8 @@ class YandexV2(Tse):
 
         params = {'text': query_text, 'lang': f'{from_language}-{to_language}'}
         data = self.get_request_data(ss=self.session, method='translate', params=params, timeout=timeout)
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['text'][0]
 
 
@@ -2484,6 +3579,7 @@ class Argos(Tse):
         self.output_zh = 'zh'
         self.input_limit = int(2e3)
         self.default_from_language = self.output_zh
+        self.credential_attributes = ('language_map', 'secret')
 
     @Tse.debug_language_map
     def get_language_map(self, lang_url: str, ss: SessionType, headers: dict, timeout: Optional[float], **kwargs: LangMapKwargsType) -> dict:
@@ -2499,6 +3595,7 @@ class Argos(Tse):
 
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def argos_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://libretranslate.com
@@ -2532,15 +3629,17 @@ class Argos(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.secret):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.secret = self.get_secret(self.secret_url, self.session, self.host_headers, timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.language_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.secret):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.secret = self.get_secret(self.secret_url, self.session, self.host_headers, timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.language_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         payload = {
@@ -2555,8 +3654,8 @@ class Argos(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, json=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translatedText']
 
 
@@ -2664,14 +3763,16 @@ class Iciba(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.api_url, self.session, self.language_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.api_url, self.session, self.language_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -2691,8 +3792,8 @@ class Iciba(Tse):
         r.raise_for_status()
         data = r.json()
         data = self.get_result(data)
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['out']
 
 
@@ -2767,16 +3868,18 @@ class IflytekV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            _ = self.session.get(self.cookies_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.get(self.info_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                _ = self.session.get(self.cookies_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.get(self.info_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('iflytek', self.default_from_language, if_print_warning)
@@ -2788,8 +3891,8 @@ class IflytekV1(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else json.loads(data['data'])['trans_result']['dst']
 
 
@@ -2861,14 +3964,16 @@ class IflytekV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             params = {'text': query_text}
@@ -2880,8 +3985,8 @@ class IflytekV2(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else json.loads(data['data'])['trans_result']['dst']
 
 
@@ -2945,14 +4050,16 @@ class Iflyrec(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.lang_index, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.lang_index, **debug_lang_kwargs)
 
         if from_language == 'auto':
             params = {'t': self.get_timestamp()}
@@ -2972,8 +4079,8 @@ class Iflyrec(Tse):
         r = self.session.post(self.api_url, params=api_params, json=api_form, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([item['translateResult'] for item in data['biz']])
 
 
@@ -2995,6 +4102,7 @@ class Reverso(Tse):
         self.input_limit = int(2e3)
         self.default_from_language = self.output_zh
         self.scraper = None
+        self.credential_attributes = ('language_map', 'decrypt_language_map', 'api_headers')
 
     @Tse.debug_language_map
     def get_language_map(self, lang_html: str, **kwargs: LangMapKwargsType) -> dict:
@@ -3010,6 +4118,7 @@ class Reverso(Tse):
 
     @Tse.time_stat
     @Tse.check_query
+    @Tse.cache_credential
     def reverso_api(self, query_text: str, from_language: str = 'auto', to_language: str = 'en', **kwargs: ApiKwargsType) -> Union[str, dict]:
         """
         https://www.reverso.net/text-translation
@@ -3043,19 +4152,21 @@ class Reverso(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.decrypt_language_map):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-
-            # self.language_url = re.compile(self.language_pattern).search(host_html).group()
-            lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
-            self.decrypt_language_map = self.decrypt_lang_map(lang_html)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
-            self.api_headers.update({'X-Reverso-Origin': 'translation.web'})
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.decrypt_language_map):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+
+                # self.language_url = re.compile(self.language_pattern).search(host_html).group()
+                lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
+                self.decrypt_language_map = self.decrypt_lang_map(lang_html)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
+                self.api_headers.update({'X-Reverso-Origin': 'translation.web'})
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('reverso', self.default_from_language, if_print_warning)
@@ -3077,8 +4188,8 @@ class Reverso(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else ''.join(data['translation'])
 
 
@@ -3145,23 +4256,25 @@ class Itranslate(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
 
-            if not self.language_url:
-                manifest_data = self.session.get(self.manifest_url, headers=self.host_headers, timeout=timeout).json()
-                self.language_url = manifest_data.get('main.js')
+                if not self.language_url:
+                    manifest_data = self.session.get(self.manifest_url, headers=self.host_headers, timeout=timeout).json()
+                    self.language_url = manifest_data.get('main.js')
 
-            lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
+                lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
 
-            self.api_key = self.get_apikey(lang_html)
-            self.api_headers.update({'API-KEY': self.api_key})
+                self.api_key = self.get_apikey(lang_html)
+                self.api_headers.update({'API-KEY': self.api_key})
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh,
                                                          output_en_translator='itranslate', output_en='en-US')
@@ -3173,8 +4286,8 @@ class Itranslate(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, json=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['target']['text']
 
 
@@ -3235,16 +4348,18 @@ class TranslateCom(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            lang_r = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout)
-            self.language_description = lang_r.json()
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_description, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                lang_r = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout)
+                self.language_description = lang_r.json()
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_description, **debug_lang_kwargs)
 
         if from_language == 'auto':
             detect_form = {'text_to_translate': query_text}
@@ -3262,8 +4377,8 @@ class TranslateCom(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translated_text']  # translation_source is microsoft, wtf!
 
 
@@ -3321,12 +4436,14 @@ class Utibet(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('utibet', self.default_from_language, if_print_warning)
@@ -3340,8 +4457,8 @@ class Utibet(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data_html = r.text
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return {'data_html': data_html} if is_detail_result else self.parse_result(data_html)
 
 
@@ -3417,18 +4534,20 @@ class Papago(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth_key):
-            self.device_id = str(uuid.uuid4())
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            url_path = re.compile(self.language_url_pattern).search(host_html).group()
-            self.language_url = ''.join([self.host_url, url_path])
-            lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth_key):
+                self.device_id = str(uuid.uuid4())
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                url_path = re.compile(self.language_url_pattern).search(host_html).group()
+                self.language_url = ''.join([self.host_url, url_path])
+                lang_html = self.session.get(self.language_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(lang_html, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
 
@@ -3457,8 +4576,8 @@ class Papago(Tse):
         r = self.session.post(self.api_url, headers=trans_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translatedText']
 
 
@@ -3537,28 +4656,30 @@ class LingvanexV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth_info and self.mode == mode):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.auth_info = self.get_auth(self.auth_url, self.session, self.host_headers, timeout)
-
-            if mode not in self.model_pool:
-                raise TranslatorError
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth_info and self.mode == mode):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.auth_info = self.get_auth(self.auth_url, self.session, self.host_headers, timeout)
+
+                if mode not in self.model_pool:
+                    raise TranslatorError
 
-            if mode != self.mode:
-                self.mode = mode
-                self.api_url = ''.join([self.auth_info[f'{mode}_BASE_URL'], self.auth_info['TRANSLATE_URL']])
-                self.language_url = ''.join([self.auth_info[f'{mode}_BASE_URL'], self.auth_info['GET_LANGUAGES_URL']])
-                self.host_headers.update({'authorization': self.auth_info[f'{mode}_AUTH_TOKEN']})
-                self.api_headers.update({'authorization': self.auth_info[f'{mode}_AUTH_TOKEN']})
-                self.api_headers.update({'referer': urllib.parse.urlparse(self.auth_info[f'{mode}_BASE_URL']).netloc})
+                if mode != self.mode:
+                    self.mode = mode
+                    self.api_url = ''.join([self.auth_info[f'{mode}_BASE_URL'], self.auth_info['TRANSLATE_URL']])
+                    self.language_url = ''.join([self.auth_info[f'{mode}_BASE_URL'], self.auth_info['GET_LANGUAGES_URL']])
+                    self.host_headers.update({'authorization': self.auth_info[f'{mode}_AUTH_TOKEN']})
+                    self.api_headers.update({'authorization': self.auth_info[f'{mode}_AUTH_TOKEN']})
+                    self.api_headers.update({'referer': urllib.parse.urlparse(self.auth_info[f'{mode}_BASE_URL']).netloc})
 
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
-            self.detail_language_map = self.get_d_lang_map(self.language_url, self.session, self.host_headers, timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+                self.detail_language_map = self.get_d_lang_map(self.language_url, self.session, self.host_headers, timeout)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('lingvanex', self.default_from_language, if_print_warning)
@@ -3576,8 +4697,8 @@ class LingvanexV1(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['result']
 
 
@@ -3643,17 +4764,19 @@ class LingvanexV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.auth = self.get_auth(host_html)
-            self.host_headers.update({'authorization': self.auth})
-            self.api_headers.update({'authorization': self.auth})
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.auth):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.auth = self.get_auth(host_html)
+                self.host_headers.update({'authorization': self.auth})
+                self.api_headers.update({'authorization': self.auth})
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('lingvanex', self.default_from_language, if_print_warning)
@@ -3670,8 +4793,8 @@ class LingvanexV2(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['result']
 
 
@@ -3755,32 +4878,34 @@ class NiutransV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.account_info and self.api_headers):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.options(self.cookie_url, headers=self.host_headers, timeout=timeout)
-
-            user_data = self.session.get(self.user_url, headers=self.host_headers, timeout=timeout).json()
-            key_data = self.session.get(self.key_url, headers=self.host_headers, timeout=timeout).json()
-            guest_info = {
-                'username': user_data['data']['username'].strip(),
-                'password': self.encrypt_rsa(message_text=user_data['data']['password'], public_key_text=key_data['data']),
-                'publicKey': key_data['data'],
-                'symbol': '',
-            }
-            r_tk = self.session.post(self.token_url, json=guest_info, headers=self.host_headers, timeout=timeout)
-            token_data = r_tk.json()
-
-            self.account_info = {**guest_info, **token_data['data']}
-            self.api_headers = {**self.host_headers, **{'Jwt': self.account_info['token']}}
-            self.session.cookies.update({'Admin-Token': self.account_info['token']})
-            # info_data = ss.get(self.info_url, headers=self.host_headers, timeout=timeout).json()
-
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.account_info and self.api_headers):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.options(self.cookie_url, headers=self.host_headers, timeout=timeout)
+
+                user_data = self.session.get(self.user_url, headers=self.host_headers, timeout=timeout).json()
+                key_data = self.session.get(self.key_url, headers=self.host_headers, timeout=timeout).json()
+                guest_info = {
+                    'username': user_data['data']['username'].strip(),
+                    'password': self.encrypt_rsa(message_text=user_data['data']['password'], public_key_text=key_data['data']),
+                    'publicKey': key_data['data'],
+                    'symbol': '',
+                }
+                r_tk = self.session.post(self.token_url, json=guest_info, headers=self.host_headers, timeout=timeout)
+                token_data = r_tk.json()
+
+                self.account_info = {**guest_info, **token_data['data']}
+                self.api_headers = {**self.host_headers, **{'Jwt': self.account_info['token']}}
+                self.session.cookies.update({'Admin-Token': self.account_info['token']})
+                # info_data = ss.get(self.info_url, headers=self.host_headers, timeout=timeout).json()
+
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -3794,8 +4919,8 @@ class NiutransV1(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join([' '.join([it['data'] for it in item['sentences']]) for item in data['data']])
 
 
@@ -3908,16 +5033,18 @@ class NiutransV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.captcha_id):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
-            self.captcha_id = self.get_captcha_id(self.geetest_captcaha_url, self.session, self.host_headers, timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.captcha_id):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.get(self.login_url, headers=self.host_headers, timeout=timeout)
+                self.captcha_id = self.get_captcha_id(self.geetest_captcaha_url, self.session, self.host_headers, timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_language_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -3948,8 +5075,8 @@ class NiutransV2(Tse):
         r = self.session.get(self.api_url, params=trans_params, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['tgt_text']
 
 
@@ -4004,12 +5131,14 @@ class Mglip(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('mglip', self.default_from_language, if_print_warning)
@@ -4020,8 +5149,8 @@ class Mglip(Tse):
         r = self.session.post(self.api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['datas'][0]['paragraph'] if data['datas'][0]['type'] == 'trans' else data['datas'][0]['data']
 
 
@@ -4109,14 +5238,16 @@ class VolcEngine(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map,
                                                          output_auto=self.output_auto, output_zh=self.output_zh)
@@ -4136,8 +5267,8 @@ class VolcEngine(Tse):
         r = self.session.post(self.api_url, params=params, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translation']
 
 
@@ -4199,14 +5330,16 @@ class ModernMt(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.language_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         timestamp = self.get_timestamp()
@@ -4222,8 +5355,8 @@ class ModernMt(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['data']['translation']
 
 
@@ -4295,15 +5428,17 @@ class MyMemory(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, self.get_matecat_language_url, self.session,
-                                                      self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, self.get_matecat_language_url, self.session,
+                                                          self.host_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('myMemory', self.default_from_language, if_print_warning)
@@ -4320,8 +5455,8 @@ class MyMemory(Tse):
         r = self.session.get(api_url, params=params, headers=self.host_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['responseData']['translatedText']
 
 
@@ -4392,18 +5527,20 @@ class Mirai(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.tran_key):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            # _ = self.session.get(self.home_url, headers=self.host_headers, timeout=timeout)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.tran_key = re.compile('var tran = "(.*?)";').search(host_html).group(1)
-            lang_url_part = re.compile(self.lang_url_pattern).search(host_html).group()
-            self.lang_url = f'https://miraitranslate.com/trial/inmt/{lang_url_part}'
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.lang_url, self.session, self.api_json_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time and self.tran_key):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                # _ = self.session.get(self.home_url, headers=self.host_headers, timeout=timeout)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.tran_key = re.compile('var tran = "(.*?)";').search(host_html).group(1)
+                lang_url_part = re.compile(self.lang_url_pattern).search(host_html).group()
+                self.lang_url = f'https://miraitranslate.com/trial/inmt/{lang_url_part}'
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.lang_url, self.session, self.api_json_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             r = self.session.post(self.detect_lang_url, headers=self.api_json_headers, json={'text': query_text}, timeout=timeout)
@@ -4438,8 +5575,8 @@ class Mirai(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_text_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['ouputs'][0]['output'][0]['translation']
 
 
@@ -4502,14 +5639,16 @@ class Apertium(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.get_lang_url, self.session, self.host_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             payload = urllib.parse.urlencode({'q': query_text})
@@ -4528,8 +5667,8 @@ class Apertium(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['responseData']['translatedText']
 
 
@@ -4601,21 +5740,23 @@ class Tilde(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.config_data = self.session.get(self.get_config_url, headers=self.host_headers, timeout=timeout).json()
-            self.api_headers.update({'client-id': self.config_data['mt']['api']['clientId']})  # must lower keyword
-
-            sys_url = self.config_data['mt']['api']['systemListUrl']
-            params = {'appID': self.config_data['mt']['api']['appID'], 'uiLanguageID': self.config_data['mt']['api']['uiLanguageID']}
-            self.sys_data = self.session.get(sys_url, params=params, headers=self.api_headers, timeout=timeout).json()  # test
-            self.langpair_ids = self.get_langpair_ids(self.sys_data)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.sys_data, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.config_data = self.session.get(self.get_config_url, headers=self.host_headers, timeout=timeout).json()
+                self.api_headers.update({'client-id': self.config_data['mt']['api']['clientId']})  # must lower keyword
+
+                sys_url = self.config_data['mt']['api']['systemListUrl']
+                params = {'appID': self.config_data['mt']['api']['appID'], 'uiLanguageID': self.config_data['mt']['api']['uiLanguageID']}
+                self.sys_data = self.session.get(sys_url, params=params, headers=self.api_headers, timeout=timeout).json()  # test
+                self.langpair_ids = self.get_langpair_ids(self.sys_data)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.sys_data, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('tilde', self.default_from_language, if_print_warning)
@@ -4630,8 +5771,8 @@ class Tilde(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translation']
 
 
@@ -4705,18 +5846,20 @@ class cloudTranslationV1(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.get(self.get_cookie_url, headers=self.api_headers, timeout=timeout)
-            d_lang_map = self.session.get(self.get_lang_url, headers=self.api_headers, timeout=timeout).json()
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
-            self.langpair_domain = self.get_langpair_domain(d_lang_map)
-            self.professional_field = self.get_professional_field_list(d_lang_map)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.get(self.get_cookie_url, headers=self.api_headers, timeout=timeout)
+                d_lang_map = self.session.get(self.get_lang_url, headers=self.api_headers, timeout=timeout).json()
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
+                self.langpair_domain = self.get_langpair_domain(d_lang_map)
+                self.professional_field = self.get_professional_field_list(d_lang_map)
 
         if from_language == 'auto':
             payload = {'text': query_text}
@@ -4742,8 +5885,8 @@ class cloudTranslationV1(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['data']['translation']
 
 
@@ -4816,18 +5959,20 @@ class cloudTranslationV2(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            _ = self.session.get(self.get_cookie_url, headers=self.api_headers, timeout=timeout)
-            d_lang_map = self.session.get(self.get_lang_url, headers=self.api_headers, timeout=timeout).json()
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
-            self.langpair_domain = self.get_langpair_domain(d_lang_map)
-            self.professional_field = self.get_professional_field_list(d_lang_map)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                _ = self.session.get(self.get_cookie_url, headers=self.api_headers, timeout=timeout)
+                d_lang_map = self.session.get(self.get_lang_url, headers=self.api_headers, timeout=timeout).json()
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
+                self.langpair_domain = self.get_langpair_domain(d_lang_map)
+                self.professional_field = self.get_professional_field_list(d_lang_map)
 
         if from_language == 'auto':
             payload = {'text': query_text}
@@ -4854,8 +5999,8 @@ class cloudTranslationV2(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else json.loads(data['data']['data'])['translation']
 
 
@@ -4947,27 +6092,29 @@ class SysTran(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.client_data = self.get_client_data(self.get_client_url, self.session, self.host_headers, timeout)
-            payload = urllib.parse.urlencode(self.client_data)
-            self.token_data = self.session.post(self.get_token_url, data=payload, headers=self.api_ajax_headers, timeout=timeout).json()
-
-            header_params = {
-                'authorization': f'{self.token_data["token_type"]} {self.token_data["access_token"]}',
-                'x-user-agent': 'File Translate Box Portable',
-            }
-            self.api_json_headers.update(header_params)
-
-            d_lang_map = self.session.get(self.get_lang_url, headers=self.api_json_headers, timeout=timeout).json()
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
-            self.professional_field = self.get_professional_field_list(d_lang_map)
-            self.langpair_domain = self.get_langpair_domain(d_lang_map)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.client_data = self.get_client_data(self.get_client_url, self.session, self.host_headers, timeout)
+                payload = urllib.parse.urlencode(self.client_data)
+                self.token_data = self.session.post(self.get_token_url, data=payload, headers=self.api_ajax_headers, timeout=timeout).json()
+
+                header_params = {
+                    'authorization': f'{self.token_data["token_type"]} {self.token_data["access_token"]}',
+                    'x-user-agent': 'File Translate Box Portable',
+                }
+                self.api_json_headers.update(header_params)
+
+                d_lang_map = self.session.get(self.get_lang_url, headers=self.api_json_headers, timeout=timeout).json()
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
+                self.professional_field = self.get_professional_field_list(d_lang_map)
+                self.langpair_domain = self.get_langpair_domain(d_lang_map)
 
         from_language, to_language = self.check_language(from_language, to_language, self.language_map, output_zh=self.output_zh)
         if from_language == 'auto':
@@ -4996,8 +6143,8 @@ class SysTran(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_json_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join(' '.join(it['alt_transes'][0]['target']['text'] for it in item['output']['documents'][0]['trans_units'][0]['sentences']) for item in data['outputs'])
 
 
@@ -5062,14 +6209,16 @@ class TranslateMe(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('translateMe', self.default_from_language, if_print_warning)
@@ -5093,8 +6242,8 @@ class TranslateMe(Tse):
             r.raise_for_status()
             data = r.json()
             data_list.append(data)
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return {'data': data_list} if is_detail_result else '\n'.join([item['to'] for item in data_list])
 
     @Tse.uncertified
@@ -5133,14 +6282,16 @@ class TranslateMe(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('translateMe', self.default_from_language, if_print_warning)
@@ -5148,12 +6299,14 @@ class TranslateMe(Tse):
                                                          output_en_translator='translateMe', output_en=self.output_en)
 
         if self.output_en in (from_language, to_language):
-            return self._translateMe_api(query_text, from_language, to_language, **kwargs)
-
-        tmp_kwargs = kwargs.copy()
-        tmp_kwargs.update({'is_detail_result': False, 'if_show_time_stat': False})
-        next_query_text = self._translateMe_api(query_text, from_language, self.output_en, **tmp_kwargs)
-        return self._translateMe_api(next_query_text, self.output_en, to_language, **kwargs)
+            result = self._translateMe_api(query_text, from_language, to_language, **kwargs)
+        else:
+            tmp_kwargs = kwargs.copy()
+            tmp_kwargs.update({'is_detail_result': False, 'if_show_time_stat': False})
+            next_query_text = self._translateMe_api(query_text, from_language, self.output_en, **tmp_kwargs)
+            result = self._translateMe_api(next_query_text, self.output_en, to_language, **kwargs)
+        self.count_query()
+        return result
 
 
 class Elia(Tse):
@@ -5227,19 +6380,21 @@ class Elia(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            self.token = re.compile('"csrfmiddlewaretoken": "(.*?)"').search(host_html).group(1)
-            d_lang_str = re.compile('var languagePairs = JSON.parse\\((.*?)\\);').search(host_html).group()
-            d_lang_map = json.loads(d_lang_str[43:-4].replace('&quot;', '"'))
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
-            self.professional_field = self.get_professional_field_list(d_lang_map)
-            self.langpair_domain = self.get_langpair_domain(d_lang_map)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                self.token = re.compile('"csrfmiddlewaretoken": "(.*?)"').search(host_html).group(1)
+                d_lang_str = re.compile('var languagePairs = JSON.parse\\((.*?)\\);').search(host_html).group()
+                d_lang_map = json.loads(d_lang_str[43:-4].replace('&quot;', '"'))
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(d_lang_map, **debug_lang_kwargs)
+                self.professional_field = self.get_professional_field_list(d_lang_map)
+                self.langpair_domain = self.get_langpair_domain(d_lang_map)
 
         if from_language == 'auto':
             payload = {
@@ -5270,8 +6425,8 @@ class Elia(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translated_text'].replace('</div>', '\n').replace('<div>', '').replace('<span>', '').replace('</span>', '')
 
 
@@ -5351,18 +6506,20 @@ class LanguageWire(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            self.lwt_data = self.get_lwt_data()
-            self.api_headers.update(self.lwt_data)
-
-            _ = self.session.post(self.cookie_url, headers=self.api_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.lang_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                self.lwt_data = self.get_lwt_data()
+                self.api_headers.update(self.lwt_data)
+
+                _ = self.session.post(self.cookie_url, headers=self.api_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.lang_url, self.session, self.api_headers, timeout, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('languageWire', self.default_from_language, if_print_warning)
@@ -5377,8 +6534,8 @@ class LanguageWire(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translation']
 
 
@@ -5439,14 +6596,16 @@ class Judic(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.lang_list, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.lang_list, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('judic', self.default_from_language, if_print_warning)
@@ -5460,8 +6619,8 @@ class Judic(Tse):
         r = self.session.post(self.api_url, json=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['translation']
 
 
@@ -5523,14 +6682,16 @@ class Yeekit(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(self.lang_list, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                _ = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout)
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(self.lang_list, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('yeekit', self.default_from_language, if_print_warning)
@@ -5545,8 +6706,8 @@ class Yeekit(Tse):
         r = self.session.post(self.api_url, data=payload, headers=self.api_headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else '\n'.join(' '.join(p) for p in json.loads(data[0])['translation'][0]['translated'][0]['translation list'])
 
 
@@ -5607,15 +6768,17 @@ class Hujiang(Tse):
         update_session_after_seconds = kwargs.get('update_session_after_seconds', self.default_session_seconds)
         self.check_input_limit(query_text, self.input_limit)
 
-        not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 else 0
-        not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
-        if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
-            self.begin_time = time.time()
-            self.session = Tse.get_client_session(http_client, proxies)
-            self.session.cookies.update({'HJ_UID': self.hj_uid, 'HJC_USRC': 'uzhi', 'HJC_NUID': '1'})
-            host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
-            debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
-            self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
+        with self.bootstrap_lock:
+            not_update_cond_freq = 1 if self.query_count % update_session_after_freq != 0 or self.query_count == self.bootstrap_query_count else 0
+            not_update_cond_time = 1 if time.time() - self.begin_time < update_session_after_seconds else 0
+            if not (self.session and self.language_map and not_update_cond_freq and not_update_cond_time):
+                self.begin_time = time.time()
+                self.bootstrap_query_count = self.query_count
+                self.session = Tse.get_client_session(http_client, proxies)
+                self.session.cookies.update({'HJ_UID': self.hj_uid, 'HJC_USRC': 'uzhi', 'HJC_NUID': '1'})
+                host_html = self.session.get(self.host_url, headers=self.host_headers, timeout=timeout).text
+                debug_lang_kwargs = self.debug_lang_kwargs(from_language, to_language, self.default_from_language, if_print_warning)
+                self.language_map = self.get_language_map(host_html, **debug_lang_kwargs)
 
         if from_language == 'auto':
             from_language = self.warning_auto_lang('hujiang', self.default_from_language, if_print_warning)
@@ -5626,102 +6789,1841 @@ class Hujiang(Tse):
         r = self.session.post(api_url, headers=self.api_headers, data=payload, timeout=timeout)
         r.raise_for_status()
         data = r.json()
+        self.count_query()
         time.sleep(sleep_seconds)
-        self.query_count += 1
         return data if is_detail_result else data['data']['content']  # supported by baidu.
 
 
-class TranslatorsServer:
-    def __init__(self):
-        self.cpu_cnt = os.cpu_count()
-        self._region = Region()
-        self.get_region_of_server = self._region.get_region_of_server
-        self.server_region = self.get_region_of_server(if_print_region=False)
-        self._alibaba = AlibabaV2()
-        self.alibaba = self._alibaba.alibaba_api
-        self._apertium = Apertium()
-        self.apertium = self._apertium.apertium_api
-        self._argos = Argos()
-        self.argos = self._argos.argos_api
-        self._baidu = BaiduV1()  # V2
-        self.baidu = self._baidu.baidu_api
-        self._bing = Bing(server_region=self.server_region)
-        self.bing = self._bing.bing_api
-        self._caiyun = Caiyun()
-        self.caiyun = self._caiyun.caiyun_api
-        self._cloudTranslation = cloudTranslationV2()
-        self.cloudTranslation = self._cloudTranslation.cloudTranslation_api
-        self._deepl = Deepl()
-        self.deepl = self._deepl.deepl_api
-        self._elia = Elia()
-        self.elia = self._elia.elia_api
-        self._google = GoogleV2(server_region=self.server_region)
-        self.google = self._google.google_api
-        self._hujiang = Hujiang()
-        self.hujiang = self._hujiang.hujiang_api
-        self._iciba = Iciba()
-        self.iciba = self._iciba.iciba_api
-        self._iflytek = IflytekV2()
-        self.iflytek = self._iflytek.iflytek_api
-        self._iflyrec = Iflyrec()
-        self.iflyrec = self._iflyrec.iflyrec_api
-        self._itranslate = Itranslate()
-        self.itranslate = self._itranslate.itranslate_api
-        self._judic = Judic()
-        self.judic = self._judic.judic_api
-        self._languageWire = LanguageWire()
-        self.languageWire = self._languageWire.languageWire_api
-        self._lingvanex = LingvanexV2()
-        self.lingvanex = self._lingvanex.lingvanex_api
-        self._niutrans = NiutransV2()
-        self.niutrans = self._niutrans.niutrans_api
-        self._mglip = Mglip()
-        self.mglip = self._mglip.mglip_api
-        self._mirai = Mirai()
-        self.mirai = self._mirai.mirai_api
-        self._modernMt = ModernMt()
-        self.modernMt = self._modernMt.modernMt_api
-        self._myMemory = MyMemory()
-        self.myMemory = self._myMemory.myMemory_api
-        self._papago = Papago()
-        self.papago = self._papago.papago_api
-        self._qqFanyi = QQFanyi()
-        self.qqFanyi = self._qqFanyi.qqFanyi_api
-        self._qqTranSmart = QQTranSmart()
-        self.qqTranSmart = self._qqTranSmart.qqTranSmart_api
-        self._reverso = Reverso()
-        self.reverso = self._reverso.reverso_api
-        self._sogou = Sogou()
-        self.sogou = self._sogou.sogou_api
-        self._sysTran = SysTran()
-        self.sysTran = self._sysTran.sysTran_api
-        self._tilde = Tilde()
-        self.tilde = self._tilde.tilde_api
-        self._translateCom = TranslateCom()
-        self.translateCom = self._translateCom.translateCom_api
-        self._translateMe = TranslateMe()
-        self.translateMe = self._translateMe.translateMe_api
-        self._utibet = Utibet()
-        self.utibet = self._utibet.utibet_api
-        self._volcEngine = VolcEngine()
-        self.volcEngine = self._volcEngine.volcEngine_api
-        self._yandex = YandexV2()
-        self.yandex = self._yandex.yandex_api
-        self._yeekit = Yeekit()
-        self.yeekit = self._yeekit.yeekit_api
-        self._youdao = YoudaoV3()
-        self.youdao = self._youdao.youdao_api
-        self._translators_dict = {
-            'alibaba': self._alibaba, 'apertium': self._apertium, 'argos': self._argos, 'baidu': self._baidu, 'bing': self._bing,
-            'caiyun': self._caiyun, 'cloudTranslation': self._cloudTranslation, 'deepl': self._deepl, 'elia': self._elia, 'google': self._google,
-            'hujiang': self._hujiang, 'iciba': self._iciba, 'iflytek': self._iflytek, 'iflyrec': self._iflyrec, 'itranslate': self._itranslate,
-            'judic': self._judic, 'languageWire': self._languageWire, 'lingvanex': self._lingvanex, 'niutrans': self._niutrans, 'mglip': self._mglip,
-            'mirai': self._mirai, 'modernMt': self._modernMt, 'myMemory': self._myMemory, 'papago': self._papago, 'qqFanyi': self._qqFanyi,
-            'qqTranSmart': self._qqTranSmart, 'reverso': self._reverso, 'sogou': self._sogou, 'sysTran': self._sysTran, 'tilde': self._tilde,
-            'translateCom': self._translateCom, 'translateMe': self._translateMe, 'utibet': self._utibet, 'volcEngine': self._volcEngine, 'yandex': self._yandex,
-            'yeekit': self._yeekit, 'youdao': self._youdao,
-        }
-        self.translators_dict = {
+class TranslationCache:
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        """
+        Base class of translation result caches used by TranslatorsServer.set_translation_cache().
+        :param ttl_seconds: Optional[float], default None. None means never expire.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.expiration_count = 0
+        self.binary_header = b'TRANSLATORS-CACHE-1\n'
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def normalize_query_text(query_text: str) -> str:
+        return unicodedata.normalize('NFC', query_text.strip())
+
+    @staticmethod
+    def get_cache_key(translator: str,
+                      from_language: str,
+                      to_language: str,
+                      query_text: str,
+                      professional_field: Optional[str] = None,
+                      is_detail_result: bool = False,
+                      ) -> str:
+        key_items = [translator, from_language, to_language, professional_field, bool(is_detail_result), TranslationCache.normalize_query_text(query_text)]
+        return json.dumps(key_items, ensure_ascii=False, separators=(',', ':'))
+
+    @staticmethod
+    def get_size(key: str, value: Union[str, dict]) -> int:
+        """
+        Bytes of the key and the value in utf-8, detail results (dict) are measured by their json text.
+        """
+        value_text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        return len(key.encode('utf-8')) + len(value_text.encode('utf-8'))
+
+    @staticmethod
+    def parse_cache_key(key: str) -> dict:
+        translator, from_language, to_language, professional_field, is_detail_result, query_text = json.loads(key)
+        return {
+            'translator': translator,
+            'from_language': from_language,
+            'to_language': to_language,
+            'professional_field': professional_field,
+            'is_detail_result': is_detail_result,
+            'source': query_text,
+        }
+
+    @staticmethod
+    def get_file_format(file_path: str, file_format: Optional[str] = None) -> str:
+        if file_format:
+            return file_format
+        extension = os.path.splitext(file_path)[1].lower().lstrip('.')
+        return {'json': 'jsonl', 'bin': 'binary', 'txt': 'tsv'}.get(extension, extension)
+
+    def items(self) -> collections.abc.Iterator:
+        """
+        :return: Iterator, (key, value, created_time) of entries not expired.
+        """
+        raise NotImplementedError
+
+    def export_records(self, file_path: str, file_format: Optional[str] = None) -> int:
+        """
+        Export entries as records {'translator', 'from_language', 'to_language', 'professional_field', 'is_detail_result',
+        'source', 'target', 'time'}, eg: to warm up the cache of a new node by import_records().
+        :param file_path: str, must.
+        :param file_format: Optional[str], default None. Choose from ("jsonl", "binary"), None means by the file extension.
+                "binary" is a zlib stream of length-prefixed(uint32) compact json arrays, after the header `self.binary_header`.
+        :return: int, number of exported records.
+        """
+        file_format = self.get_file_format(file_path, file_format)
+        if file_format not in ('jsonl', 'binary'):
+            raise TranslatorError
+
+        n_record = 0
+        with open(file_path, 'w' if file_format == 'jsonl' else 'wb', **({'encoding': 'utf-8'} if file_format == 'jsonl' else {})) as file:
+            compressor = zlib.compressobj(6) if file_format == 'binary' else None
+            if compressor:
+                file.write(self.binary_header)
+
+            for key, value, created_time in self.items():
+                record = {**self.parse_cache_key(key), 'target': value, 'time': created_time}
+                if compressor:
+                    record_bytes = json.dumps(list(record.values()), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                    file.write(compressor.compress(struct.pack('<I', len(record_bytes)) + record_bytes))
+                else:
+                    file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                n_record += 1
+
+            if compressor:
+                file.write(compressor.flush())
+        return n_record
+
+    def read_records(self, file_path: str, file_format: Optional[str] = None) -> collections.abc.Iterator:
+        file_format = self.get_file_format(file_path, file_format)
+        if file_format == 'jsonl':
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+        if file_format != 'binary':
+            raise TranslatorError
+
+        fields = ('translator', 'from_language', 'to_language', 'professional_field', 'is_detail_result', 'source', 'target', 'time')
+        with open(file_path, 'rb') as file:
+            if file.read(len(self.binary_header)) != self.binary_header:
+                raise TranslatorError('Not a binary file of exported translation cache.')
+
+            decompressor, buffer = zlib.decompressobj(), bytearray()
+            for chunk in iter(functools.partial(file.read, 2 ** 20), b''):
+                buffer += decompressor.decompress(chunk)
+                offset = 0
+                while len(buffer) - offset >= 4:
+                    size = struct.unpack_from('<I', buffer, offset)[0]
+                    if len(buffer) - offset < 4 + size:
+                        break
+                    yield dict(zip(fields, json.loads(buffer[offset + 4:offset + 4 + size].decode('utf-8'))))
+                    offset += 4 + size
+                del buffer[:offset]  # once per chunk, slicing per record would make it quadratic.
+
+    def import_records(self, file_path: str, file_format: Optional[str] = None, if_overwrite: bool = True) -> int:
+        """
+        Import records exported by export_records(). Records keep their `time`, so they expire as they would have in
+        the exporting cache, and records older than `self.ttl_seconds` are skipped.
+        :param file_path: str, must.
+        :param file_format: Optional[str], default None. Choose from ("jsonl", "binary"), None means by the file extension.
+        :param if_overwrite: bool, default True. False keeps the entries already cached.
+        :return: int, number of imported records.
+        """
+        now, n_record = time.time(), 0
+        for record in self.read_records(file_path, file_format):
+            if self.ttl_seconds is not None and record.get('time') and record['time'] + self.ttl_seconds <= now:
+                continue
+
+            key = self.get_cache_key(
+                record['translator'], record['from_language'], record['to_language'], record['source'],
+                record.get('professional_field'), record.get('is_detail_result', False),
+            )
+            if not if_overwrite and self.peek(key) is not None:
+                continue
+            self.set(key, record['target'], created_time=record.get('time'))
+            n_record += 1
+        return n_record
+
+    def seed(self,
+             seed_data: Union[str, List[Tuple[str, str]]],
+             translator: Union[str, List[str]],
+             from_language: str,
+             to_language: str,
+             professional_field: Optional[str] = None,
+             file_format: Optional[str] = None,
+             if_overwrite: bool = False,
+             ) -> int:
+        """
+        Seed the cache with curated translations (glossaries, translation memories), served as results of `translator`.
+        :param seed_data: Union[str, List[Tuple[str, str]]], must. [(source, target), ...] or the path of a file:
+                "tsv"/"csv": two columns (source, target);
+                "jsonl": lines of {"source", "target"};
+                "tmx": translation units, whose segments are chosen by the language prefix of `from_language` and `to_language`.
+        :param translator: Union[str, List[str]], must.
+        :param from_language: str, must.
+        :param to_language: str, must.
+        :param professional_field: Optional[str], default None.
+        :param file_format: Optional[str], default None. Choose from ("tsv", "csv", "jsonl", "tmx"), None means by the file extension.
+        :param if_overwrite: bool, default False. False keeps the entries already cached.
+        :return: int, number of seeded entries.
+        """
+        translators = [translator] if isinstance(translator, str) else list(translator)
+        pairs = self.read_seed_pairs(seed_data, from_language, to_language, file_format) if isinstance(seed_data, str) else seed_data
+
+        n_entry = 0
+        for source, target in pairs:
+            if not (isinstance(source, str) and isinstance(target, str) and source.strip() and target.strip()):
+                continue
+            for _ts in translators:
+                key = self.get_cache_key(_ts, from_language, to_language, source, professional_field, False)
+                if not if_overwrite and self.peek(key) is not None:
+                    continue
+                self.set(key, target.strip())
+                n_entry += 1
+        return n_entry
+
+    def read_seed_pairs(self, file_path: str, from_language: str, to_language: str, file_format: Optional[str] = None) -> collections.abc.Iterator:
+        file_format = self.get_file_format(file_path, file_format)
+        if file_format in ('tsv', 'csv'):
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as file:
+                for row in csv.reader(file, delimiter='\t' if file_format == 'tsv' else ','):
+                    if len(row) >= 2:
+                        yield row[0], row[1]
+        elif file_format == 'jsonl':
+            with open(file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        item = json.loads(line)
+                        yield item.get('source'), item.get('target')
+        elif file_format == 'tmx':
+            lang_attrib = '{http://www.w3.org/XML/1998/namespace}lang'
+            match_lang = lambda tmx_lang, lang: tmx_lang.lower().replace('_', '-').split('-')[0] == lang.lower().replace('_', '-').split('-')[0]
+            for _, tu in lxml_etree.iterparse(file_path, tag='tu'):
+                segments = {}
+                for tuv in tu.iter('tuv'):
+                    tmx_lang = tuv.get(lang_attrib) or tuv.get('lang') or ''
+                    seg = tuv.find('seg')
+                    if seg is not None:
+                        segments[tmx_lang] = ''.join(seg.itertext())
+                source = next((v for k, v in segments.items() if match_lang(k, from_language)), None)
+                target = next((v for k, v in segments.items() if match_lang(k, to_language)), None)
+                tu.clear()
+                if source and target:
+                    yield source, target
+        else:
+            raise TranslatorError
+
+    def get(self, key: str) -> Optional[Union[str, dict]]:
+        raise NotImplementedError
+
+    def peek(self, key: str) -> Optional[Union[str, dict]]:
+        """
+        Like get(), but changes nothing: no hit or miss counted, no recency or frequency updated, no expired entry removed.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Union[str, dict], created_time: Optional[float] = None) -> None:
+        """
+        :param key: str, must.
+        :param value: Union[str, dict], must.
+        :param created_time: Optional[float], default None. None means now, the entry expires `self.ttl_seconds` after it.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def stat(self) -> dict:
+        with self.lock:
+            n_request = self.hit_count + self.miss_count
+            return {
+                'entries': len(self),
+                'hit': self.hit_count,
+                'miss': self.miss_count,
+                'hit_rate': round(self.hit_count / n_request, 4) if n_request else None,
+                'eviction': self.eviction_count,
+                'expiration': self.expiration_count,
+            }
+
+
+class SharedMemoryTranslationCache(TranslationCache):
+    def __init__(self,
+                 cache_path: Optional[str] = None,
+                 max_entries: int = 2 ** 16,
+                 arena_bytes: int = 64 * 2 ** 20,
+                 ttl_seconds: Optional[float] = None,
+                 ):
+        """
+        Cache of translation results in a memory-mapped file shared by all processes of a host (eg: workers of gunicorn
+        or uwsgi), without any server. It is a fixed-size open-addressing (linear probing) hash table of slots pointing
+        into a ring arena of keys and values. When the arena is full, the entries in its oldest region (1/16 of it) are
+        evicted, and when the table is full, the oldest 1/16 of the entries are, so entries go out in the order they were written.
+        Processes are synchronized by flock(), so it works on POSIX only. Call close() or use it in a `with` block.
+        :param cache_path: Optional[str], default None. None means a file under /dev/shm (tmpfs) if available, else under Tse.get_cache_dir().
+        :param max_entries: int, default 65536. The table has 4/3 of it in slots, ignored if the file already exists.
+        :param arena_bytes: int, default 64MB. Bytes of keys and values (utf-8 json), ignored if the file already exists.
+        :param ttl_seconds: Optional[float], default None. None means never expire.
+        """
+        try:
+            import fcntl
+        except ImportError:
+            raise TranslatorError('SharedMemoryTranslationCache needs fcntl.flock(), which is POSIX only.')
+
+        super().__init__(ttl_seconds=ttl_seconds)
+        if cache_path is None:
+            cache_dir = '/dev/shm' if os.path.isdir('/dev/shm') else Tse.get_cache_dir()
+            cache_path = os.path.join(cache_dir, f'translators_translation_cache_{os.getuid()}.mmap')
+
+        self.fcntl = fcntl
+        self.cache_path = cache_path
+        self.magic = b'TSLCACHE'
+        self.version = 2
+        self.header_fields = ('magic', 'version', 'n_slot', 'arena_size', 'arena_used', 'arena_free', 'n_entry', 'n_tombstone', 'n_byte')
+        self.header_struct = struct.Struct('<8sIIQQQQQQ')  # arena_used: write position, arena_free: end of the evicted space ahead of it.
+        self.slot_struct = struct.Struct('<QQIIdd')  # hash, offset, key_size, value_size, created_time, expire_time
+        self.header_size = 64
+        self.n_region = 16
+        self.empty_hash, self.tombstone_hash = 0, 1
+        self.pid = None
+        self.file = None
+        self.mmap = None
+        self.thread_lock = None
+
+        if os.path.dirname(self.cache_path):
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        self.file = open(self.cache_path, 'a+b')
+        self.pid = os.getpid()
+        self.thread_lock = threading.Lock()
+        try:
+            with self.locked(if_exclusive=True):
+                self.open_mmap(max_entries, arena_bytes)
+        except BaseException:
+            self.close()
+            raise
+
+    def open_mmap(self, max_entries: int, arena_bytes: int) -> None:
+        self.file.seek(0)
+        header = self.file.read(self.header_size)
+        if len(header) < self.header_size:  # new, or left by a process that died while creating it.
+            if not self.magic.startswith(header[:len(self.magic)]):
+                raise TranslatorError(f'Not a file of SharedMemoryTranslationCache: {self.cache_path}.')
+            self.set_layout(max(8, max_entries * 4 // 3), arena_bytes)
+            if_reset = True
+        else:
+            magic, version, n_slot, arena_size = self.header_struct.unpack_from(header)[:4]
+            if magic != self.magic or version != self.version or n_slot < 8 or arena_size < 1:
+                raise TranslatorError(f'Not a file of SharedMemoryTranslationCache (version {self.version}): {self.cache_path}.')
+            self.set_layout(n_slot, arena_size)
+            if_reset = os.fstat(self.file.fileno()).st_size < self.file_size  # truncated, its entries are lost anyway.
+
+        if if_reset:
+            self.file.truncate(self.file_size)
+        self.mmap = mmap.mmap(self.file.fileno(), self.file_size)
+        if if_reset:
+            self.reset()
+
+    def set_layout(self, n_slot: int, arena_size: int) -> None:
+        self.n_slot, self.arena_size = n_slot, arena_size
+        self.max_entries = self.n_slot * 3 // 4
+        self.arena_offset = self.header_size + self.n_slot * self.slot_struct.size
+        self.region_size = max(1, -(-self.arena_size // self.n_region))
+        self.file_size = self.arena_offset + self.arena_size
+
+    def close(self) -> None:
+        """
+        Unmap and close the file, the entries stay in it for other processes.
+        """
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @contextlib.contextmanager
+    def locked(self, if_exclusive: bool = False):
+        if self.file is None:
+            raise TranslatorError('SharedMemoryTranslationCache is closed.')
+        if self.pid != os.getpid():  # flock is shared by a forked child with its parent unless the file is opened again.
+            self.file = open(self.cache_path, 'a+b')
+            self.thread_lock = threading.Lock()
+            self.pid = os.getpid()
+
+        with self.thread_lock:
+            self.fcntl.flock(self.file.fileno(), self.fcntl.LOCK_EX if if_exclusive else self.fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                self.fcntl.flock(self.file.fileno(), self.fcntl.LOCK_UN)
+
+    def read_header(self) -> dict:
+        return dict(zip(self.header_fields, self.header_struct.unpack_from(self.mmap, 0)))
+
+    def write_header(self, header: dict) -> None:
+        self.header_struct.pack_into(self.mmap, 0, self.magic, self.version, self.n_slot, self.arena_size, *(header[name] for name in self.header_fields[4:]))
+
+    def reset(self) -> None:
+        self.mmap[self.header_size:self.arena_offset] = bytes(self.arena_offset - self.header_size)
+        self.write_header({'arena_used': 0, 'arena_free': self.arena_size, 'n_entry': 0, 'n_tombstone': 0, 'n_byte': 0})
+
+    @staticmethod
+    def get_hash(key_bytes: bytes) -> int:
+        return max(2, int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), 'little'))
+
+    def is_live_slot(self, slot: tuple) -> bool:
+        return slot[0] > self.tombstone_hash and slot[1] + slot[2] + slot[3] <= self.arena_size
+
+    def iter_slots(self) -> collections.abc.Iterator:
+        return enumerate(self.slot_struct.iter_unpack(self.mmap[self.header_size:self.arena_offset]))
+
+    def find_slot(self, key_bytes: bytes, key_hash: int) -> Tuple[int, Optional[tuple]]:
+        """
+        :return: tuple, (index of the slot of the key or of the first free slot, the slot of the key or None)
+        """
+        free_index = None
+        index = key_hash % self.n_slot
+        for _ in range(self.n_slot):
+            slot = self.slot_struct.unpack_from(self.mmap, self.header_size + index * self.slot_struct.size)
+            if slot[0] == self.empty_hash:
+                return (index if free_index is None else free_index), None
+            if slot[0] == self.tombstone_hash:
+                free_index = index if free_index is None else free_index
+            elif slot[0] == key_hash and self.is_live_slot(slot):
+                offset = self.arena_offset + slot[1]
+                if self.mmap[offset:offset + slot[2]] == key_bytes:
+                    return index, slot
+            index = (index + 1) % self.n_slot
+        return (free_index if free_index is not None else -1), None
+
+    def write_slot(self, index: int, *slot) -> None:
+        self.slot_struct.pack_into(self.mmap, self.header_size + index * self.slot_struct.size, *slot)
+
+    def evict_region(self, header: dict) -> None:
+        """
+        Evict the entries overlapping the region next to the evicted space ahead of the write position, from the start
+        of the arena once the end is reached.
+        """
+        if header['arena_free'] >= self.arena_size:
+            header['arena_used'], header['arena_free'] = 0, 0
+        start, end = header['arena_free'], min(header['arena_free'] + self.region_size, self.arena_size)
+
+        n_evicted = 0
+        for index, slot in self.iter_slots():
+            if slot[0] > self.tombstone_hash and slot[1] < end and slot[1] + slot[2] + slot[3] > start:
+                self.write_slot(index, self.tombstone_hash, 0, 0, 0, 0.0, 0.0)
+                header['n_entry'] -= 1
+                header['n_tombstone'] += 1
+                header['n_byte'] -= slot[2] + slot[3]
+                n_evicted += 1
+        header['arena_free'] = end
+
+        with self.lock:
+            self.eviction_count += n_evicted
+
+    def evict_oldest(self, header: dict) -> None:
+        """
+        Evict the oldest 1/16 of the entries, when the table is full. Going around the ring from the write position,
+        entries come from the oldest to the newest.
+        """
+        slots = ((index, slot) for index, slot in self.iter_slots() if slot[0] > self.tombstone_hash)
+        oldest = heapq.nsmallest(max(1, self.max_entries // self.n_region), slots, key=lambda item: (item[1][1] - header['arena_used']) % self.arena_size)
+        for index, slot in oldest:
+            self.write_slot(index, self.tombstone_hash, 0, 0, 0, 0.0, 0.0)
+            header['n_entry'] -= 1
+            header['n_tombstone'] += 1
+            header['n_byte'] -= slot[2] + slot[3]
+
+        with self.lock:
+            self.eviction_count += len(oldest)
+
+    def rebuild_table(self, header: dict) -> None:
+        """
+        Insert the entries again into an empty table, which drops the tombstones that lengthen linear probing.
+        """
+        slots = [slot for _, slot in self.iter_slots() if slot[0] > self.tombstone_hash]
+        self.mmap[self.header_size:self.arena_offset] = bytes(self.arena_offset - self.header_size)
+        for slot in slots:
+            index = slot[0] % self.n_slot
+            while self.slot_struct.unpack_from(self.mmap, self.header_size + index * self.slot_struct.size)[0] != self.empty_hash:
+                index = (index + 1) % self.n_slot
+            self.write_slot(index, *slot)
+        header['n_tombstone'] = 0
+
+    def allocate(self, size: int, header: dict) -> int:
+        if header['arena_used'] + size > self.arena_size:  # the tail is evicted when it is reached again.
+            header['arena_used'], header['arena_free'] = 0, 0
+        while header['arena_used'] + size > header['arena_free']:
+            self.evict_region(header)
+
+        offset = header['arena_used']
+        header['arena_used'] += size
+        return offset
+
+    def read_value(self, key: str) -> Tuple[Optional[bytes], Optional[tuple]]:
+        key_bytes = key.encode('utf-8')
+        with self.locked():
+            _, slot = self.find_slot(key_bytes, self.get_hash(key_bytes))
+            if slot is not None and not (slot[5] and time.time() >= slot[5]):
+                offset = self.arena_offset + slot[1] + slot[2]
+                return self.mmap[offset:offset + slot[3]], slot
+        return None, slot
+
+    def get(self, key: str) -> Optional[Union[str, dict]]:
+        value_bytes, slot = self.read_value(key)
+        with self.lock:
+            if value_bytes is None:
+                self.miss_count += 1
+                self.expiration_count += 1 if slot is not None else 0
+                return None
+            self.hit_count += 1
+        return json.loads(value_bytes.decode('utf-8'))
+
+    def peek(self, key: str) -> Optional[Union[str, dict]]:
+        value_bytes, _ = self.read_value(key)
+        return json.loads(value_bytes.decode('utf-8')) if value_bytes is not None else None
+
+    def set(self, key: str, value: Union[str, dict], created_time: Optional[float] = None) -> None:
+        key_bytes = key.encode('utf-8')
+        value_bytes = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        size = len(key_bytes) + len(value_bytes)
+        if size > self.arena_size:  # not cached, nor is the former value of the key served any more.
+            self.delete(key)
+            return
+
+        key_hash = self.get_hash(key_bytes)
+        now = created_time or time.time()
+        expire_time = now + self.ttl_seconds if self.ttl_seconds is not None else 0.0
+        with self.locked(if_exclusive=True):
+            header = self.read_header()
+            offset = self.allocate(size, header)
+            self.mmap[self.arena_offset + offset:self.arena_offset + offset + size] = key_bytes + value_bytes
+            index, slot = self.find_slot(key_bytes, key_hash)
+            if slot is None and header['n_entry'] + header['n_tombstone'] >= self.max_entries:
+                while header['n_entry'] + header['n_tombstone'] >= self.max_entries:
+                    if header['n_tombstone']:
+                        self.rebuild_table(header)
+                    else:
+                        self.evict_oldest(header)
+                index, slot = self.find_slot(key_bytes, key_hash)
+
+            if slot is None:
+                old_hash = self.slot_struct.unpack_from(self.mmap, self.header_size + index * self.slot_struct.size)[0]
+                header['n_entry'] += 1
+                header['n_tombstone'] -= 1 if old_hash == self.tombstone_hash else 0
+            else:
+                header['n_byte'] -= slot[2] + slot[3]
+            header['n_byte'] += size
+            self.write_slot(index, key_hash, offset, len(key_bytes), len(value_bytes), now, expire_time)
+            self.write_header(header)
+
+    def delete(self, key: str) -> None:
+        key_bytes = key.encode('utf-8')
+        with self.locked(if_exclusive=True):
+            index, slot = self.find_slot(key_bytes, self.get_hash(key_bytes))
+            if slot is not None:
+                header = self.read_header()
+                self.write_slot(index, self.tombstone_hash, 0, 0, 0, 0.0, 0.0)
+                header['n_entry'] -= 1
+                header['n_tombstone'] += 1
+                header['n_byte'] -= slot[2] + slot[3]
+                self.write_header(header)
+
+    def clear(self) -> None:
+        with self.locked(if_exclusive=True):
+            self.reset()
+
+    def items(self) -> collections.abc.Iterator:
+        now, items = time.time(), []
+        with self.locked():
+            for _, slot in self.iter_slots():
+                if self.is_live_slot(slot) and not (slot[5] and now >= slot[5]):
+                    offset = self.arena_offset + slot[1]
+                    items.append((self.mmap[offset:offset + slot[2]], self.mmap[offset + slot[2]:offset + slot[2] + slot[3]], slot[4]))
+        for key_bytes, value_bytes, created_time in items:
+            yield key_bytes.decode('utf-8'), json.loads(value_bytes.decode('utf-8')), created_time
+
+    def __len__(self) -> int:
+        with self.locked():
+            return self.read_header()['n_entry']
+
+    def stat(self) -> dict:
+        with self.locked():
+            header = self.read_header()
+        return {
+            **super().stat(),
+            'bytes': header['n_byte'],
+            'max_bytes': self.arena_size,
+            'max_entries': self.max_entries,
+            'tombstones': header['n_tombstone'],
+            'cache_path': self.cache_path,
+        }
+
+
+class EvictionPolicy:
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Base class of eviction policies of MemoryTranslationCache, which tracks keys with their sizes (bytes)
+        and tells which key to evict. Not thread-safe, the cache calls it under its lock.
+        :param max_entries: Optional[int], default None.
+        :param max_bytes: Optional[int], default None.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizes = {}
+
+    def insert(self, key: str, size: int) -> None:
+        raise NotImplementedError
+
+    def access(self, key: str) -> None:
+        raise NotImplementedError
+
+    def remove(self, key: str) -> None:
+        raise NotImplementedError
+
+    def evict(self) -> str:
+        raise NotImplementedError
+
+    def stat(self) -> dict:
+        return {}
+
+
+class LruEvictionPolicy(EvictionPolicy):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Least recently used.
+        """
+        super().__init__(max_entries, max_bytes)
+        self.queue = collections.OrderedDict()
+
+    def insert(self, key: str, size: int) -> None:
+        self.sizes[key] = size
+        self.queue[key] = None
+
+    def access(self, key: str) -> None:
+        self.queue.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        del self.sizes[key]
+        del self.queue[key]
+
+    def evict(self) -> str:
+        key = next(iter(self.queue))
+        self.remove(key)
+        return key
+
+
+class LfuEvictionPolicy(EvictionPolicy):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Least frequently used, the least recently used one among equally frequent keys. O(1) by frequency buckets.
+        """
+        super().__init__(max_entries, max_bytes)
+        self.frequencies = {}
+        self.buckets = collections.defaultdict(collections.OrderedDict)  # frequency: {key: None}
+        self.min_frequency = 0
+
+    def insert(self, key: str, size: int) -> None:
+        self.sizes[key] = size
+        self.frequencies[key] = 1
+        self.buckets[1][key] = None
+        self.min_frequency = 1
+
+    def access(self, key: str) -> None:
+        frequency = self.frequencies[key]
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+            if self.min_frequency == frequency:
+                self.min_frequency = frequency + 1
+        self.frequencies[key] = frequency + 1
+        self.buckets[frequency + 1][key] = None
+
+    def remove(self, key: str) -> None:
+        del self.sizes[key]
+        frequency = self.frequencies.pop(key)
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+            if self.min_frequency == frequency:
+                self.min_frequency = min(self.buckets) if self.buckets else 0
+
+    def evict(self) -> str:
+        key = next(iter(self.buckets[self.min_frequency]))
+        self.remove(key)
+        return key
+
+    def stat(self) -> dict:
+        return {'min_frequency': self.min_frequency, 'max_frequency': max(self.buckets) if self.buckets else 0}
+
+
+class WTinyLfuEvictionPolicy(EvictionPolicy):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        """
+        W-TinyLFU: new keys enter a small LRU window, keys leaving the window are admitted into the main SLRU
+        (probation + protected) only if they are estimated (count-min sketch) more frequent than the main victim.
+        One-off keys (eg: long documents translated once) thus never flush the hot keys (eg: ui strings).
+        Keys bigger than the window skip it, they compete for admission at once.
+        :param window_ratio: float, default 0.01. Share of entries and bytes of the window.
+        :param protected_ratio: float, default 0.8. Share of entries and bytes of the main SLRU kept by the protected segment.
+        """
+        super().__init__(max_entries, max_bytes)
+        self.window_ratio = window_ratio
+        self.protected_ratio = protected_ratio
+        self.segments = {name: collections.OrderedDict() for name in ('window', 'probation', 'protected')}  # key: None
+        self.segment_bytes = dict.fromkeys(self.segments, 0)
+        self.key_segments = {}
+
+        self.sketch_depth = 4
+        self.sketch_width = 1 << max(4, (max_entries or 2 ** 16) - 1).bit_length()
+        self.sketch = [[0] * self.sketch_width for _ in range(self.sketch_depth)]
+        self.sketch_sample_size = 10 * self.sketch_width
+        self.sketch_additions = 0
+        self.candidates = collections.OrderedDict()  # keys out of the window by the latest insert, key: None
+        self.admission_count = 0
+        self.rejection_count = 0
+
+    def get_sketch_indexes(self, key: str) -> List[int]:
+        # double hashing by the two halves of one 64-bit hash, rows of hash((i, key)) collide together.
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = key_hash & 0xFFFFFFFF, (key_hash >> 32) | 1
+        return [(h1 + i * h2) & (self.sketch_width - 1) for i in range(self.sketch_depth)]
+
+    def increment(self, key: str) -> None:
+        for row, j in zip(self.sketch, self.get_sketch_indexes(key)):
+            if row[j] < 15:
+                row[j] += 1
+
+        self.sketch_additions += 1
+        if self.sketch_additions >= self.sketch_sample_size:  # aging, so that old popularity fades out.
+            self.sketch = [[x >> 1 for x in row] for row in self.sketch]
+            self.sketch_additions //= 2
+
+    def frequency(self, key: str) -> int:
+        return min(row[j] for row, j in zip(self.sketch, self.get_sketch_indexes(key)))
+
+    def is_over(self, segment_names: tuple, ratio: float) -> bool:
+        n_entry = sum(len(self.segments[name]) for name in segment_names)
+        n_byte = sum(self.segment_bytes[name] for name in segment_names)
+        return bool((self.max_entries and n_entry > self.max_entries * ratio) or (self.max_bytes and n_byte > self.max_bytes * ratio))
+
+    def move(self, key: str, segment_name: str) -> None:
+        old_segment_name = self.key_segments.get(key)
+        if old_segment_name:
+            del self.segments[old_segment_name][key]
+            self.segment_bytes[old_segment_name] -= self.sizes[key]
+        self.segments[segment_name][key] = None
+        self.segment_bytes[segment_name] += self.sizes[key]
+        self.key_segments[key] = segment_name
+
+    def insert(self, key: str, size: int) -> None:
+        self.sizes[key] = size
+        self.increment(key)
+        self.candidates.clear()
+        if self.max_bytes and size > self.max_bytes * self.window_ratio:
+            self.move(key, 'probation')
+            self.candidates[key] = None
+            return
+
+        self.move(key, 'window')
+        while self.is_over(('window',), self.window_ratio) and len(self.segments['window']) > 1:
+            candidate = next(iter(self.segments['window']))
+            self.move(candidate, 'probation')
+            self.candidates[candidate] = None
+
+    def access(self, key: str) -> None:
+        self.increment(key)
+        segment_name = self.key_segments[key]
+        if segment_name == 'probation':
+            self.candidates.pop(key, None)
+            self.move(key, 'protected')
+            protected_ratio = (1 - self.window_ratio) * self.protected_ratio
+            while self.is_over(('protected',), protected_ratio) and len(self.segments['protected']) > 1:
+                self.move(next(iter(self.segments['protected'])), 'probation')
+        else:
+            self.segments[segment_name].move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        segment_name = self.key_segments.pop(key)
+        del self.segments[segment_name][key]
+        self.segment_bytes[segment_name] -= self.sizes.pop(key)
+        self.candidates.pop(key, None)
+
+    def evict(self) -> str:
+        """
+        Each key out of the window by the latest insert (candidate) competes once with the least recently used key
+        of probation, else of protected (victim), the less frequent one is evicted.
+        """
+        probation, protected, window = self.segments['probation'], self.segments['protected'], self.segments['window']
+        candidate = next(iter(self.candidates), None)
+        victim = next((key for key in probation if key not in self.candidates), None) or next(iter(protected), None) or next(iter(window), None) or candidate
+
+        key = victim
+        if candidate is not None and candidate != victim:
+            del self.candidates[candidate]
+            if self.frequency(candidate) > self.frequency(victim):
+                self.admission_count += 1
+            else:
+                self.rejection_count += 1
+                key = candidate
+        self.remove(key)
+        return key
+
+    def stat(self) -> dict:
+        return {
+            **{f'{name}_entries': len(segment) for name, segment in self.segments.items()},
+            **{f'{name}_bytes': n_byte for name, n_byte in self.segment_bytes.items()},
+            'admission': self.admission_count,
+            'rejection': self.rejection_count,
+        }
+
+
+class MemoryTranslationCache(TranslationCache):
+    eviction_policy_class_dict = {'lru': LruEvictionPolicy, 'lfu': LfuEvictionPolicy, 'w_tinylfu': WTinyLfuEvictionPolicy}
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 2 ** 20, ttl_seconds: Optional[float] = None, eviction_policy: str = 'lru'):
+        """
+        In-process cache of translation results, bounded by entry count and total bytes (utf-8 of keys, strings and detail results).
+        :param max_entries: int, default 10000.
+        :param max_bytes: int, default 64MB.
+        :param ttl_seconds: Optional[float], default None. None means never expire.
+        :param eviction_policy: str, default 'lru', choose from ("lru", "lfu", "w_tinylfu").
+                "w_tinylfu" is scan-resistant: texts translated once do not flush the frequently translated ones.
+        """
+        if eviction_policy not in self.eviction_policy_class_dict:
+            raise TranslatorError
+
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.eviction_policy = eviction_policy
+        self.policy = self.eviction_policy_class_dict[eviction_policy](max_entries, max_bytes)
+        self.data = {}  # key: (value, size, expire_time, created_time)
+
+    def get(self, key: str) -> Optional[Union[str, dict]]:
+        with self.lock:
+            item = self.data.get(key)
+            if item is None:
+                self.miss_count += 1
+                return None
+
+            value, size, expire_time, _ = item
+            if expire_time is not None and time.time() >= expire_time:
+                self._pop(key)
+                self.expiration_count += 1
+                self.miss_count += 1
+                return None
+
+            self.policy.access(key)
+            self.hit_count += 1
+            return copy.deepcopy(value) if isinstance(value, dict) else value
+
+    def peek(self, key: str) -> Optional[Union[str, dict]]:
+        item = self.data.get(key)
+        if item is None or (item[2] is not None and time.time() >= item[2]):
+            return None
+        return copy.deepcopy(item[0]) if isinstance(item[0], dict) else item[0]
+
+    def set(self, key: str, value: Union[str, dict], created_time: Optional[float] = None) -> None:
+        size = self.get_size(key, value)
+        if size > self.max_bytes:  # not cached, nor is the former value of the key served any more.
+            with self.lock:
+                if key in self.data:
+                    self._pop(key)
+            return
+
+        created_time = created_time or time.time()
+        expire_time = created_time + self.ttl_seconds if self.ttl_seconds is not None else None
+        value = copy.deepcopy(value) if isinstance(value, dict) else value
+        with self.lock:
+            if key in self.data:
+                self._pop(key)
+            self.data[key] = (value, size, expire_time, created_time)
+            self.total_bytes += size
+            self.policy.insert(key, size)
+
+            while len(self.data) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, size, _, _ = self.data.pop(self.policy.evict())
+                self.total_bytes -= size
+                self.eviction_count += 1
+
+    def _pop(self, key: str) -> None:
+        _, size, _, _ = self.data.pop(key)
+        self.total_bytes -= size
+        self.policy.remove(key)
+
+    def items(self) -> collections.abc.Iterator:
+        now = time.time()
+        with self.lock:
+            items = list(self.data.items())
+        for key, (value, _, expire_time, created_time) in items:
+            if expire_time is None or now < expire_time:
+                yield key, value, created_time
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            if key in self.data:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+            self.total_bytes = 0
+            self.policy = self.eviction_policy_class_dict[self.eviction_policy](self.max_entries, self.max_bytes)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def stat(self) -> dict:
+        with self.lock:
+            return {
+                **super().stat(),
+                'bytes': self.total_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'eviction_policy': self.eviction_policy,
+                'policy': self.policy.stat(),
+            }
+
+
+class SqliteTranslationCache(TranslationCache):
+    def __init__(self,
+                 cache_path: Optional[str] = None,
+                 ttl_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = 1024 * 2 ** 20,
+                 vacuum_after_writes: int = 1000,
+                 compress_level: int = 6,
+                 ):
+        """
+        Persistent cache of translation results in SQLite (WAL mode), shared by threads, processes and `fanyi` runs
+        on a host. Values are zlib compressed, old entries are vacuumed by TTL and by `max_bytes` (least recently used).
+        :param cache_path: Optional[str], default None. None means `translation_cache.sqlite3` under Tse.get_cache_dir().
+        :param ttl_seconds: Optional[float], default None. None means never expire.
+        :param max_bytes: Optional[int], default 1GB. Bytes of stored values (compressed). None means unlimited.
+        :param vacuum_after_writes: int, default 1000. Vacuum every `vacuum_after_writes` writes of this process.
+        :param compress_level: int, default 6.
+        """
+        super().__init__(ttl_seconds=ttl_seconds)
+        self.cache_path = cache_path or os.path.join(Tse.get_cache_dir(), 'translation_cache.sqlite3')
+        self.max_bytes = max_bytes
+        self.vacuum_after_writes = vacuum_after_writes
+        self.compress_level = compress_level
+        self.touch_interval_seconds = 60.0
+        self.write_count = 0
+        self.error_count = 0
+        self.local = threading.local()
+
+        if os.path.dirname(self.cache_path):
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        conn = self.get_connection()
+        conn.execute('PRAGMA auto_vacuum=INCREMENTAL')  # only works before the table is created.
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS translation_cache ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, '
+            'created_time REAL NOT NULL, accessed_time REAL NOT NULL, expire_time REAL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS translation_cache_accessed_time ON translation_cache (accessed_time)')
+        conn.commit()
+
+    def get_connection(self) -> sqlite3.Connection:
+        # one connection per thread and per process (a connection must not cross fork).
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def encode_value(self, value: Union[str, dict]) -> bytes:
+        return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'), self.compress_level)
+
+    @staticmethod
+    def decode_value(value: bytes) -> Union[str, dict]:
+        return json.loads(zlib.decompress(value).decode('utf-8'))
+
+    def warn_error(self, operation: str, e: Exception) -> None:
+        # the cache is optional: a locked database, a full disk or a read-only filesystem must not fail a translation.
+        with self.lock:
+            self.error_count += 1
+        warnings.warn(f'SqliteTranslationCache {operation} skipped, {self.cache_path}: {str(e)}.')
+
+    def get(self, key: str) -> Optional[Union[str, dict]]:
+        now = time.time()
+        try:
+            conn = self.get_connection()
+            row = conn.execute('SELECT value, accessed_time, expire_time FROM translation_cache WHERE key = ?', (key,)).fetchone()
+            if row is not None and (row[2] is None or now < row[2]) and now - row[1] >= self.touch_interval_seconds:
+                with conn:
+                    conn.execute('UPDATE translation_cache SET accessed_time = ? WHERE key = ?', (now, key))
+        except sqlite3.OperationalError as e:
+            self.warn_error('read', e)
+            row = None
+
+        if row is None or (row[2] is not None and now >= row[2]):
+            with self.lock:
+                self.miss_count += 1
+                self.expiration_count += 1 if row is not None else 0
+            return None
+
+        value = self.decode_row_value(key, row[0])
+        with self.lock:
+            if value is None:
+                self.miss_count += 1
+            else:
+                self.hit_count += 1
+        return value
+
+    def peek(self, key: str) -> Optional[Union[str, dict]]:
+        try:
+            row = self.get_connection().execute(
+                'SELECT value FROM translation_cache WHERE key = ? AND (expire_time IS NULL OR expire_time > ?)', (key, time.time())
+            ).fetchone()
+        except sqlite3.OperationalError as e:
+            self.warn_error('read', e)
+            row = None
+        return self.decode_row_value(key, row[0]) if row is not None else None
+
+    def decode_row_value(self, key: str, value: bytes) -> Optional[Union[str, dict]]:
+        """
+        :return: the decoded value, or None if the row is corrupt (eg: written by a broken process), which is deleted then.
+        """
+        try:
+            return self.decode_value(value)
+        except (zlib.error, ValueError, TypeError) as e:  # json.JSONDecodeError and UnicodeDecodeError are ValueError.
+            self.warn_error('decode', e)
+
+        try:
+            conn = self.get_connection()
+            with conn:
+                conn.execute('DELETE FROM translation_cache WHERE key = ?', (key,))
+        except sqlite3.OperationalError as e:
+            self.warn_error('delete', e)
+        return None
+
+    def set(self, key: str, value: Union[str, dict], created_time: Optional[float] = None) -> None:
+        now = time.time()
+        created_time = created_time or now
+        value = self.encode_value(value)
+        expire_time = created_time + self.ttl_seconds if self.ttl_seconds is not None else None
+        try:
+            conn = self.get_connection()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO translation_cache (key, value, size, created_time, accessed_time, expire_time) VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, value, len(key.encode('utf-8')) + len(value), created_time, now, expire_time)
+                )
+        except sqlite3.OperationalError as e:
+            self.warn_error('write', e)
+            return
+
+        with self.lock:
+            self.write_count += 1
+            if_vacuum = self.vacuum_after_writes and self.write_count % self.vacuum_after_writes == 0
+        if if_vacuum:
+            try:
+                self.vacuum()
+            except sqlite3.OperationalError as e:
+                self.warn_error('vacuum', e)
+
+    def vacuum(self) -> int:
+        """
+        Delete expired entries, then least recently used ones until the total size fits in `max_bytes`.
+        :return: int, number of deleted entries.
+        """
+        conn = self.get_connection()
+        with conn:
+            n_expired = conn.execute('DELETE FROM translation_cache WHERE expire_time IS NOT NULL AND expire_time <= ?', (time.time(),)).rowcount
+            n_evicted = 0
+            if self.max_bytes is not None:
+                total_bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM translation_cache').fetchone()[0]
+                if total_bytes > self.max_bytes:
+                    excess_bytes, keys = total_bytes - self.max_bytes, []
+                    for key, size in conn.execute('SELECT key, size FROM translation_cache ORDER BY accessed_time'):
+                        if excess_bytes <= 0:
+                            break
+                        keys.append((key,))
+                        excess_bytes -= size
+                    conn.executemany('DELETE FROM translation_cache WHERE key = ?', keys)
+                    n_evicted = len(keys)
+        conn.execute('PRAGMA incremental_vacuum')
+
+        with self.lock:
+            self.expiration_count += n_expired
+            self.eviction_count += n_evicted
+        return n_expired + n_evicted
+
+    def items(self) -> collections.abc.Iterator:
+        rows = self.get_connection().execute(
+            'SELECT key, value, created_time FROM translation_cache WHERE expire_time IS NULL OR expire_time > ?', (time.time(),)
+        )
+        for key, value, created_time in rows:
+            try:
+                value = self.decode_value(value)
+            except (zlib.error, ValueError, TypeError) as e:  # corrupt, skipped.
+                self.warn_error('decode', e)
+                continue
+            yield key, value, created_time
+
+    def delete(self, key: str) -> None:
+        conn = self.get_connection()
+        with conn:
+            conn.execute('DELETE FROM translation_cache WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        conn = self.get_connection()
+        with conn:
+            conn.execute('DELETE FROM translation_cache')
+        conn.execute('PRAGMA incremental_vacuum')
+
+    def __len__(self) -> int:
+        return self.get_connection().execute('SELECT COUNT(*) FROM translation_cache').fetchone()[0]
+
+    def stat(self) -> dict:
+        total_bytes = self.get_connection().execute('SELECT COALESCE(SUM(size), 0) FROM translation_cache').fetchone()[0]
+        return {**super().stat(), 'bytes': total_bytes, 'max_bytes': self.max_bytes, 'error_count': self.error_count, 'cache_path': self.cache_path}
+
+
+class TranslationMemory:
+    def __init__(self,
+                 similarity_threshold: float = 0.85,
+                 ngram_size: int = 3,
+                 num_perm: int = 64,
+                 num_bands: int = 16,
+                 max_entries: int = 100000,
+                 if_serve_fuzzy_match: bool = False,
+                 min_fuzzy_length: int = 10,
+                 ):
+        """
+        Translation memory of former (query_text, result) segments, which serves near-duplicates of them:
+            'exact': the same text, whitespace aside, served.
+            'placeable': only numbers or punctuation differ, served with the numbers of the stored translation replaced.
+            'fuzzy': character n-gram MinHash candidates (LSH banding) with a similarity >= `similarity_threshold`,
+                served only if `if_serve_fuzzy_match`, else flagged as candidates. Texts differing only by case or
+                width (NFKC) are fuzzy matches too, as their translations may differ (eg: "Apple", "apple").
+        :param similarity_threshold: float, default 0.85. Similarity is difflib.SequenceMatcher ratio of normalized texts.
+        :param ngram_size: int, default 3.
+        :param num_perm: int, default 64. Number of MinHash permutations, must be a multiple of `num_bands`.
+        :param num_bands: int, default 16.
+        :param max_entries: int, default 100000. The least recently used segments are evicted beyond it.
+        :param if_serve_fuzzy_match: bool, default False.
+        :param min_fuzzy_length: int, default 10. Shorter texts are matched exactly or as placeables only.
+        """
+        if num_perm % num_bands != 0 or not 0 < similarity_threshold <= 1:
+            raise TranslatorError
+
+        self.similarity_threshold = similarity_threshold
+        self.ngram_size = ngram_size
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.band_rows = num_perm // num_bands
+        self.max_entries = max_entries
+        self.if_serve_fuzzy_match = if_serve_fuzzy_match
+        self.min_fuzzy_length = min_fuzzy_length
+        self.number_pattern = re.compile(r'\d+(?:[.,]\d+)*')
+        self.mersenne_prime = (1 << 61) - 1
+        _random = random.Random(20240101)
+        self.perm_params = [(_random.randrange(1, self.mersenne_prime), _random.randrange(0, self.mersenne_prime)) for _ in range(num_perm)]
+
+        self.max_candidates = 8
+        self.entries = collections.OrderedDict()  # entry_id: (scope, query_text, result, minhash signature or None)
+        self.exact_index = {}  # (scope, text with whitespace collapsed): entry_id
+        self.normalized_index = {}  # (scope, text normalized by NFKC and casefold): entry_id
+        self.placeable_index = {}  # (scope, text without numbers and punctuation): entry_id
+        self.lsh_buckets = collections.defaultdict(set)  # (scope, band, band hash): {entry_id, ...}
+        self.entry_count = 0
+        self.match_counts = {'exact': 0, 'placeable': 0, 'fuzzy': 0, 'candidate': 0, 'miss': 0}
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def get_scope(translator: str, from_language: str, to_language: str, professional_field: Optional[str] = None) -> tuple:
+        return translator, from_language, to_language, professional_field
+
+    @staticmethod
+    def normalize_text(query_text: str) -> str:
+        return ' '.join(unicodedata.normalize('NFKC', query_text).casefold().split())
+
+    @staticmethod
+    def get_exact_text(query_text: str) -> str:
+        return ' '.join(query_text.split())
+
+    def get_signature(self, normalized_text: str) -> Optional[List[int]]:
+        return self.get_minhash(normalized_text) if len(normalized_text) >= self.min_fuzzy_length else None
+
+    def mask_text(self, normalized_text: str) -> str:
+        masked_text = self.number_pattern.sub('0', normalized_text)
+        masked_text = ''.join(c for c in masked_text if not unicodedata.category(c).startswith('P'))
+        return ' '.join(masked_text.split())
+
+    def get_minhash(self, normalized_text: str) -> List[int]:
+        n = self.ngram_size
+        text = normalized_text if len(normalized_text) >= n else normalized_text.ljust(n)
+        shingles = {zlib.crc32(text[i:i + n].encode('utf-8')) for i in range(len(text) - n + 1)}
+        p = self.mersenne_prime
+        return [min((a * x + b) % p for x in shingles) for a, b in self.perm_params]
+
+    def get_band_keys(self, scope: tuple, signature: Optional[List[int]]) -> List[tuple]:
+        if signature is None:
+            return []
+        r = self.band_rows
+        return [(scope, i, hash(tuple(signature[i * r:(i + 1) * r]))) for i in range(self.num_bands)]
+
+    def add(self, translator: str, from_language: str, to_language: str, query_text: str, result: str, professional_field: Optional[str] = None) -> None:
+        """
+        Store a translated segment, only results of str (not detail results) are stored.
+        """
+        if not (isinstance(query_text, str) and isinstance(result, str) and query_text.strip()):
+            return
+
+        scope = self.get_scope(translator, from_language, to_language, professional_field)
+        exact_text = self.get_exact_text(query_text)
+        normalized_text = self.normalize_text(query_text)
+        signature = self.get_signature(normalized_text)
+        with self.lock:
+            old_entry_id = self.exact_index.get((scope, exact_text))
+            if old_entry_id is not None:
+                self.remove_entry(old_entry_id)
+
+            self.entry_count += 1
+            entry_id = self.entry_count
+            self.entries[entry_id] = (scope, query_text, result, signature)
+            self.exact_index[(scope, exact_text)] = entry_id
+            self.normalized_index[(scope, normalized_text)] = entry_id
+            self.placeable_index[(scope, self.mask_text(exact_text))] = entry_id
+            for band_key in self.get_band_keys(scope, signature):
+                self.lsh_buckets[band_key].add(entry_id)
+
+            while len(self.entries) > self.max_entries:
+                self.remove_entry(next(iter(self.entries)))
+
+    def remove_entry(self, entry_id: int) -> None:
+        scope, query_text, _, signature = self.entries.pop(entry_id)
+        exact_text = self.get_exact_text(query_text)
+        for index, index_key in (
+            (self.exact_index, (scope, exact_text)),
+            (self.normalized_index, (scope, self.normalize_text(query_text))),
+            (self.placeable_index, (scope, self.mask_text(exact_text))),
+        ):
+            if index.get(index_key) == entry_id:
+                del index[index_key]
+        for band_key in self.get_band_keys(scope, signature):
+            bucket = self.lsh_buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self.lsh_buckets[band_key]
+
+    def adapt_placeable(self, stored_text: str, stored_result: str, query_text: str) -> Optional[str]:
+        """
+        Reuse the translation of a segment which differs from `query_text` only by numbers and punctuation.
+        :return: str or None if the numbers of the stored text can not be located in its translation.
+        """
+        stored_numbers = self.number_pattern.findall(stored_text)
+        query_numbers = self.number_pattern.findall(query_text)
+        if len(stored_numbers) != len(query_numbers):
+            return None
+
+        result_parts, rest = [], stored_result
+        for stored_number, query_number in zip(stored_numbers, query_numbers):
+            i = rest.find(stored_number)
+            if i < 0:
+                return None
+            result_parts.extend([rest[:i], query_number])
+            rest = rest[i + len(stored_number):]
+        result = ''.join(result_parts + [rest])
+
+        stored_end, query_end = stored_text.rstrip()[-1:], query_text.rstrip()[-1:]
+        if stored_end != query_end and result.rstrip()[-1:] == stored_end and unicodedata.category(stored_end or ' ').startswith('P'):
+            result = result.rstrip()[:-1] + (query_end if unicodedata.category(query_end or ' ').startswith('P') else '')
+        return result
+
+    def search(self, translator: str, from_language: str, to_language: str, query_text: str, professional_field: Optional[str] = None, top_k: int = 3) -> List[dict]:
+        """
+        Candidates sharing a LSH band are ranked by the Jaccard similarity estimated from MinHash signatures,
+        and only the best `self.max_candidates` of them are compared exactly.
+        :return: list, [{'query_text', 'result', 'similarity'}, ...] of stored segments above `similarity_threshold`, most similar first.
+        """
+        scope = self.get_scope(translator, from_language, to_language, professional_field)
+        normalized_text = self.normalize_text(query_text)
+        signature = self.get_signature(normalized_text) if self.lsh_buckets else None
+        if signature is None:
+            return []
+        with self.lock:
+            entry_ids = set().union(*(self.lsh_buckets.get(band_key, ()) for band_key in self.get_band_keys(scope, signature)))
+            entries = [self.entries[i] for i in entry_ids if i in self.entries]
+
+        get_jaccard = lambda entry: sum(1 for x, y in zip(signature, entry[3]) if x == y)
+        entries = sorted(entries, key=get_jaccard, reverse=True)[:self.max_candidates]
+
+        candidates = []
+        for _, stored_text, stored_result, _ in entries:
+            similarity = difflib.SequenceMatcher(None, normalized_text, self.normalize_text(stored_text), autojunk=False).ratio()
+            if similarity >= self.similarity_threshold:
+                candidates.append({'query_text': stored_text, 'result': stored_result, 'similarity': round(similarity, 4)})
+        return sorted(candidates, key=lambda x: -x['similarity'])[:top_k]
+
+    def lookup(self, translator: str, from_language: str, to_language: str, query_text: str, professional_field: Optional[str] = None) -> Optional[dict]:
+        """
+        :return: dict or None, {'query_text', 'result', 'similarity', 'match_type', 'if_served'} of the best stored segment.
+                Its `result` is usable as the translation of `query_text` only if `if_served`.
+        """
+        if not (isinstance(query_text, str) and query_text.strip()):
+            return None
+        if not self.entries:
+            with self.lock:
+                self.match_counts['miss'] += 1
+            return None
+
+        scope = self.get_scope(translator, from_language, to_language, professional_field)
+        exact_text = self.get_exact_text(query_text)
+        with self.lock:
+            for match_type, index_key in (('exact', (scope, exact_text)), ('placeable', (scope, self.mask_text(exact_text)))):
+                entry_id = self.exact_index.get(index_key) if match_type == 'exact' else self.placeable_index.get(index_key)
+                if entry_id is None:
+                    continue
+
+                _, stored_text, stored_result, _ = self.entries[entry_id]
+                result = stored_result if match_type == 'exact' else self.adapt_placeable(stored_text, stored_result, query_text)
+                if result is not None:
+                    self.entries.move_to_end(entry_id)
+                    self.match_counts[match_type] += 1
+                    return {'query_text': stored_text, 'result': result, 'similarity': 1.0, 'match_type': match_type, 'if_served': True}
+
+            entry_id = self.normalized_index.get((scope, self.normalize_text(query_text)))  # only case or width differs.
+            if entry_id is not None:
+                _, stored_text, stored_result, _ = self.entries[entry_id]
+                candidates = [{'query_text': stored_text, 'result': stored_result, 'similarity': 1.0}]
+
+        if entry_id is None:
+            candidates = self.search(translator, from_language, to_language, query_text, professional_field, top_k=1)
+        with self.lock:
+            if not candidates:
+                self.match_counts['miss'] += 1
+                return None
+
+            if_served = self.if_serve_fuzzy_match
+            self.match_counts['fuzzy' if if_served else 'candidate'] += 1
+            return {**candidates[0], 'match_type': 'fuzzy', 'if_served': if_served}
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.exact_index.clear()
+            self.normalized_index.clear()
+            self.placeable_index.clear()
+            self.lsh_buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def stat(self) -> dict:
+        with self.lock:
+            n_request = sum(self.match_counts.values())
+            n_served = sum(self.match_counts[k] for k in ('exact', 'placeable', 'fuzzy'))
+            return {
+                'entries': len(self.entries),
+                **self.match_counts,
+                'served_rate': round(n_served / n_request, 4) if n_request else None,
+            }
+
+
+class LeaderAbortedError(Exception):
+    """
+    The leader of a single-flight call was cancelled or interrupted, a follower runs the call instead.
+    """
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Coalesce identical calls in flight: the first caller of a key runs the call, later callers of the same key
+        wait for its result (or exception) instead of running it again. If the first caller is cancelled or
+        interrupted, the call is not shared: a waiting caller takes over and runs it.
+        """
+        self.calls = {}
+        self.async_calls = {}
+        self.call_count = 0
+        self.shared_count = 0
+        self.handover_count = 0
+        self.neutral_kwargs = ('if_show_time_stat', 'show_time_stat_precision', 'if_print_warning', 'sleep_seconds')
+        self.lock = threading.Lock()
+
+    def get_call_key(self, cache_key: str, api_kwargs: dict, **flags: bool) -> str:
+        """
+        Calls are identical only with the same settings (eg: timeout, proxies, http_client, reset_host_url, if_use_cache).
+        """
+        settings = {k: v for k, v in api_kwargs.items() if k not in self.neutral_kwargs}
+        return json.dumps([cache_key, flags, settings], sort_keys=True, ensure_ascii=False, default=repr)
+
+    def do(self, key: str, func: callable):
+        while True:
+            with self.lock:
+                future = self.calls.get(key)
+                if_leader = future is None
+                if if_leader:
+                    future = self.calls[key] = concurrent.futures.Future()
+                    self.call_count += 1
+                else:
+                    self.shared_count += 1
+
+            if if_leader:
+                break
+            try:
+                return self.copy_result(future.result())
+            except LeaderAbortedError:
+                with self.lock:
+                    self.shared_count -= 1
+                    self.handover_count += 1
+
+        try:
+            result = func()
+        except Exception as e:
+            self.forget(self.calls, key)
+            future.set_exception(e)
+            raise
+        except BaseException:
+            self.forget(self.calls, key)
+            future.set_exception(LeaderAbortedError())
+            raise
+        self.forget(self.calls, key)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: str, coro_func: callable):
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        while True:
+            with self.lock:
+                future = self.async_calls.get(key)
+                if_leader = future is None
+                if if_leader:
+                    future = self.async_calls[key] = loop.create_future()
+                    self.call_count += 1
+                else:
+                    self.shared_count += 1
+
+            if if_leader:
+                break
+            try:
+                return self.copy_result(await asyncio.shield(future))
+            except LeaderAbortedError:
+                with self.lock:
+                    self.shared_count -= 1
+                    self.handover_count += 1
+
+        try:
+            result = await coro_func()
+        except Exception as e:
+            self.forget(self.async_calls, key)
+            future.set_exception(e)
+            _ = future.exception()  # retrieved, even if no one else waits for it.
+            raise
+        except BaseException:  # eg: asyncio.CancelledError of the leader only, the followers are not cancelled.
+            self.forget(self.async_calls, key)
+            future.set_exception(LeaderAbortedError())
+            _ = future.exception()
+            raise
+        self.forget(self.async_calls, key)
+        future.set_result(result)
+        return result
+
+    def forget(self, calls: dict, key: Union[str, tuple]) -> None:
+        # before the outcome is set, so that a follower taking over creates a new call.
+        with self.lock:
+            calls.pop(key, None)
+
+    @staticmethod
+    def copy_result(result: Union[str, dict]) -> Union[str, dict]:
+        return copy.deepcopy(result) if isinstance(result, dict) else result
+
+    def stat(self) -> dict:
+        with self.lock:
+            return {
+                'in_flight': len(self.calls) + len(self.async_calls),
+                'call': self.call_count,
+                'shared': self.shared_count,
+                'handover': self.handover_count,
+            }
+
+
+class TranslatorsRegistry(collections.abc.MutableMapping):
+    def __init__(self, create_translator, translators: collections.abc.Iterable):
+        """
+        Mapping of translator name to translator instance, which is created on first access only.
+        :param create_translator: callable, must. Create the instance by name.
+        :param translators: Iterable[str], must. Names of supported translators.
+        """
+        self.create_translator = create_translator
+        self.translators = tuple(translators)
+        self.instances = {}
+        self.lock = threading.Lock()
+
+    def __getitem__(self, translator: str) -> Tse:
+        try:
+            return self.instances[translator]
+        except KeyError:
+            if translator not in self.translators:
+                raise
+
+        with self.lock:
+            if translator not in self.instances:
+                self.instances[translator] = self.create_translator(translator)
+            return self.instances[translator]
+
+    def __setitem__(self, translator: str, instance: Tse) -> None:
+        if translator not in self.translators:
+            raise KeyError(translator)
+        self.instances[translator] = instance
+
+    def __delitem__(self, translator: str) -> None:
+        del self.instances[translator]  # created again on next access.
+
+    def __contains__(self, translator: str) -> bool:
+        return translator in self.translators
+
+    def __iter__(self):
+        return iter(self.translators)
+
+    def __len__(self) -> int:
+        return len(self.translators)
+
+    def loaded_items(self) -> List[Tuple[str, Tse]]:
+        return list(self.instances.items())
+
+
+class LazyTranslator:
+    def __init__(self, translators_dict: TranslatorsRegistry, translator: str):
+        """
+        Stand-in for a translator instance of the module (eg: `translators.server._bing`), so that neither an import
+        nor `from translators.server import *` creates it. Attributes are those of the current instance in
+        `translators_dict`, created on first access, also after it is replaced (eg: by SessionRenewer).
+        """
+        object.__setattr__(self, '_translators_dict', translators_dict)
+        object.__setattr__(self, '_translator', translator)
+
+    def __getattr__(self, name: str):
+        return getattr(self._translators_dict[self._translator], name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._translators_dict[self._translator], name, value)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} of {self._translator}>'
+
+
+class SessionPool:
+    def __init__(self, translator: Tse, pool_size: int = 4, pool_strategy: str = 'round_robin'):
+        """
+        Pool of independently bootstrapped copies of a translator, each one with its own session and tokens.
+        A member is leased to one thread at a time, so callers beyond `pool_size` wait for a member to be released.
+        :param translator: Tse, must. It is reused as the first member to keep its warm session.
+        :param pool_size: int, default 4.
+        :param pool_strategy: str, default 'round_robin', choose from ("round_robin", "least_loaded").
+                'round_robin': the next idle member after the last leased one.
+                'least_loaded': the idle member leased the fewest times.
+        """
+        if pool_size < 1 or pool_strategy not in ('round_robin', 'least_loaded'):
+            raise TranslatorError
+
+        self.pool_size = pool_size
+        self.pool_strategy = pool_strategy
+        self.translators = [translator] + [translator.clone() for _ in range(pool_size - 1)]
+        self.in_flight = [0] * pool_size
+        self.lease_count = [0] * pool_size
+        self.wait_count = 0
+        self.cursor = 0
+        self.lock = threading.Lock()
+        self.released = threading.Condition(self.lock)
+
+    def acquire(self) -> int:
+        with self.released:
+            idle = [(self.cursor + i) % self.pool_size for i in range(self.pool_size) if not self.in_flight[(self.cursor + i) % self.pool_size]]
+            if not idle:
+                self.wait_count += 1
+            while not idle:
+                self.released.wait()
+                idle = [(self.cursor + i) % self.pool_size for i in range(self.pool_size) if not self.in_flight[(self.cursor + i) % self.pool_size]]
+
+            index = min(idle, key=lambda i: self.lease_count[i]) if self.pool_strategy == 'least_loaded' else idle[0]
+            self.cursor = (index + 1) % self.pool_size
+            self.in_flight[index] += 1
+            self.lease_count[index] += 1
+            return index
+
+    def release(self, index: int) -> None:
+        with self.released:
+            self.in_flight[index] -= 1
+            self.released.notify()
+
+    @contextlib.contextmanager
+    def lease(self):
+        index = self.acquire()
+        try:
+            yield self.translators[index]
+        finally:
+            self.release(index)
+
+    def stat(self) -> dict:
+        with self.lock:
+            return {
+                'pool_size': self.pool_size,
+                'pool_strategy': self.pool_strategy,
+                'in_flight': list(self.in_flight),
+                'lease_count': list(self.lease_count),
+                'wait_count': self.wait_count,
+            }
+
+
+class SessionRenewer:
+    def __init__(self, server: 'TranslatorsServer', check_interval: float = 10.0, renew_ratio: float = 0.8, renew_margin_seconds: float = 60.0):
+        """
+        Background thread that warms up the next session of every active translator before the current one expires,
+        then swaps it in, so that no user request pays for the bootstrap (host page, js, tokens, language_map).
+        A session is due when `renew_ratio` of `update_session_after_freq` or `update_session_after_seconds` is used,
+        or `renew_margin_seconds` before the real token expiry exposed by the translator (eg: bing, caiyun).
+        Translators in the 'thread' concurrency mode are not renewed as their sessions belong to their threads.
+        :param server: TranslatorsServer, must.
+        :param check_interval: float, default 10.0.
+        :param renew_ratio: float, default 0.8.
+        :param renew_margin_seconds: float, default 60.0.
+        """
+        self.server_ref = weakref.ref(server)
+        self.check_interval = check_interval
+        self.renew_ratio = renew_ratio
+        self.renew_margin_seconds = renew_margin_seconds
+        self.renew_count = 0
+        self.failure_count = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name='translators-session-renewer', daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def run(self) -> None:
+        while not self.stop_event.wait(self.check_interval):
+            server = self.server_ref()
+            if server is None:
+                return
+            self.renew_all(server)
+            del server
+
+    def is_due(self, translator: Tse, api_kwargs: dict) -> bool:
+        update_session_after_freq = api_kwargs.get('update_session_after_freq', translator.default_session_freq)
+        update_session_after_seconds = api_kwargs.get('update_session_after_seconds', translator.default_session_seconds)
+
+        renew_time = translator.begin_time + update_session_after_seconds * self.renew_ratio
+        expire_time = translator.get_session_expire_time()
+        if expire_time:
+            renew_time = min(renew_time, expire_time - self.renew_margin_seconds)
+        return time.time() >= renew_time or translator.query_count >= update_session_after_freq * self.renew_ratio
+
+    def renew_all(self, server: 'TranslatorsServer') -> None:
+        for _ts, translator, swap in server.get_renewable_sessions():
+            api_kwargs = server.api_kwargs_dict.get(_ts)
+            if api_kwargs is None or not translator.session or not self.is_due(translator, api_kwargs):
+                continue
+
+            new_translator = translator.clone()
+            try:
+                _ = server._test_translate(_ts, translator=new_translator, **api_kwargs)
+            except Exception:
+                self.failure_count += 1  # keep the current session, its inline update still works.
+                continue
+
+            # the clone bootstraps without the credential cache, so that it does not restore the session it renews.
+            new_translator.if_use_credential_cache = translator.if_use_credential_cache
+            if new_translator.if_use_credential_cache:
+                new_translator.dump_cached_credential(new_translator.get_cache_name(api_kwargs))
+            swap(new_translator)
+            self.renew_count += 1
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 30.0, ignored_exceptions: tuple = (TranslatorInputError,)):
+        """
+        Circuit breaker of a translator. It opens after `failure_threshold` consecutive failures, then calls fail fast
+        with CircuitOpenError during `cooldown_seconds`, after which it is half-open: one probe call goes through,
+        closing the circuit on success or opening it again on failure.
+        :param failure_threshold: int, default 5.
+        :param cooldown_seconds: float, default 30.0.
+        :param ignored_exceptions: tuple, default (TranslatorInputError,). Errors of the caller (eg: unsupported language,
+                too long query_text), neither failures nor successes.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.ignored_exceptions = ignored_exceptions
+        self.state = 'closed'
+        self.failure_count = 0
+        self.opened_time = None
+        self.if_probing = False
+        self.last_error = None
+        self.open_count = 0
+        self.rejection_count = 0
+        self.lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self.lock:
+            if self.state == 'closed':
+                return
+
+            if not self.if_probing and time.time() - self.opened_time >= self.cooldown_seconds:
+                self.state = 'half_open'
+                self.if_probing = True
+                return
+
+            self.rejection_count += 1
+            retry_seconds = max(0.0, self.opened_time + self.cooldown_seconds - time.time())
+            raise CircuitOpenError(f'The circuit is {self.state} after {self.failure_count} failures (last: {self.last_error}), retry in {retry_seconds:.1f}s.')
+
+    def on_success(self) -> None:
+        with self.lock:
+            self.state = 'closed'
+            self.failure_count = 0
+            self.opened_time = None
+            self.if_probing = False
+
+    def on_abort(self) -> None:
+        # cancelled or interrupted (eg: asyncio.CancelledError, KeyboardInterrupt): neither a failure nor a success.
+        with self.lock:
+            self.if_probing = False
+
+    def on_failure(self, error: Exception) -> None:
+        with self.lock:
+            if isinstance(error, self.ignored_exceptions):
+                self.if_probing = False
+                return
+
+            self.failure_count += 1
+            self.last_error = f'{error.__class__.__name__}: {error}'
+            if self.state == 'half_open' or self.failure_count >= self.failure_threshold:
+                if self.state != 'open':
+                    self.open_count += 1
+                self.state = 'open'
+                self.opened_time = time.time()
+                self.if_probing = False
+
+    @contextlib.contextmanager
+    def guard(self):
+        self.before_call()
+        try:
+            yield
+        except Exception as e:
+            self.on_failure(e)
+            raise
+        except BaseException:
+            self.on_abort()
+            raise
+        else:
+            self.on_success()
+
+    def stat(self) -> dict:
+        with self.lock:
+            return {
+                'state': self.state,
+                'failure': self.failure_count,
+                'open': self.open_count,
+                'rejection': self.rejection_count,
+                'last_error': self.last_error,
+            }
+
+
+class TranslatorsServer:
+    def __init__(self):
+        self.cpu_cnt = os.cpu_count()
+        self.concurrency_mode = os.environ.get('translators_concurrency_mode', None) or 'shared'
+        self.session_pool_size = int(os.environ.get('translators_session_pool_size', None) or 4)
+        self.session_pool_strategy = 'round_robin'
+        self._thread_local = threading.local()
+        self._session_pools = {}
+        self._session_pools_lock = threading.Lock()
+        self._executor = None
+        self._executor_max_workers = 0
+        self._executor_lock = threading.Lock()
+        self.api_kwargs_dict = {}
+        self.session_renewer = None
+        self.circuit_breaker_kwargs = None
+        self._circuit_breakers = {}
+        self._circuit_breakers_lock = threading.Lock()
+        self.translation_cache = None
+        self.translation_memory = None
+        self.single_flight = SingleFlight()
+        self._region = Region()
+        self._server_region = None
+        self._server_region_lock = threading.Lock()
+        self.get_region_of_server = self._region.get_region_of_server
+        self.translators_class_dict = {
+            'alibaba': AlibabaV2, 'apertium': Apertium, 'argos': Argos, 'baidu': BaiduV1, 'bing': Bing, 'caiyun': Caiyun,
+            'cloudTranslation': cloudTranslationV2, 'deepl': Deepl, 'elia': Elia, 'google': GoogleV2, 'hujiang': Hujiang, 'iciba': Iciba,
+            'iflytek': IflytekV2, 'iflyrec': Iflyrec, 'itranslate': Itranslate, 'judic': Judic, 'languageWire': LanguageWire,
+            'lingvanex': LingvanexV2, 'niutrans': NiutransV2, 'mglip': Mglip, 'mirai': Mirai, 'modernMt': ModernMt, 'myMemory': MyMemory,
+            'papago': Papago, 'qqFanyi': QQFanyi, 'qqTranSmart': QQTranSmart, 'reverso': Reverso, 'sogou': Sogou, 'sysTran': SysTran, 'tilde': Tilde,
+            'translateCom': TranslateCom, 'translateMe': TranslateMe, 'utibet': Utibet, 'volcEngine': VolcEngine, 'yandex': YandexV2,
+            'yeekit': Yeekit, 'youdao': YoudaoV3,
+        }  # baidu: BaiduV1 or BaiduV2.
+        self.server_region_translators = ('bing', 'google')
+        self._translators_dict = TranslatorsRegistry(self.create_translator, self.translators_class_dict.keys())
+        self._async_translators_dict = TranslatorsRegistry(self.create_translator, ('bing', 'deepl', 'google'))
+        self.alibaba = self.get_translator_api('alibaba')
+        self.apertium = self.get_translator_api('apertium')
+        self.argos = self.get_translator_api('argos')
+        self.baidu = self.get_translator_api('baidu')
+        self.bing = self.get_translator_api('bing')
+        self.caiyun = self.get_translator_api('caiyun')
+        self.cloudTranslation = self.get_translator_api('cloudTranslation')
+        self.deepl = self.get_translator_api('deepl')
+        self.elia = self.get_translator_api('elia')
+        self.google = self.get_translator_api('google')
+        self.hujiang = self.get_translator_api('hujiang')
+        self.iciba = self.get_translator_api('iciba')
+        self.iflytek = self.get_translator_api('iflytek')
+        self.iflyrec = self.get_translator_api('iflyrec')
+        self.itranslate = self.get_translator_api('itranslate')
+        self.judic = self.get_translator_api('judic')
+        self.languageWire = self.get_translator_api('languageWire')
+        self.lingvanex = self.get_translator_api('lingvanex')
+        self.niutrans = self.get_translator_api('niutrans')
+        self.mglip = self.get_translator_api('mglip')
+        self.mirai = self.get_translator_api('mirai')
+        self.modernMt = self.get_translator_api('modernMt')
+        self.myMemory = self.get_translator_api('myMemory')
+        self.papago = self.get_translator_api('papago')
+        self.qqFanyi = self.get_translator_api('qqFanyi')
+        self.qqTranSmart = self.get_translator_api('qqTranSmart')
+        self.reverso = self.get_translator_api('reverso')
+        self.sogou = self.get_translator_api('sogou')
+        self.sysTran = self.get_translator_api('sysTran')
+        self.tilde = self.get_translator_api('tilde')
+        self.translateCom = self.get_translator_api('translateCom')
+        self.translateMe = self.get_translator_api('translateMe')
+        self.utibet = self.get_translator_api('utibet')
+        self.volcEngine = self.get_translator_api('volcEngine')
+        self.yandex = self.get_translator_api('yandex')
+        self.yeekit = self.get_translator_api('yeekit')
+        self.youdao = self.get_translator_api('youdao')
+        self.translators_dict = {
             'alibaba': self.alibaba, 'apertium': self.apertium, 'argos': self.argos, 'baidu': self.baidu, 'bing': self.bing,
             'caiyun': self.caiyun, 'cloudTranslation': self.cloudTranslation, 'deepl': self.deepl, 'elia': self.elia, 'google': self.google,
             'hujiang': self.hujiang, 'iciba': self.iciba, 'iflytek': self.iflytek, 'iflyrec': self.iflyrec, 'itranslate': self.itranslate,
@@ -5732,13 +8634,264 @@ class TranslatorsServer:
             'yeekit': self.yeekit, 'youdao': self.youdao,
         }
         self.translators_pool = list(self.translators_dict.keys())
+        self.batch_translators_dict = {_ts: self.get_translator_api(_ts, f'{_ts}_batch_api') for _ts in ('caiyun', 'deepl', 'google')}
+        self.translators_async_dict = {_ts: self.get_translator_async_api(_ts) for _ts in self.translators_pool}
+        for _ts, _async_api in self.translators_async_dict.items():
+            setattr(self, f'{_ts}_async', _async_api)
+
         self.not_en_langs = {'utibet': 'ti', 'mglip': 'mon'}
         self.not_zh_langs = {'languageWire': 'fr', 'tilde': 'fr', 'elia': 'fr', 'apertium': 'spa', 'judic': 'de'}
+        self.line_break_lost_translators = ('deepl', 'google')  # sentences of the result are joined by ' '.
         self.pre_acceleration_label = 0
         self.example_query_text = '你好。\n欢迎你！'
         self.success_translators_pool = []
         self.failure_translators_pool = []
 
+        if self.concurrency_mode not in ('shared', 'thread', 'pool'):
+            raise TranslatorError(f'Unsupported concurrency_mode[{self.concurrency_mode}] in ("shared", "thread", "pool").')
+
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=functools.partial(self._reset_after_fork_in_child, weakref.ref(self)))
+
+    @property
+    def server_region(self) -> str:
+        """
+        Region of server backend, looked up on first use by bing() or google() only, not at `import translators`.
+        """
+        if self._server_region is None:
+            with self._server_region_lock:
+                if self._server_region is None:
+                    try:
+                        self._server_region = self.get_region_of_server(if_print_region=False)
+                    except TranslatorError as e:
+                        warnings.warn(f'{str(e)}\nUsing region EN server backend instead.')
+                        self._server_region = 'EN'
+        return self._server_region
+
+    @server_region.setter
+    def server_region(self, region: str) -> None:
+        self._server_region = region
+
+    def __getattr__(self, name: str):
+        # `_bing`, `_bing_async`, etc are created on first access only.
+        if name[:1] == '_' and name[-6:] == '_async' and name[1:-6] in self.__dict__.get('_async_translators_dict', ()):
+            return self._async_translators_dict[name[1:-6]]
+        if name[:1] == '_' and name[1:] in self.__dict__.get('_translators_dict', ()):
+            return self._translators_dict[name[1:]]
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def create_translator(self, translator: str) -> Tse:
+        translator_class = self.translators_class_dict[translator]
+        if translator in self.server_region_translators:
+            return translator_class(server_region=self.server_region)
+        return translator_class()
+
+    @staticmethod
+    def _reset_after_fork_in_child(server_ref: weakref.ref) -> None:
+        server = server_ref()
+        if server is not None:
+            server.reset_sessions()
+
+    def reset_sessions(self) -> None:
+        """
+        Drop every session, eg: in a forked worker, whose connections must not be shared with the parent process.
+        """
+        self._thread_local = threading.local()
+        with self._session_pools_lock:
+            self._session_pools = {}
+        self._executor_lock = threading.Lock()
+        self._executor, self._executor_max_workers = None, 0  # its threads do not exist in the child.
+        for _, _translator in self._translators_dict.loaded_items() + self._async_translators_dict.loaded_items():
+            _translator.session = None
+            _translator.bootstrap_lock = threading.RLock()  # it may be held by a thread which does not exist in the child.
+            _translator.count_lock = threading.Lock()
+            _translator.async_loop = None  # asyncio.Lock and httpx.AsyncClient are bound to the event loop of the parent.
+            _translator.async_lock = None
+            _translator.async_close_tasks = set()
+
+    async def close_async_sessions(self) -> None:
+        """
+        Close the httpx.AsyncClient of every asynchronous translator, eg: before the event loop of the caller ends.
+        """
+        for _, _translator in self._async_translators_dict.loaded_items():
+            await _translator.aclose()
+
+    def set_concurrency_mode(self, mode: str = 'shared', pool_size: Optional[int] = None, pool_strategy: Optional[str] = None) -> None:
+        """
+        Set how translators are shared among threads. Also settable by `os.environ["translators_concurrency_mode"]`.
+        :param mode: str, default 'shared', choose from ("shared", "thread", "pool").
+                'shared': all threads use one translator instance, whose session state is not thread-safe.
+                'thread': every thread uses its own copy of the session state, `language_map` is still shared.
+                'pool': every translator dispatches calls over a pool of `pool_size` independently bootstrapped sessions,
+                        each one leased to a single thread at a time, other threads wait until one is released.
+        :param pool_size: Optional[int], default None. Keep the current one(4, or `os.environ["translators_session_pool_size"]`).
+        :param pool_strategy: Optional[str], default None. Keep the current one('round_robin'), choose from ("round_robin", "least_loaded").
+        :return: None
+        """
+        if mode not in ('shared', 'thread', 'pool'):
+            raise TranslatorError(f'Unsupported concurrency_mode[{mode}] in ("shared", "thread", "pool").')
+        if pool_strategy not in (None, 'round_robin', 'least_loaded') or (pool_size is not None and pool_size < 1):
+            raise TranslatorError
+
+        self.concurrency_mode = mode
+        self.session_pool_size = pool_size or self.session_pool_size
+        self.session_pool_strategy = pool_strategy or self.session_pool_strategy
+        self._thread_local = threading.local()
+        with self._session_pools_lock:
+            self._session_pools = {}
+
+    def get_session_pool(self, translator: str) -> SessionPool:
+        with self._session_pools_lock:
+            if translator not in self._session_pools:
+                self._session_pools[translator] = SessionPool(self._translators_dict[translator], self.session_pool_size, self.session_pool_strategy)
+            return self._session_pools[translator]
+
+    def get_executor(self, max_workers: int) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Thread pool kept by the server across batches, so that its threads are reused instead of started again on every
+        call, and so are their own sessions in the 'thread' concurrency mode. It only grows to the largest `max_workers`.
+        """
+        with self._executor_lock:
+            if self._executor is None or self._executor_max_workers < max_workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='translators-batch')
+                self._executor_max_workers = max_workers
+            return self._executor
+
+    def get_translator(self, translator: str) -> Tse:
+        """
+        Translator instance serving the current thread under `self.concurrency_mode`.
+        """
+        _translator = self._translators_dict[translator]
+        if self.concurrency_mode == 'thread':
+            local_translators = self._thread_local.__dict__.setdefault('translators', {})
+            if translator not in local_translators:
+                local_translators[translator] = _translator.clone()
+            return local_translators[translator]
+        return _translator
+
+    def get_translator_api(self, translator: str, api_name: Optional[str] = None):
+        api_name = api_name or f'{translator}_api'
+
+        @functools.wraps(getattr(self.translators_class_dict[translator], api_name))
+        def _api(*args, **kwargs):
+            self.api_kwargs_dict[translator] = {k: v for k, v in kwargs.items() if k not in ('query_text', 'from_language', 'to_language')}
+            with self.guard_circuit(translator):
+                if self.concurrency_mode == 'pool':
+                    with self.get_session_pool(translator).lease() as _translator:
+                        return getattr(_translator, api_name)(*args, **kwargs)
+                return getattr(self.get_translator(translator), api_name)(*args, **kwargs)
+        return _api
+
+    def get_translator_async_api(self, translator: str):
+        api_name = f'{translator}_api_async'
+        if translator not in self._async_translators_dict:
+            return self.get_async_api(self.translators_dict[translator])
+
+        @functools.wraps(getattr(self.translators_class_dict[translator], api_name))
+        async def _async_api(*args, **kwargs):
+            with self.guard_circuit(translator):
+                return await getattr(self._async_translators_dict[translator], api_name)(*args, **kwargs)
+        return _async_api
+
+    def set_circuit_breaker(self, failure_threshold: Optional[int] = 5, cooldown_seconds: float = 30.0, ignored_exceptions: tuple = (TranslatorInputError,)) -> None:
+        """
+        Guard every translator with its own CircuitBreaker, so that a broken translator (captcha, blocked ip, changed page)
+        fails fast with CircuitOpenError instead of bootstrapping and timing out again on each call.
+        :param failure_threshold: Optional[int], default 5. None disables circuit breakers.
+        :param cooldown_seconds: float, default 30.0.
+        :param ignored_exceptions: tuple, default (TranslatorInputError,).
+        :return: None
+        """
+        with self._circuit_breakers_lock:
+            self._circuit_breakers = {}
+            self.circuit_breaker_kwargs = None if failure_threshold is None else {
+                'failure_threshold': failure_threshold,
+                'cooldown_seconds': cooldown_seconds,
+                'ignored_exceptions': ignored_exceptions,
+            }
+
+    def get_circuit_breaker(self, translator: str) -> Optional[CircuitBreaker]:
+        if self.circuit_breaker_kwargs is None:
+            return None
+
+        with self._circuit_breakers_lock:
+            if self.circuit_breaker_kwargs is None:
+                return None
+            if translator not in self._circuit_breakers:
+                self._circuit_breakers[translator] = CircuitBreaker(**self.circuit_breaker_kwargs)
+            return self._circuit_breakers[translator]
+
+    def guard_circuit(self, translator: str):
+        circuit_breaker = self.get_circuit_breaker(translator)
+        return circuit_breaker.guard() if circuit_breaker else contextlib.nullcontext()
+
+    def get_circuit_breaker_stat(self) -> dict:
+        with self._circuit_breakers_lock:
+            return {_ts: circuit_breaker.stat() for _ts, circuit_breaker in self._circuit_breakers.items()}
+
+    def set_translation_cache(self, cache: Optional[TranslationCache] = None) -> None:
+        """
+        Cache results of translate_text(), translate_batch() and translate_html(), keyed by
+        (translator, from_language, to_language, professional_field, is_detail_result, normalized query_text).
+        Eg: `set_translation_cache(MemoryTranslationCache(max_entries=10000, max_bytes=64 * 2 ** 20, ttl_seconds=86400))`,
+        then `translation_cache.stat()` gives hit, miss and eviction counts.
+        :param cache: Optional[TranslationCache], default None. None disables caching.
+        :return: None
+        """
+        if cache is not None and not isinstance(cache, TranslationCache):
+            raise TranslatorError
+        self.translation_cache = cache
+
+    def set_translation_memory(self, memory: Optional[TranslationMemory] = None) -> None:
+        """
+        Serve near-duplicates of former segments in translate_text(), translate_batch() and translate_html() from a
+        translation memory, in front of the translation cache. Eg: `set_translation_memory(TranslationMemory(similarity_threshold=0.85))`,
+        then translate_batch() flags fuzzy candidates in 'memory_match' of its data.
+        :param memory: Optional[TranslationMemory], default None. None disables it.
+        :return: None
+        """
+        if memory is not None and not isinstance(memory, TranslationMemory):
+            raise TranslatorError
+        self.translation_memory = memory
+
+    def get_renewable_sessions(self) -> List[Tuple[str, Tse, callable]]:
+        """
+        :return: list, [(translator, instance, swap function that replaces the instance atomically), ...]
+        """
+        def _swap_shared(_ts: str, new_translator: Tse) -> None:
+            self._translators_dict[_ts] = new_translator
+
+        def _swap_pool(pool: SessionPool, index: int, new_translator: Tse) -> None:
+            pool.translators[index] = new_translator
+
+        if self.concurrency_mode == 'shared':
+            return [(_ts, _translator, functools.partial(_swap_shared, _ts)) for _ts, _translator in self._translators_dict.loaded_items()]
+        if self.concurrency_mode == 'pool':
+            with self._session_pools_lock:
+                pools = list(self._session_pools.items())
+            return [(_ts, _translator, functools.partial(_swap_pool, pool, i)) for _ts, pool in pools for i, _translator in enumerate(list(pool.translators))]
+        return []
+
+    def start_session_renewer(self, check_interval: float = 10.0, renew_ratio: float = 0.8, renew_margin_seconds: float = 60.0) -> SessionRenewer:
+        """
+        Renew sessions of used translators in a background thread ahead of their expiry, see SessionRenewer.
+        :param check_interval: float, default 10.0.
+        :param renew_ratio: float, default 0.8.
+        :param renew_margin_seconds: float, default 60.0.
+        :return: SessionRenewer
+        """
+        self.stop_session_renewer()
+        self.session_renewer = SessionRenewer(self, check_interval, renew_ratio, renew_margin_seconds)
+        self.session_renewer.start()
+        return self.session_renewer
+
+    def stop_session_renewer(self) -> None:
+        if self.session_renewer:
+            self.session_renewer.stop()
+            self.session_renewer = None
+
     def translate_text(self,
                        query_text: str,
                        translator: str = 'alibaba',
@@ -5773,6 +8926,14 @@ class TranslatorsServer:
                 :param if_print_warning: bool, default True.
                 :param lingvanex_model: str, default 'B2C', choose from ("B2C", "B2B").
                 :param myMemory_mode: str, default "web", choose from ("web", "api").
+                :param if_use_cache: bool, default True. Work only after set_translation_cache().
+                :param if_use_memory: bool, default True. Work only after set_translation_memory().
+                :param if_use_single_flight: bool, default False. Identical translations in flight (same translator, languages,
+                        normalized query_text and kwargs, eg: timeout, proxies, http_client) share one request.
+                :param if_split_long_text: bool, default False. Split query_text longer than the input limit of the translator
+                        at paragraph and sentence boundaries (CJK punctuation included), translate the chunks concurrently
+                        and join them with the original separators. Not for is_detail_result.
+                :param split_max_concurrency: int, default 4. Maximum number of chunks in flight.
         :return: str or dict
         """
 
@@ -5782,7 +8943,110 @@ class TranslatorsServer:
         if not self.pre_acceleration_label and if_use_preacceleration:
             _ = self.preaccelerate()
 
-        return self.translators_dict[translator](query_text=query_text, from_language=from_language, to_language=to_language, **kwargs)
+        result, _ = self._translate_text(query_text, translator, from_language, to_language, **kwargs)
+        return result
+
+    def _translate_text(self,
+                        query_text: str,
+                        translator: str,
+                        from_language: str,
+                        to_language: str,
+                        **kwargs: ApiKwargsType,
+                        ) -> Tuple[Union[str, dict], Optional[dict]]:
+        """
+        :return: tuple, (result, match of the translation memory or None)
+        """
+        if_split_long_text = kwargs.pop('if_split_long_text', False)
+        split_max_concurrency = kwargs.pop('split_max_concurrency', 4)
+        if if_split_long_text and isinstance(query_text, str) and not kwargs.get('is_detail_result', False):
+            chunk_size = self.get_chunk_size(translator, **kwargs)
+            if len(query_text.strip()) > chunk_size:
+                return self._translate_long_text(query_text, translator, from_language, to_language, chunk_size, split_max_concurrency, **kwargs), None
+
+        if_use_cache = kwargs.pop('if_use_cache', True)
+        if_use_memory = kwargs.pop('if_use_memory', True)
+        if_use_single_flight = kwargs.pop('if_use_single_flight', False)
+        if not (isinstance(query_text, str) and query_text.strip()):
+            return self.translators_dict[translator](query_text=query_text, from_language=from_language, to_language=to_language, **kwargs), None
+
+        professional_field = kwargs.get('professional_field')
+        is_detail_result = kwargs.get('is_detail_result', False)
+        memory = self.translation_memory if if_use_memory and not is_detail_result else None
+        memory_match = memory.lookup(translator, from_language, to_language, query_text, professional_field) if memory is not None else None
+        if memory_match and memory_match['if_served']:
+            return memory_match['result'], memory_match
+
+        cache_key = TranslationCache.get_cache_key(translator, from_language, to_language, query_text, professional_field, is_detail_result)
+        _translate = lambda: self.translators_dict[translator](query_text=query_text, from_language=from_language, to_language=to_language, **kwargs)
+        if if_use_single_flight:
+            call_key = self.single_flight.get_call_key(cache_key, kwargs, if_use_cache=if_use_cache, if_use_memory=if_use_memory)
+            _translate = functools.partial(self.single_flight.do, call_key, _translate)
+
+        if not (self.translation_cache is not None and if_use_cache):
+            result = _translate()
+        else:
+            result = self.translation_cache.get(cache_key)
+            if result is None:
+                result = _translate()
+                self.translation_cache.set(cache_key, result)
+
+        if memory is not None:
+            memory.add(translator, from_language, to_language, query_text, result, professional_field)
+        return result, memory_match
+
+    @staticmethod
+    def get_async_api(api):
+        """
+        Asynchronous twin of a blocking `*_api` for translators without a native httpx.AsyncClient implementation,
+        it runs in `async_executor` (default: the default executor of the running event loop, whose size is
+        min(32, os.cpu_count() + 4) and caps the concurrency) and shares the session of the blocking one.
+        """
+        @functools.wraps(api)
+        async def _async_api(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            async_executor = kwargs.pop('async_executor', None)
+            return await loop.run_in_executor(async_executor, functools.partial(api, *args, **kwargs))
+        return _async_api
+
+    async def translate_text_async(self,
+                                   query_text: str,
+                                   translator: str = 'alibaba',
+                                   from_language: str = 'auto',
+                                   to_language: str = 'en',
+                                   if_use_preacceleration: bool = False,
+                                   **kwargs: ApiKwargsType,
+                                   ) -> Union[str, dict]:
+        """
+        Asynchronous twin of translate_text(). bing(), deepl() and google() are native on httpx.AsyncClient,
+        others run their blocking `*_api` in the default executor of the running event loop.
+        :param query_text: str, must.
+        :param translator: str, default 'alibaba'.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param if_use_preacceleration: bool, default False.
+        :param **kwargs:
+                :param async_max_connections: Optional[int], default 100. Support bing(), deepl(), google() only.
+                :param async_executor: Optional[concurrent.futures.Executor], default None. Executor of the other translators,
+                        None means the default executor of the event loop, which runs min(32, os.cpu_count() + 4) calls at most.
+                :param ...: the same as translate_text().
+        :return: str or dict
+        """
+
+        if translator not in self.translators_pool:
+            raise TranslatorError
+
+        if not self.pre_acceleration_label and if_use_preacceleration:
+            _ = await asyncio.get_running_loop().run_in_executor(None, self.preaccelerate)
+
+        if_use_single_flight = kwargs.pop('if_use_single_flight', False)
+        _translate = lambda: self.translators_async_dict[translator](query_text=query_text, from_language=from_language, to_language=to_language, **kwargs)
+        if not (if_use_single_flight and isinstance(query_text, str) and query_text.strip()):
+            return await _translate()
+
+        cache_key = TranslationCache.get_cache_key(
+            translator, from_language, to_language, query_text, kwargs.get('professional_field'), kwargs.get('is_detail_result', False)
+        )
+        return await self.single_flight.do_async(self.single_flight.get_call_key(cache_key, kwargs), _translate)
 
     def translate_html(self,
                        html_text: str,
@@ -5799,7 +9063,8 @@ class TranslatorsServer:
         :param translator: str, default 'alibaba'.
         :param from_language: str, default 'auto'.
         :param to_language: str, default 'en'.
-        :param n_jobs: int, default 1. -1 means os.cpu_cnt().
+        :param n_jobs: int, default 1. Number of threads sharing the warm session, it can be far above os.cpu_count() as
+                translation is network-bound. -1 means min(32, os.cpu_count() + 4).
         :param if_use_preacceleration: bool, default False.
         :param **kwargs:
                 :param is_detail_result: bool, default False, must False.
@@ -5824,47 +9089,470 @@ class TranslatorsServer:
         :return: str
         """
 
-        if translator not in self.translators_pool or kwargs.get('is_detail_result', False) or n_jobs > self.cpu_cnt:
+        if translator not in self.translators_pool or kwargs.get('is_detail_result', False):
             raise TranslatorError
 
         if not self.pre_acceleration_label and if_use_preacceleration:
             _ = self.preaccelerate()
 
-        def _translate_text(sentence: str) -> Tuple[str, str]:
-            return sentence, self.translators_dict[translator](query_text=sentence, from_language=from_language, to_language=to_language, **kwargs)
-
         pattern = re.compile('>([\\s\\S]*?)<')  # not perfect
         sentence_list = list(set(pattern.findall(html_text)))
 
-        n_jobs = self.cpu_cnt if n_jobs <= 0 else n_jobs
-        with pathos_multiprocessing.ProcessPool(n_jobs) as pool:
-            result_list = pool.map(_translate_text, sentence_list)
+        n_jobs = min(32, (self.cpu_cnt or 1) + 4) if n_jobs <= 0 else n_jobs
+        result_dict = self._translate_concurrently(sentence_list, translator, from_language, to_language, n_jobs, **kwargs)
+        for ts_text in result_dict.values():
+            if isinstance(ts_text, Exception):
+                raise ts_text
 
-        result_dict = {text: f'>{ts_text}<' for text, ts_text in result_list}
+        result_dict = {text: f'>{ts_text}<' for text, ts_text in result_dict.items()}
         _get_result_func = lambda k: result_dict.get(k.group(1), '')
         return pattern.sub(repl=_get_result_func, string=html_text)
 
-    def _test_translate(self, _ts: str, timeout: Optional[float] = None, if_show_time_stat: bool = False) -> str:
+    def get_chunk_size(self, translator: str, **kwargs: ApiKwargsType) -> int:
+        """
+        Maximum length of query_text accepted by the translator, without truncation by Tse.check_query.
+        """
+        return min(self.get_translator(translator).input_limit, kwargs.get('limit_of_length', 20000) - 11)
+
+    @staticmethod
+    def split_sentences(text: str) -> List[Tuple[str, str]]:
+        """
+        :return: list, [(sentence, the whitespace after it), ...], a sentence ends with a newline or with end punctuation
+                (followed by closing quotes or brackets, and by whitespace for western punctuation).
+        """
+        cjk_end_marks, end_marks, closing_marks = '。！？；…', '.!?;', '"\'”’」』）)]】》'
+        units, start, i, n = [], 0, 0, len(text)
+        while i < n:
+            c = text[i]
+            if c == '\n' or c in cjk_end_marks or c in end_marks:
+                j = i if c == '\n' else i + 1
+                while c != '\n' and j < n and (text[j] in cjk_end_marks or text[j] in end_marks or text[j] in closing_marks):
+                    j += 1
+                if c in end_marks and j < n and not text[j].isspace():  # eg: "3.14", "a.b"
+                    i = j
+                    continue
+
+                while j > start and text[j - 1].isspace():
+                    j -= 1
+                k = j
+                while k < n and text[k].isspace():
+                    k += 1
+                if text[start:j].strip():
+                    units.append((text[start:j], text[j:k]))
+                elif units:
+                    units[-1] = (units[-1][0], units[-1][1] + text[start:k])
+                start = i = k
+                continue
+            i += 1
+
+        if text[start:].strip():
+            units.append((text[start:].rstrip(), text[len(text[start:].rstrip()) + start:]))
+        return units
+
+    @staticmethod
+    def split_text(text: str, chunk_size: int) -> List[Tuple[str, str]]:
+        """
+        Split text into chunks of at most `chunk_size` characters at sentence boundaries, a sentence longer than it
+        is cut at the last comma or whitespace (or hard) before the size.
+        :return: list, [(chunk, the separator after it), ...], so that `''.join(chunk + sep)` is the stripped text.
+        """
+        soft_marks = '，、,：:'
+        units = []
+        for sentence, sep in TranslatorsServer.split_sentences(text.strip()):
+            while len(sentence) > chunk_size:
+                cut = max(sentence.rfind(mark, 0, chunk_size) for mark in soft_marks + ' \t')
+                cut = cut + 1 if cut > 0 else chunk_size
+                head, rest = sentence[:cut].rstrip(), sentence[cut:].lstrip()
+                units.append((head, sentence[len(head):len(sentence) - len(rest)]))
+                sentence = rest
+            if sentence:
+                units.append((sentence, sep))
+
+        chunks, chunk, chunk_sep = [], '', ''
+        for sentence, sep in units:
+            if chunk and len(chunk) + len(chunk_sep) + len(sentence) > chunk_size:
+                chunks.append((chunk, chunk_sep))
+                chunk, chunk_sep = '', ''
+            chunk = f'{chunk}{chunk_sep}{sentence}' if chunk else sentence
+            chunk_sep = sep
+        if chunk:
+            chunks.append((chunk, ''))
+        return chunks
+
+    def _translate_long_text(self,
+                             query_text: str,
+                             translator: str,
+                             from_language: str,
+                             to_language: str,
+                             chunk_size: int,
+                             max_concurrency: int,
+                             **kwargs: ApiKwargsType,
+                             ) -> str:
+        chunks = self.split_text(query_text, chunk_size)
+        result_dict = self._translate_concurrently([chunk for chunk, _ in chunks], translator, from_language, to_language, max_concurrency, **kwargs)
+        for result in result_dict.values():
+            if isinstance(result, Exception):
+                raise result
+        return ''.join(f'{result_dict[chunk]}{sep}' for chunk, sep in chunks)
+
+    def _translate_concurrently(self,
+                                query_text_list: List[str],
+                                translator: str,
+                                from_language: str,
+                                to_language: str,
+                                max_concurrency: int,
+                                memory_match_dict: Optional[dict] = None,
+                                **kwargs: ApiKwargsType,
+                                ) -> Dict[str, Union[str, dict, Exception]]:
+        """
+        Translate unique texts with at most `max_concurrency` threads sharing the warm session of the translator.
+        The first text goes alone, so a cold translator bootstraps once instead of once per thread. The calling thread
+        translates too, beside the threads of get_executor(), so a batch inside a batch does not wait for a free thread.
+        :param memory_match_dict: Optional[dict], default None. If given, it is filled with {query_text: match of the translation memory}.
+        :return: dict, {query_text: result or the exception raised}
+        """
+        def _translate_text(query_text: str) -> Tuple[str, Union[str, dict, Exception]]:
+            try:
+                result, memory_match = self._translate_text(query_text, translator, from_language, to_language, **kwargs)
+                if memory_match is not None and memory_match_dict is not None:
+                    memory_match_dict[query_text] = memory_match
+                return query_text, result
+            except Exception as e:
+                return query_text, e
+
+        query_text_list = list(dict.fromkeys(query_text_list))
+        if not query_text_list:
+            return {}
+
+        text_iter, text_lock = iter(query_text_list[1:]), threading.Lock()
+
+        def _translate_texts() -> List[Tuple[str, Union[str, dict, Exception]]]:
+            results = []
+            while True:
+                with text_lock:
+                    query_text = next(text_iter, None)
+                if query_text is None:
+                    return results
+                results.append(_translate_text(query_text))
+
+        result_dict = dict([_translate_text(query_text_list[0])])
+        n_workers = min(max(1, max_concurrency), len(query_text_list) - 1)
+        executor = self.get_executor(max(1, max_concurrency - 1)) if n_workers > 1 else None
+        futures = [executor.submit(_translate_texts) for _ in range(n_workers - 1)]
+        result_dict.update(_translate_texts())
+        for future in futures:
+            if not future.cancel():
+                result_dict.update(future.result())
+        return result_dict
+
+    def translate_batch(self,
+                        texts: List[str],
+                        translator: str = 'alibaba',
+                        from_language: str = 'auto',
+                        to_language: str = 'en',
+                        max_concurrency: int = 4,
+                        if_use_preacceleration: bool = False,
+                        **kwargs: ApiKwargsType,
+                        ) -> dict:
+        """
+        Translate a batch of texts with bounded concurrency. Identical texts are translated once, and a failed text
+        does not abort the others.
+        :param texts: List[str], must.
+        :param translator: str, default 'alibaba'.
+        :param from_language: str, default 'auto'.
+        :param to_language: str, default 'en'.
+        :param max_concurrency: int, default 4. Maximum number of translations in flight.
+        :param if_use_preacceleration: bool, default False.
+        :param **kwargs:
+                :param if_show_batch_stat: bool, default False.
+                :param if_pack_segments: bool, default False. Pack short texts into requests up to the input limit of the
+                        translator, joined by `pack_separator`. A pack whose result does not split back into segments
+                        that line up (see check_pack_alignment()) is translated again text by text. Not for is_detail_result.
+                :param pack_separator: str, default '\n'. Texts containing it are not packed. A blank separator is lost by
+                        deepl() and google(), which are not packed then, use `if_use_batch_api` instead.
+                :param pack_max_segments: int, default 50.
+                :param if_use_batch_api: bool, default False. Send texts in as few requests as the input limit of the
+                        translator allows, by its native batch api. Support caiyun(), deepl(), google() only. A failed request fails its texts only.
+                :param batch_max_segments: Optional[int], default None. Max number of texts in one request of the batch api.
+                :param ...: the same as translate_text().
+        :return: dict, {'data': [{'query_text', 'result', 'error'}, ...] in input order, 'stat': {...}}. After set_translation_memory(),
+                items also have 'memory_match': None or {'query_text', 'result', 'similarity', 'match_type', 'if_served'}, where
+                a match not served is a fuzzy candidate to review.
+        """
+
+        if translator not in self.translators_pool or not isinstance(texts, (list, tuple)):
+            raise TranslatorError
+
+        if not self.pre_acceleration_label and if_use_preacceleration:
+            _ = self.preaccelerate()
+
+        if_show_batch_stat = kwargs.pop('if_show_batch_stat', False)
+        if_pack_segments = kwargs.pop('if_pack_segments', False)
+        pack_separator = kwargs.pop('pack_separator', '\n')
+        pack_max_segments = kwargs.pop('pack_max_segments', 50)
+        if_use_batch_api = kwargs.pop('if_use_batch_api', False)
+        if if_pack_segments and not if_use_batch_api and translator in self.line_break_lost_translators and not pack_separator.strip():
+            if kwargs.get('if_print_warning', True):
+                warnings.warn(f'{translator}() does not keep line breaks, texts are not packed. Use `if_use_batch_api=True` instead.')
+            if_pack_segments = False
+
+        t1 = time.time()
+        memory_match_dict = {}
+        pack_stat = {'request': 0, 'pack': 0, 'fallback': 0}
+        if if_use_batch_api and translator in self.batch_translators_dict:
+            result_dict = self._translate_by_batch_api(texts, translator, from_language, to_language, max_concurrency, pack_stat, memory_match_dict, **kwargs)
+        elif if_pack_segments and not kwargs.get('is_detail_result', False):
+            result_dict = self._translate_packed(
+                texts, translator, from_language, to_language, max_concurrency, pack_separator, pack_max_segments, pack_stat, memory_match_dict, **kwargs
+            )
+        else:
+            result_dict = self._translate_concurrently(texts, translator, from_language, to_language, max_concurrency, memory_match_dict, **kwargs)
+            pack_stat['request'] = len(result_dict)
+        cost_time = time.time() - t1
+
+        data = []
+        for query_text in texts:
+            result = result_dict[query_text]
+            if isinstance(result, Exception):
+                data.append({'query_text': query_text, 'result': None, 'error': f'{result.__class__.__name__}: {result}'})
+            else:
+                data.append({'query_text': query_text, 'result': result, 'error': None})
+            if self.translation_memory is not None:
+                data[-1]['memory_match'] = memory_match_dict.get(query_text)
+
+        n_failure = sum(1 for item in data if item['error'] is not None)
+        stat = {
+            'translator': translator,
+            'total': len(texts),
+            'unique': len(result_dict),
+            'success': len(texts) - n_failure,
+            'failure': n_failure,
+            'cost_seconds': round(cost_time, 3),
+            'texts_per_second': round(len(texts) / cost_time, 3) if cost_time > 0 else None,
+            'requests_per_second': round(pack_stat['request'] / cost_time, 3) if cost_time > 0 else None,
+        }
+        if if_pack_segments:
+            stat.update({'requests': pack_stat['request'], 'packs': pack_stat['pack'], 'pack_fallbacks': pack_stat['fallback']})
+        if if_show_batch_stat:
+            sys.stderr.write(f'BatchStat(function: {translator}): {stat}\n')
+        return {'data': data, 'stat': stat}
+
+    @staticmethod
+    def pack_segments(texts: List[str], chunk_size: int, separator: str, max_segments: int, max_open_packs: int = 8) -> List[List[str]]:
+        """
+        First-fit bin packing of texts (in their order) into packs whose joined length fits in `chunk_size`, among the
+        latest `max_open_packs` packs only, so it is linear in the number of texts.
+        """
+        packs, pack_lengths, open_indexes = [], [], collections.deque()
+        for text in texts:
+            for i in open_indexes:
+                if pack_lengths[i] + len(separator) + len(text) <= chunk_size:
+                    packs[i].append(text)
+                    pack_lengths[i] += len(separator) + len(text)
+                    if len(packs[i]) >= max_segments:
+                        open_indexes.remove(i)
+                    break
+            else:
+                packs.append([text])
+                pack_lengths.append(len(text))
+                if max_segments > 1:
+                    open_indexes.append(len(packs) - 1)
+                if len(open_indexes) > max_open_packs:
+                    open_indexes.popleft()
+        return packs
+
+    def _lookup_batch(self,
+                      texts: List[str],
+                      translator: str,
+                      from_language: str,
+                      to_language: str,
+                      memory_match_dict: dict,
+                      **kwargs: ApiKwargsType,
+                      ) -> Tuple[dict, List[str], List[str], callable]:
+        """
+        Look up unique texts in the translation memory and in the cache, once.
+        :return: tuple, (results found, texts to translate and save by the returned function, empty or not str texts)
+        """
+        if_use_cache = kwargs.get('if_use_cache', True) and self.translation_cache is not None
+        is_detail_result = kwargs.get('is_detail_result', False)
+        memory = self.translation_memory if kwargs.get('if_use_memory', True) and not is_detail_result else None
+        professional_field = kwargs.get('professional_field')
+        get_cache_key = lambda text: TranslationCache.get_cache_key(translator, from_language, to_language, text, professional_field, is_detail_result)
+
+        def _save(text: str, result: Union[str, dict]) -> None:
+            if if_use_cache:
+                self.translation_cache.set(get_cache_key(text), result)
+            if memory is not None:
+                memory.add(translator, from_language, to_language, text, result, professional_field)
+
+        result_dict, pending_texts, unchecked_texts = {}, [], []
+        for text in dict.fromkeys(texts):
+            if not (isinstance(text, str) and text.strip()):
+                unchecked_texts.append(text)
+                continue
+
+            memory_match = memory.lookup(translator, from_language, to_language, text, professional_field) if memory is not None else None
+            if memory_match is not None:
+                memory_match_dict[text] = memory_match
+                if memory_match['if_served']:
+                    result_dict[text] = memory_match['result']
+                    continue
+
+            cached_result = self.translation_cache.get(get_cache_key(text)) if if_use_cache else None
+            if cached_result is not None:
+                result_dict[text] = cached_result
+                if memory is not None:
+                    memory.add(translator, from_language, to_language, text, cached_result, professional_field)
+                continue
+            pending_texts.append(text)
+        return result_dict, pending_texts, unchecked_texts, _save
+
+    def _translate_by_batch_api(self,
+                                texts: List[str],
+                                translator: str,
+                                from_language: str,
+                                to_language: str,
+                                max_concurrency: int,
+                                pack_stat: dict,
+                                memory_match_dict: dict,
+                                **kwargs: ApiKwargsType,
+                                ) -> Dict[str, Union[str, dict, Exception]]:
+        """
+        :return: dict, {query_text: result or the exception raised}
+        """
+        result_dict, pending_texts, unchecked_texts, _save = self._lookup_batch(texts, translator, from_language, to_language, memory_match_dict, **kwargs)
+        api_kwargs = {k: v for k, v in kwargs.items() if k not in ('if_use_cache', 'if_use_memory', 'if_use_single_flight', 'if_split_long_text', 'split_max_concurrency')}
+        if pending_texts:
+            input_limit = self.get_translator(translator).input_limit
+            batch_texts = [text for text in pending_texts if len(text) <= input_limit]
+            pack_stat['request'] += len(Tse.get_query_batches(batch_texts, input_limit, kwargs.get('batch_max_segments')))
+            try:
+                batch_result_list = self.batch_translators_dict[translator](pending_texts, from_language=from_language, to_language=to_language, **api_kwargs)
+            except Exception as e:
+                batch_result_list = [e] * len(pending_texts)
+
+            for text, result in zip(pending_texts, batch_result_list):
+                result_dict[text] = result
+                if not isinstance(result, Exception):
+                    _save(text, result)
+
+        unchecked_result_dict = self._translate_concurrently(unchecked_texts, translator, from_language, to_language, max_concurrency, **kwargs)
+        pack_stat['request'] += len(unchecked_result_dict)
+        result_dict.update(unchecked_result_dict)
+        return result_dict
+
+    @staticmethod
+    def check_pack_alignment(pack: List[str], segment_results: List[str], max_length_ratio: float = 4.0, length_slack: int = 8) -> bool:
+        """
+        Whether the results split from a pack line up with its segments: as many of them and none empty, each as long as
+        its segment up to `max_length_ratio` (relative to the whole pack, give or take `length_slack` characters), and the
+        numbers of each segment found in its own result, unless the translator rewrote every number.
+        """
+        if len(segment_results) != len(pack) or not all(segment_results):
+            return False
+
+        pack_ratio = sum(map(len, segment_results)) / sum(map(len, pack))
+        for segment, result in zip(pack, segment_results):
+            expected_length = len(segment) * pack_ratio
+            if not expected_length / max_length_ratio - length_slack <= len(result) <= expected_length * max_length_ratio + length_slack:
+                return False
+
+        result_numbers = [set(re.findall(r'\d+', result)) for result in segment_results]
+        if any(result_numbers):
+            return all(set(re.findall(r'\d+', segment)) <= numbers for segment, numbers in zip(pack, result_numbers))
+        return True
+
+    def _translate_packed(self,
+                          texts: List[str],
+                          translator: str,
+                          from_language: str,
+                          to_language: str,
+                          max_concurrency: int,
+                          separator: str,
+                          max_segments: int,
+                          pack_stat: dict,
+                          memory_match_dict: dict,
+                          **kwargs: ApiKwargsType,
+                          ) -> Dict[str, Union[str, Exception]]:
+        """
+        Texts are looked up in the translation memory and in the cache once, by _lookup_batch(), then packs and the texts
+        translated one by one (long, multiline, or out of a pack that failed to split back) skip both and are saved here.
+        :param memory_match_dict: dict, filled with {query_text: match of the translation memory}.
+        :return: dict, {query_text: result or the exception raised}
+        """
+        chunk_size = self.get_chunk_size(translator, **kwargs)
+        result_dict, pending_texts, single_texts, _save = self._lookup_batch(texts, translator, from_language, to_language, memory_match_dict, **kwargs)
+        saved_texts = set(pending_texts)
+        is_packable = lambda text: separator not in text.strip() and len(text.strip()) < chunk_size
+        packable_texts = [text for text in pending_texts if is_packable(text)]
+        single_texts += [text for text in pending_texts if not is_packable(text)]
+
+        packs = self.pack_segments([text.strip() for text in packable_texts], chunk_size, separator, max_segments)
+        pack_texts = [separator.join(pack) for pack in packs if len(pack) > 1]
+        unpacked_segments = {pack[0] for pack in packs if len(pack) == 1}
+        single_texts += [text for text in packable_texts if text.strip() in unpacked_segments]
+        no_lookup_kwargs = {**kwargs, 'if_use_cache': False, 'if_use_memory': False}
+        pack_result_dict = self._translate_concurrently(pack_texts, translator, from_language, to_language, max_concurrency, **no_lookup_kwargs)
+        pack_stat['pack'] += len(pack_texts)
+        pack_stat['request'] += len(pack_result_dict)
+
+        segment_result_dict, fallback_segments = {}, set()
+        for pack in packs:
+            if len(pack) == 1:
+                continue
+            pack_result = pack_result_dict[separator.join(pack)]
+            segment_results = [x.strip() for x in pack_result.split(separator)] if isinstance(pack_result, str) else []
+            if self.check_pack_alignment(pack, segment_results):
+                segment_result_dict.update(zip(pack, segment_results))
+            else:
+                pack_stat['fallback'] += 1
+                fallback_segments.update(pack)
+
+        for text in packable_texts:
+            if text.strip() in segment_result_dict:
+                result_dict[text] = segment_result_dict[text.strip()]
+                _save(text, result_dict[text])
+            elif text.strip() in fallback_segments:
+                single_texts.append(text)
+
+        single_result_dict = self._translate_concurrently(single_texts, translator, from_language, to_language, max_concurrency, **no_lookup_kwargs)
+        pack_stat['request'] += len(single_result_dict)
+        for text, result in single_result_dict.items():
+            if text in saved_texts and not isinstance(result, Exception):
+                _save(text, result)
+        result_dict.update(single_result_dict)
+        return result_dict
+
+    def _test_translate(self, _ts: str, timeout: Optional[float] = None, if_show_time_stat: bool = False, translator: Optional[Tse] = None, **kwargs: ApiKwargsType) -> str:
         from_language = self.not_zh_langs[_ts] if _ts in self.not_zh_langs else 'auto'
         to_language = self.not_en_langs[_ts] if _ts in self.not_en_langs else 'en'
-        result = self.translators_dict[_ts](
+        api = getattr(translator, f'{_ts}_api') if translator else self.translators_dict[_ts]
+        result = api(
             query_text=self.example_query_text,
             translator=_ts,
             from_language=from_language,
             to_language=to_language,
-            if_print_warning=False,
-            timeout=timeout,
-            if_show_time_stat=if_show_time_stat
+            **{
+                **kwargs,
+                'if_print_warning': False,
+                'is_detail_result': False,
+                'timeout': kwargs.get('timeout', timeout),
+                'if_show_time_stat': if_show_time_stat,
+            },
         )
         return result
     
     def get_languages(self, translator: str = 'bing'):
-        language_map = self._translators_dict[translator].language_map
+        language_map = self.get_translator(translator).language_map
+        if language_map:
+            return language_map
+
+        language_map = self.get_translator(translator).load_cached_language_map(if_ignore_ttl=True)
         if language_map:
             return language_map
 
         _ = self._test_translate(_ts=translator)
-        return self._translators_dict[translator].language_map
+        return self.get_translator(translator).language_map
 
     def preaccelerate(self, timeout: Optional[float] = None, if_show_time_stat: bool = True, **kwargs: str) -> dict:
         if self.pre_acceleration_label > 0:
@@ -5912,82 +9600,88 @@ class TranslatorsServer:
 
 tss = TranslatorsServer()
 
-_alibaba = tss._alibaba
 alibaba = tss.alibaba
-_apertium = tss._apertium
 apertium = tss.apertium
-_argos = tss._argos
 argos = tss.argos
-_baidu = tss._baidu
 baidu = tss.baidu
-_bing = tss._bing
 bing = tss.bing
-_caiyun = tss._caiyun
 caiyun = tss.caiyun
-_cloudTranslation = tss._cloudTranslation
 cloudTranslation = tss.cloudTranslation
-_deepl = tss._deepl
 deepl = tss.deepl
-_elia = tss._elia
 elia = tss.elia
-_google = tss._google
 google = tss.google
-_hujiang = tss._hujiang
 hujiang = tss.hujiang
-_iciba = tss._iciba
 iciba = tss.iciba
-_iflytek = tss._iflytek
 iflytek = tss.iflytek
-_iflyrec = tss._iflyrec
 iflyrec = tss.iflyrec
-_itranslate = tss._itranslate
 itranslate = tss.itranslate
-_judic = tss._judic
 judic = tss.judic
-_languageWire = tss._languageWire
 languageWire = tss.languageWire
-_lingvanex = tss._lingvanex
 lingvanex = tss.lingvanex
-_niutrans = tss._niutrans
 niutrans = tss.niutrans
-_mglip = tss._mglip
 mglip = tss.mglip
-_mirai = tss._mirai
 mirai = tss.mirai
-_modernMt = tss._modernMt
 modernMt = tss.modernMt
-_myMemory = tss._myMemory
 myMemory = tss.myMemory
-_papago = tss._papago
 papago = tss.papago
-_qqFanyi = tss._qqFanyi
 qqFanyi = tss.qqFanyi
-_qqTranSmart = tss._qqTranSmart
 qqTranSmart = tss.qqTranSmart
-_reverso = tss._reverso
 reverso = tss.reverso
-_sogou = tss._sogou
 sogou = tss.sogou
-_sysTran = tss._sysTran
 sysTran = tss.sysTran
-_tilde = tss._tilde
 tilde = tss.tilde
-_translateCom = tss._translateCom
 translateCom = tss.translateCom
-_translateMe = tss._translateMe
 translateMe = tss.translateMe
-_utibet = tss._utibet
 utibet = tss.utibet
-_volcEngine = tss._volcEngine
 volcEngine = tss.volcEngine
-_yandex = tss._yandex
 yandex = tss.yandex
-_yeekit = tss._yeekit
 yeekit = tss.yeekit
-_youdao = tss._youdao
 youdao = tss.youdao
 
+alibaba_async = tss.alibaba_async
+apertium_async = tss.apertium_async
+argos_async = tss.argos_async
+baidu_async = tss.baidu_async
+bing_async = tss.bing_async
+caiyun_async = tss.caiyun_async
+cloudTranslation_async = tss.cloudTranslation_async
+deepl_async = tss.deepl_async
+elia_async = tss.elia_async
+google_async = tss.google_async
+hujiang_async = tss.hujiang_async
+iciba_async = tss.iciba_async
+iflytek_async = tss.iflytek_async
+iflyrec_async = tss.iflyrec_async
+itranslate_async = tss.itranslate_async
+judic_async = tss.judic_async
+languageWire_async = tss.languageWire_async
+lingvanex_async = tss.lingvanex_async
+niutrans_async = tss.niutrans_async
+mglip_async = tss.mglip_async
+mirai_async = tss.mirai_async
+modernMt_async = tss.modernMt_async
+myMemory_async = tss.myMemory_async
+papago_async = tss.papago_async
+qqFanyi_async = tss.qqFanyi_async
+qqTranSmart_async = tss.qqTranSmart_async
+reverso_async = tss.reverso_async
+sogou_async = tss.sogou_async
+sysTran_async = tss.sysTran_async
+tilde_async = tss.tilde_async
+translateCom_async = tss.translateCom_async
+translateMe_async = tss.translateMe_async
+utibet_async = tss.utibet_async
+volcEngine_async = tss.volcEngine_async
+yandex_async = tss.yandex_async
+yeekit_async = tss.yeekit_async
+youdao_async = tss.youdao_async
+
 translate_text = tss.translate_text
+translate_text_async = tss.translate_text_async
+translate_batch = tss.translate_batch
+set_translation_cache = tss.set_translation_cache
+set_translation_memory = tss.set_translation_memory
+set_circuit_breaker = tss.set_circuit_breaker
 translate_html = tss.translate_html
 translators_pool = tss.translators_pool
 get_languages = tss.get_languages
@@ -5997,3 +9691,10 @@ preaccelerate = tss.preaccelerate
 speedtest = tss.speedtest
 preaccelerate_and_speedtest = tss.preaccelerate_and_speedtest
 # sys.stderr.write(f'Support translators {translators_pool} only.\n')
+
+
+def __getattr__(name: str):
+    # `_alibaba`, `_bing`, etc are created on first access of their attributes only.
+    if name[:1] == '_' and name[1:] in tss.translators_pool:
+        return globals().setdefault(name, LazyTranslator(tss._translators_dict, name[1:]))
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")